@@ -0,0 +1,154 @@
+import random
+import secrets
+
+from src.card import standard_pokemon_cards
+from src.player_utils import Player, Game
+from card_registry import REGISTRY
+from events import events_for
+
+PLAYER_NAMES = ("AI-Ash", "AI-Misty")
+DECK_SIZE = 60
+PRIZE_COUNT = 6
+HAND_SIZE = 7
+MAX_TURNS = 100  # Turn limit to prevent infinite loops
+
+
+_samplers = {}
+
+
+def deck_sampler(card_pool):
+    """Shared DeckSampler for card_pool
+
+    NumPy is only imported here, on the first deck sampled, not when battle is imported.
+    It is required rather than optional: a seed has to give the same decks on every
+    machine for replays to hold, so there is no pure-Python fallback.
+    """
+    from deck_sampler import DeckSampler
+    sampler = _samplers.get(id(card_pool))
+    if sampler is None or sampler.card_pool is not card_pool:
+        sampler = _samplers[id(card_pool)] = DeckSampler(card_pool, DECK_SIZE)
+    return sampler
+
+
+def sample_decks(card_pool, seeds):
+    """Both decks for every seed as lists of registry card ids, sampled in one NumPy batch
+
+    Only ids are kept for the batch; setup_match turns a match's ids into cards.
+    """
+    return deck_sampler(card_pool).sample_ids(seeds, REGISTRY.pool_ids(card_pool)).tolist()
+
+
+def new_seed():
+    """Fresh match seed, independent of the (seeded) module-level random state"""
+    return secrets.randbits(32)
+
+
+def setup_match(card_pool=standard_pokemon_cards, seed=None, decks=None):
+    """Create both players with fresh decks and prize cards, and the Game between them
+
+    decks are the two card id lists for this seed, as produced by sample_decks; callers
+    running many matches pass them in so deck sampling happens in one batch. The
+    module-level random generator is reseeded with seed so deck sampling, prize
+    selection and any randomness inside Game replay exactly for the same seed. As
+    that generator is shared, only one match may be playing per process at a time.
+    """
+    if seed is None:
+        seed = new_seed()
+    if decks is None:
+        decks = sample_decks(card_pool, [seed])[0]
+    random.seed(seed)
+    player1 = Player(PLAYER_NAMES[0], REGISTRY.cards_for(decks[0]))
+    player2 = Player(PLAYER_NAMES[1], REGISTRY.cards_for(decks[1]))
+
+    # Setup prize cards (6 for each player)
+    for player in (player1, player2):
+        if player.deck:
+            player.prize_cards = player.deck[:PRIZE_COUNT]
+            player.deck = player.deck[PRIZE_COUNT:]
+
+    game = Game(player1, player2, ai_enabled=True)
+    events_for(game)
+    return player1, player2, game
+
+
+def engine_supports_search(game=Game):
+    """True if the engine exposes turn decisions for a search agent (see mcts) to choose from
+
+    A searchable Game has turn_options(player), returning the hashable, picklable
+    decisions open to player this turn, and play_turn(player, option) to play one of
+    them; play_turn(player) without an option keeps the built-in AI.
+    """
+    return callable(getattr(game, "turn_options", None))
+
+
+def draw_opening_hands(player1, player2):
+    player1.draw_cards(HAND_SIZE)
+    player2.draw_cards(HAND_SIZE)
+
+
+def play_turn(game, agents=None):
+    """Play one turn for whoever is up, returning (current_player, result)
+
+    agents maps player names to search agents (see mcts.AGENTS); a player without
+    one is left to Game's built-in AI. An agent only picks the turn option, the turn
+    itself still draws on the match's random stream. New action_log entries are
+    published to the game's EventStream.
+    """
+    current_player = game.players[game.turn % 2]
+    agent = agents.get(current_player.name) if agents else None
+    if agent is not None:
+        result = game.play_turn(current_player, agent.choose_option(game))
+    else:
+        result = game.play_turn(current_player)
+    events_for(game).poll()
+    return current_player, result
+
+
+def determine_winner(game, player1, player2):
+    if player1.active_pokemon is None and not player1.bench:
+        return player2.name
+    elif player2.active_pokemon is None and not player2.bench:
+        return player1.name
+    else:
+        return game.players[game.turn % 2].name
+
+
+def run_match(card_pool=standard_pokemon_cards, max_turns=MAX_TURNS, seed=None, recorder=None, decks=None,
+              agents=None, profiler=None):
+    """Play one match to completion without any rendering, returning (winner, turns)
+
+    If a MatchRecorder is given the match is streamed to it as it plays. A TurnProfiler
+    profiles the turns in its range and writes them out when the match ends.
+    """
+    if seed is None:
+        seed = new_seed()
+    player1, player2, game = setup_match(card_pool, seed, decks)
+    if recorder is not None:
+        recorder.start_match(seed, player1, player2)
+        record_cursor = events_for(game).cursor()
+    if profiler is not None:
+        profiler.start_match(seed)
+    for agent in (agents or {}).values():
+        agent.new_match()
+        agent.warm_up()
+    draw_opening_hands(player1, player2)
+
+    turn_count = 0
+    while not game.is_over() and turn_count < max_turns:
+        if profiler is not None and profiler.wants(turn_count + 1):
+            current_player, result = profiler.profile(turn_count + 1, play_turn, game, agents)
+        else:
+            current_player, result = play_turn(game, agents)
+        turn_count += 1
+        if recorder is not None:
+            actions = [event.action for event in record_cursor.read()]
+            recorder.record_turn(game.turn, current_player, actions, player1, player2)
+        if result:
+            break
+
+    winner = determine_winner(game, player1, player2)
+    if recorder is not None:
+        recorder.end_match(winner, turn_count)
+    if profiler is not None:
+        profiler.end_match()
+    return winner, turn_count
@@ -0,0 +1,311 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections import Counter
+
+from src.card import standard_pokemon_cards
+from battle import HAND_SIZE, MAX_TURNS, deck_sampler, draw_opening_hands, play_turn, sample_decks, setup_match
+
+BENCHMARK_FOLDER = "benchmarks/"
+BASELINE_FILE = os.path.join(BENCHMARK_FOLDER, "baseline.json")
+RESULTS_FILE = os.path.join(BENCHMARK_FOLDER, "latest.json")
+# A benchmark regresses when its median time per op grows by more than this fraction
+REGRESSION_THRESHOLD = 0.10
+BENCHMARK_SEED = 1234
+BENCHMARK_MATCHES = 20
+BENCHMARK_REPEAT = 5
+
+
+class CountingCanvas:
+    """Stand-in for tk.Canvas that counts item operations instead of drawing them"""
+
+    def __init__(self):
+        self.ops = Counter()
+        self.item_count = 0
+
+    def _create(self, *coords, **options):
+        self.ops["create"] += 1
+        self.item_count += 1
+        return self.item_count
+
+    create_image = create_text = create_rectangle = _create
+
+    def coords(self, item_id, *coords):
+        self.ops["coords"] += 1
+
+    def itemconfigure(self, item_id, **options):
+        self.ops["itemconfigure"] += 1
+
+    def delete(self, *items):
+        self.ops["delete"] += 1
+        if "all" in items:
+            self.item_count = 0
+
+    def find_all(self):
+        return tuple(range(1, self.item_count + 1))
+
+
+class StubImageCache:
+    """Stand-in for CardImageCache that hands back card names instead of PhotoImages"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._seen = set()
+
+    def get(self, name, size):
+        key = (name, size)
+        if key in self._seen:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._seen.add(key)
+        return name
+
+
+def render_target(backend):
+    """A BattleGUI with just the board drawing state, on a stub canvas or a hidden Tk root"""
+    from gui import BattleGUI
+    gui = BattleGUI.__new__(BattleGUI)
+    gui.canvas_items = {}
+    gui.drawn_zones = {}
+    gui.player1 = gui.player2 = None
+    gui.errors = []
+    gui.log_error = gui.errors.append
+    gui.log_message = gui.errors.append
+    if backend == "tk":
+        # Needs a display, e.g. run under xvfb-run
+        import tkinter as tk
+        from gui import CardImageCache
+        from sprite_atlas import load_atlases
+        # One root per call, destroyed again by close_render_target
+        root = tk.Tk()
+        root.withdraw()
+        gui.battle_canvas = tk.Canvas(root, width=1200, height=700)
+        gui.card_images = CardImageCache(atlases=load_atlases())
+    else:
+        gui.battle_canvas = CountingCanvas()
+        gui.card_images = StubImageCache()
+    return gui
+
+
+def close_render_target(gui):
+    if hasattr(gui.battle_canvas, "winfo_toplevel"):
+        gui.battle_canvas.winfo_toplevel().destroy()
+
+
+def seeded_matches(seeds, card_pool=standard_pokemon_cards):
+    """Yield (player1, player2, game) after every turn of each seeded match"""
+    for seed in seeds:
+        player1, player2, game = setup_match(card_pool, seed)
+        draw_opening_hands(player1, player2)
+        turn_count = 0
+        while not game.is_over() and turn_count < MAX_TURNS:
+            _, result = play_turn(game)
+            turn_count += 1
+            yield player1, player2, game
+            if result:
+                break
+
+
+def bench_sample_decks(seeds, card_pool=standard_pokemon_cards):
+    """Both decks for every seed in one batch, as the headless runner and tournaments deal them"""
+    deck_sampler(card_pool)
+    start = time.perf_counter()
+    sample_decks(card_pool, seeds)
+    return time.perf_counter() - start, len(seeds), {}
+
+
+def bench_sample_decks_single(seeds, card_pool=standard_pokemon_cards):
+    """Both decks for one seed at a time, as setup_match deals them for a GUI match"""
+    deck_sampler(card_pool)
+    start = time.perf_counter()
+    for seed in seeds:
+        sample_decks(card_pool, [seed])
+    return time.perf_counter() - start, len(seeds), {}
+
+
+def bench_draw_cards(seeds, card_pool=standard_pokemon_cards):
+    elapsed = 0.0
+    for seed in seeds:
+        player1, player2, _ = setup_match(card_pool, seed)
+        start = time.perf_counter()
+        player1.draw_cards(HAND_SIZE)
+        player2.draw_cards(HAND_SIZE)
+        elapsed += time.perf_counter() - start
+    return elapsed, len(seeds) * 2, {}
+
+
+def bench_play_turn(seeds, card_pool=standard_pokemon_cards):
+    elapsed = 0.0
+    turns = 0
+    for seed in seeds:
+        player1, player2, game = setup_match(card_pool, seed)
+        draw_opening_hands(player1, player2)
+        turn_count = 0
+        while not game.is_over() and turn_count < MAX_TURNS:
+            start = time.perf_counter()
+            _, result = play_turn(game)
+            elapsed += time.perf_counter() - start
+            turn_count += 1
+            if result:
+                break
+        turns += turn_count
+    return elapsed, turns, {}
+
+
+def bench_render(seeds, backend="stub", full=False):
+    """Time drawing a board snapshot after every turn, as the GUI's main loop does
+
+    full starts every cycle from an empty canvas, with no retained items or zone
+    fingerprints, so everything is created again rather than updated.
+    """
+    gui = render_target(backend)
+    elapsed = 0.0
+    cycles = 0
+    try:
+        for player1, player2, _ in seeded_matches(seeds):
+            board = gui.board_snapshot(player1, player2)
+            if full:
+                gui.battle_canvas.delete("all")
+                gui.canvas_items = {}
+                gui.drawn_zones = {}
+            start = time.perf_counter()
+            gui.show_board(board)
+            elapsed += time.perf_counter() - start
+            cycles += 1
+        extra = {"errors": len(gui.errors), "canvas_items": len(gui.battle_canvas.find_all())}
+        if backend == "stub":
+            extra["canvas_ops_per_cycle"] = {op: count / max(1, cycles) for op, count in gui.battle_canvas.ops.items()}
+    finally:
+        close_render_target(gui)
+    return elapsed, cycles, extra
+
+
+def run_benchmarks(seeds, repeat=BENCHMARK_REPEAT, backend="stub", names=None):
+    """Run every benchmark repeat times, returning {name: result} with times in microseconds per op"""
+    benchmarks = {
+        "sample_decks": bench_sample_decks,
+        "sample_decks_single": bench_sample_decks_single,
+        "draw_cards": bench_draw_cards,
+        "play_turn": bench_play_turn,
+        "update_battle_display": lambda seeds: bench_render(seeds, backend),
+        "update_battle_display_full": lambda seeds: bench_render(seeds, backend, full=True),
+    }
+    results = {}
+    for name, bench in benchmarks.items():
+        if names and name not in names:
+            continue
+        per_op = []
+        for _ in range(repeat):
+            elapsed, ops, extra = bench(seeds)
+            per_op.append(elapsed / max(1, ops) * 1e6)
+        results[name] = {
+            "unit": "us/op",
+            "ops": ops,
+            "median": statistics.median(per_op),
+            "min": min(per_op),
+            "max": max(per_op),
+            **extra,
+        }
+        print(f"{name:<28} {results[name]['median']:10.2f} us/op (min {results[name]['min']:.2f}, {ops} ops)")
+    return results
+
+
+def baseline_mismatches(baseline, seeds, backend):
+    """Settings baseline was run with that differ from this run, making its timings incomparable"""
+    mismatches = []
+    baseline_seeds = baseline.get("seeds") or [None, None]
+    if baseline_seeds[0] != seeds[0]:
+        mismatches.append(f"seed {baseline_seeds[0]} vs {seeds[0]}")
+    if baseline_seeds[1] != len(seeds):
+        mismatches.append(f"{baseline_seeds[1]} matches vs {len(seeds)}")
+    if baseline.get("render_backend") != backend:
+        mismatches.append(f"render backend {baseline.get('render_backend')} vs {backend}")
+    return mismatches
+
+
+def compare(results, baseline, seeds, backend, threshold=REGRESSION_THRESHOLD):
+    """Print the change against baseline per benchmark, returning the names that regressed
+
+    Raises ValueError if baseline was run with other seeds, match count or render backend.
+    """
+    mismatches = baseline_mismatches(baseline, seeds, backend)
+    if mismatches:
+        raise ValueError("baseline was run with " + ", ".join(mismatches))
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous or not previous.get("median"):
+            print(f"{name:<28} no baseline")
+            continue
+        change = result["median"] / previous["median"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<28} {change:+8.1%} vs baseline{flag}")
+    return regressions
+
+
+def write_results(path, results, seeds, backend):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seeds": [seeds[0], len(seeds)],
+        "render_backend": backend,
+        "benchmarks": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the engine and board rendering hot paths")
+    parser.add_argument("-n", "--matches", type=int, default=BENCHMARK_MATCHES, help="seeded matches per benchmark")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED, help="base seed, match i uses seed + i")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT, help="runs per benchmark, the median is kept")
+    parser.add_argument("--render-backend", choices=("stub", "tk"), default="stub",
+                        help="stub counts canvas operations, tk draws on a hidden Tk root (needs a display)")
+    parser.add_argument("--only", nargs="+", metavar="NAME", default=None, help="run only these benchmarks")
+    parser.add_argument("--output", default=RESULTS_FILE, help="where to write this run's results")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="results to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="fractional slowdown of the median that counts as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="also store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    seeds = [(args.seed + match) % 2 ** 32 for match in range(args.matches)]
+    results = run_benchmarks(seeds, args.repeat, args.render_backend, args.only)
+    write_results(args.output, results, seeds, args.render_backend)
+
+    regressions = []
+    comparable = True
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"No baseline at {args.baseline}")
+    else:
+        try:
+            regressions = compare(results, baseline, seeds, args.render_backend, args.threshold)
+        except ValueError as e:
+            print(f"Not comparing against {args.baseline}: {e}")
+            comparable = False
+    if args.save_baseline:
+        write_results(args.baseline, results, seeds, args.render_backend)
+        print(f"Saved baseline to {args.baseline}")
+    if regressions:
+        return 1
+    # A baseline from other settings proves nothing, unless this run replaces it
+    return 0 if comparable or args.save_baseline else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
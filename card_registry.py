@@ -0,0 +1,126 @@
+from types import MappingProxyType
+
+# Keys the engine changes on a card in play, so they don't identify which card it is
+PER_COPY_KEYS = frozenset(('hp',))
+_MISSING = object()
+
+
+def freeze(value):
+    """Hashable form of a card or one of its fields, for keying definitions on their full contents"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class CardDefinition:
+    """One card as it appears in a card pool, immutable once registered
+
+    data is a read-only view of the card's fields; new_card() hands out the plain
+    dict a zone holds, since the engine writes per-copy state such as HP into it.
+    """
+
+    __slots__ = ("id", "name", "data", "key")
+
+    def __init__(self, card_id, card, key):
+        set_field = object.__setattr__
+        set_field(self, "id", card_id)
+        set_field(self, "name", card['name'])
+        set_field(self, "data", MappingProxyType(dict(card)))
+        set_field(self, "key", key)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def new_card(self):
+        """Fresh copy of the card, ready to be put in a zone"""
+        return dict(self.data)
+
+    def matches(self, card):
+        """True if a card in play was dealt from this definition, going by everything but per-copy state"""
+        for key, value in self.data.items():
+            if key in PER_COPY_KEYS:
+                continue
+            if card.get(key, _MISSING) != value:
+                return False
+        # Without a max_hp of its own a copy's starting HP is all that tells same-named cards apart
+        return card.get('max_hp', card.get('hp')) == self.data.get('max_hp', self.data.get('hp'))
+
+
+class CardRegistry:
+    """Interns card definitions by their full contents and hands out integer ids
+
+    Two pool entries that share a name but differ in any field are separate
+    definitions. Decks travel as lists of ids until a match is set up, and every
+    copy of a card in play is a plain dict made by new_card, so copies never share
+    HP or other per-copy state.
+    """
+
+    def __init__(self):
+        self.cards = []
+        self._ids = {}
+        self._by_name = {}
+
+    def intern(self, card):
+        """Id for a card definition, registering it on first sight"""
+        key = freeze(card)
+        card_id = self._ids.get(key)
+        if card_id is None:
+            card_id = self._ids[key] = len(self.cards)
+            self.cards.append(CardDefinition(card_id, card, key))
+            self._by_name.setdefault(card['name'], []).append(card_id)
+        return card_id
+
+    def id_of(self, card):
+        """Id of the definition a card in play was dealt from
+
+        Its HP and any keys the engine added don't count; a card never seen before is
+        registered as it is. When no same-named definition matches (say, a damaged
+        copy with no max_hp) the first one registered under the name is used.
+        """
+        card_ids = self._by_name.get(card['name'])
+        if card_ids is None:
+            return self.intern(card)
+        if len(card_ids) == 1:
+            return card_ids[0]
+        cards = self.cards
+        for card_id in card_ids:
+            if cards[card_id].matches(card):
+                return card_id
+        return card_ids[0]
+
+    def pool_ids(self, card_pool):
+        return [self.intern(card) for card in card_pool]
+
+    def card(self, card_id):
+        """Fresh copy of a card, ready to be put in a zone"""
+        return self.cards[card_id].new_card()
+
+    def cards_for(self, card_ids):
+        """Fresh copies for a list of card ids, e.g. one deck from sample_decks"""
+        cards = self.cards
+        return [cards[card_id].new_card() for card_id in card_ids]
+
+    def definitions(self):
+        """Card dicts in id order, for rebuilding the same ids in another process"""
+        return [card.new_card() for card in self.cards]
+
+    def sync(self, definitions):
+        """Intern definitions from another process's registry so card ids line up"""
+        for card_id, card in enumerate(definitions):
+            if card_id < len(self.cards):
+                if self.cards[card_id].key != freeze(card):
+                    raise ValueError(f"Card id {card_id} is {self.cards[card_id].name!r} here, not {card['name']!r}")
+            else:
+                self.intern(card)
+
+
+# Process-wide registry every deck is built from
+REGISTRY = CardRegistry()
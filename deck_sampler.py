@@ -0,0 +1,38 @@
+import numpy as np
+
+
+class DeckSampler:
+    """Samples many decks at once as NumPy index arrays into a card pool
+
+    With a pool at least as large as the deck, cards are drawn without replacement
+    in random order; with a smaller pool every card appears deck_size // len(pool)
+    times in pool order, followed by a random sample of the remainder. Each match seed gets its own generator, so the decks for a seed are
+    the same whether it is sampled alone or as part of a large batch.
+    """
+
+    def __init__(self, card_pool, deck_size, decks_per_match=2):
+        if not card_pool:
+            raise ValueError("Card pool is empty. Cannot create a deck.")
+        self.card_pool = card_pool
+        self.deck_size = deck_size
+        self.decks_per_match = decks_per_match
+        pool_size = len(card_pool)
+        if pool_size >= deck_size:
+            self.copies = np.empty(0, dtype=np.intp)
+            self.sampled = deck_size
+        else:
+            self.copies = np.tile(np.arange(pool_size, dtype=np.intp), deck_size // pool_size)
+            self.sampled = deck_size % pool_size
+
+    def sample_indices(self, seeds):
+        """Index array of shape (len(seeds), decks_per_match, deck_size)"""
+        pool_size = len(self.card_pool)
+        keys = np.stack([np.random.default_rng(seed).random((self.decks_per_match, pool_size)) for seed in seeds])
+        # Random permutation of the pool per deck, keeping only as many cards as needed
+        sampled = np.argsort(keys, axis=-1)[..., :self.sampled]
+        copies = np.broadcast_to(self.copies, sampled.shape[:-1] + self.copies.shape)
+        return np.concatenate([copies, sampled], axis=-1)
+
+    def sample_ids(self, seeds, card_ids):
+        """Like sample_indices, with each pool index mapped to card_ids[index]"""
+        return np.asarray(card_ids, dtype=np.intp)[self.sample_indices(seeds)]
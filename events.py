@@ -0,0 +1,102 @@
+from collections import namedtuple
+
+# One entry from a player's action_log, numbered in the order it was seen
+ActionEvent = namedtuple("ActionEvent", ["seq", "turn", "player", "action"])
+
+
+class EventCursor:
+    """A consumer's read position in an EventStream"""
+
+    __slots__ = ("stream", "position")
+
+    def __init__(self, stream, position=0):
+        self.stream = stream
+        self.position = position
+
+    def read(self):
+        """Events added since the last read"""
+        events = self.stream.events
+        new_events = events[self.position:]
+        self.position = len(events)
+        return new_events
+
+
+class ActionLog(list):
+    """A Player's action_log that counts every change other than appending
+
+    Lets EventStream tell an in-place reset (action_log.clear(), del log[:]) from a
+    log that simply grew, even when the next turn adds as many entries as were cleared.
+    """
+
+    __slots__ = ("rewrites",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.rewrites = 0
+
+    def _rewritten(method):
+        def wrapper(self, *args):
+            self.rewrites += 1
+            return method(self, *args)
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    clear = _rewritten(list.clear)
+    pop = _rewritten(list.pop)
+    remove = _rewritten(list.remove)
+    insert = _rewritten(list.insert)
+    sort = _rewritten(list.sort)
+    reverse = _rewritten(list.reverse)
+    __delitem__ = _rewritten(list.__delitem__)
+    __setitem__ = _rewritten(list.__setitem__)
+    __imul__ = _rewritten(list.__imul__)
+    del _rewritten
+
+
+class EventStream:
+    """Append-only stream of structured action events for one Game
+
+    poll() picks up only the action_log entries added since the previous poll, so
+    the work per turn stays proportional to what that turn did whether the log is
+    cleared every turn or keeps growing for the whole match. Each player's log is
+    swapped for an ActionLog so in-place resets are seen; a log replaced by a new
+    list is detected by identity and wrapped again. Each consumer (GUI log, recorder,
+    stats) reads through its own cursor, so they all see every event once.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.events = []
+        self._seen = {}  # player name -> (action_log list, rewrites, entries consumed)
+        for player in game.players:
+            self.track(player)
+
+    @staticmethod
+    def track(player):
+        log = player.action_log
+        if not isinstance(log, ActionLog):
+            log = player.action_log = ActionLog(log)
+        return log
+
+    def poll(self):
+        turn = self.game.turn
+        for player in self.game.players:
+            log = self.track(player)
+            seen_log, rewrites, consumed = self._seen.get(player.name, (None, 0, 0))
+            # A new list or any change but appending means the log was reset, read it from the top
+            if seen_log is not log or log.rewrites != rewrites or consumed > len(log):
+                consumed = 0
+            for action in log[consumed:]:
+                self.events.append(ActionEvent(len(self.events), turn, player.name, action))
+            self._seen[player.name] = (log, log.rewrites, len(log))
+
+    def cursor(self, from_start=False):
+        return EventCursor(self, 0 if from_start else len(self.events))
+
+
+def events_for(game):
+    """The EventStream attached to game, creating it on first use"""
+    stream = getattr(game, "events", None)
+    if stream is None:
+        stream = game.events = EventStream(game)
+    return stream
@@ -0,0 +1,150 @@
+from array import array
+
+from card_registry import REGISTRY
+
+ZONES = ("deck", "hand", "bench", "active", "prize_cards", "discard_pile")
+_MISSING = object()
+
+
+class Zone:
+    """Cards in one zone as parallel card id / HP arrays, plus sparse per-copy extras
+
+    has_hp marks the copies whose HP sits in the hp column; HP can go negative, so no
+    value of the column itself is reserved for "no HP". HP that is not a plain int
+    (a float, None) is kept in extra along with any other key the engine set on a copy.
+    """
+
+    __slots__ = ("ids", "hp", "has_hp", "extra")
+
+    def __init__(self, ids=None, hp=None, has_hp=None, extra=None):
+        self.ids = ids if ids is not None else array("i")
+        self.hp = hp if hp is not None else array("q")
+        self.has_hp = has_hp if has_hp is not None else array("b")
+        self.extra = extra  # {index: {key: value}} for the rare copy with engine-set keys
+
+    @classmethod
+    def from_cards(cls, cards):
+        zone = cls()
+        definitions = REGISTRY.cards
+        for index, card in enumerate(cards):
+            card_id = REGISTRY.id_of(card)
+            definition = definitions[card_id]
+            extra = {key: value for key, value in card.items()
+                     if key != 'hp' and definition.get(key, _MISSING) != value}
+            hp = card.get('hp', _MISSING)
+            zone.ids.append(card_id)
+            if type(hp) is int:
+                zone.hp.append(hp)
+                zone.has_hp.append(1)
+            else:
+                zone.hp.append(0)
+                zone.has_hp.append(0)
+                if hp is not _MISSING:
+                    extra['hp'] = hp
+            if extra:
+                if zone.extra is None:
+                    zone.extra = {}
+                zone.extra[index] = extra
+        return zone
+
+    def to_cards(self):
+        definitions = REGISTRY.cards
+        extras = self.extra or {}
+        cards = []
+        for index, (card_id, hp, has_hp) in enumerate(zip(self.ids, self.hp, self.has_hp)):
+            card = definitions[card_id].new_card()
+            if has_hp:
+                card['hp'] = hp
+            else:
+                card.pop('hp', None)
+            if index in extras:
+                card.update(extras[index])
+            cards.append(card)
+        return cards
+
+    def clone(self):
+        extra = {index: dict(values) for index, values in self.extra.items()} if self.extra else None
+        return Zone(self.ids[:], self.hp[:], self.has_hp[:], extra)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class PlayerState:
+    __slots__ = ("name",) + ZONES
+
+    @classmethod
+    def from_player(cls, player):
+        state = cls()
+        state.name = player.name
+        state.deck = Zone.from_cards(player.deck)
+        state.hand = Zone.from_cards(player.hand)
+        state.bench = Zone.from_cards(player.bench)
+        state.active = Zone.from_cards([player.active_pokemon] if player.active_pokemon else [])
+        state.prize_cards = Zone.from_cards(player.prize_cards)
+        state.discard_pile = Zone.from_cards(player.discard_pile)
+        return state
+
+    def apply_to(self, player):
+        player.name = self.name
+        player.action_log = []
+        player.deck = self.deck.to_cards()
+        player.hand = self.hand.to_cards()
+        player.bench = self.bench.to_cards()
+        active = self.active.to_cards()
+        player.active_pokemon = active[0] if active else None
+        player.prize_cards = self.prize_cards.to_cards()
+        player.discard_pile = self.discard_pile.to_cards()
+
+    def clone(self):
+        state = PlayerState()
+        state.name = self.name
+        state.deck = self.deck.clone()
+        state.hand = self.hand.clone()
+        state.bench = self.bench.clone()
+        state.active = self.active.clone()
+        state.prize_cards = self.prize_cards.clone()
+        state.discard_pile = self.discard_pile.clone()
+        return state
+
+
+class GameState:
+    """Compact, quickly clonable snapshot of a Game for lookahead search
+
+    Only the zones BattleGUI and the recorder know about are captured (deck, hand,
+    bench, active, prizes, discard) along with the turn counter. apply_to also empties
+    each player's action_log, but anything else a Player or Game keeps internally
+    (such as a game-over flag) is left as-is, so searches restore into a fresh
+    Game from to_game rather than reusing one.
+    """
+
+    __slots__ = ("turn", "players")
+
+    def __init__(self, turn=0, players=()):
+        self.turn = turn
+        self.players = players
+
+    @classmethod
+    def from_game(cls, game):
+        return cls(game.turn, tuple(PlayerState.from_player(player) for player in game.players))
+
+    def clone(self):
+        return GameState(self.turn, tuple(player.clone() for player in self.players))
+
+    def apply_to(self, game):
+        """Restore this state into an existing Game and its Player objects"""
+        game.turn = self.turn
+        for player, state in zip(game.players, self.players):
+            state.apply_to(player)
+        return game
+
+    def to_game(self, ai_enabled=True):
+        """Build a fresh Player/Game pair holding this state"""
+        from src.player_utils import Player, Game
+        player1, player2 = (Player(state.name, []) for state in self.players)
+        game = Game(player1, player2, ai_enabled=ai_enabled)
+        return self.apply_to(game)
+
+    @property
+    def current_player_index(self):
+        return self.turn % 2
@@ -1,25 +1,114 @@
+import time
+from startup import StartupTimer
+
+# Started before anything heavy is imported so the report covers import time
+STARTUP = StartupTimer()
+
 import tkinter as tk
-from tkinter import scrolledtext, Canvas, PhotoImage, messagebox
-import logging
-import random
+from tkinter import Canvas
 import threading
+import queue
+import os
+import argparse
 import sys
 import traceback
-import time
-from PIL import Image, ImageTk
-import pygame
-from collections import defaultdict
+from collections import OrderedDict, deque
 
-# Import game components
-from src.card import standard_pokemon_cards, standard_trainer_cards
-from src.player_utils import Player, Game
+# Import game components; PIL, the sprite atlas and the search agents load when first needed
+from src.card import standard_pokemon_cards
+from playback import PlaybackScheduler, PLAYBACK_SPEEDS, TURN_DELAY, MATCH_DELAY
+from recorder import MatchRecorder, RECORDING_FOLDER, player_state
+from replay import ReplayPlayer
+from events import events_for
+from sounds import SoundManager
+from perf_stats import PerfStats
+from profiler import TurnProfiler, parse_turn_range
+from battle import engine_supports_search, setup_match, draw_opening_hands, play_turn, determine_winner, new_seed, MAX_TURNS, PLAYER_NAMES
+
+STARTUP.mark("imports")
 
 IMAGE_FOLDER = "src/images/gui/"
 CARD_IMAGE_FOLDER = "src/images/cards/"
-SOUND_FOLDER = "sounds/"
+LOG_FOLDER = "logs/"
+
+# Lines kept in the battle log widget, older lines only live in the log file
+BATTLE_LOG_MAX_LINES = 500
+# Lines allowed to wait for the next flush; older ones are dropped if the main loop stalls
+LOG_BUFFER_MAX_LINES = 10000
+
+# UI commands posted by the battle thread, drained on the Tk main loop
+UI_QUEUE_SIZE = 1000
+UI_FRAME_MS = 16
+UI_FRAME_BUDGET = 0.010  # seconds of queued UI work per frame
+
+BACKGROUND_SIZE = (1200, 700)
+# Wait for the canvas to settle before rescaling the background
+BACKGROUND_RESIZE_DEBOUNCE_MS = 150
+
+# Debug panel: instrumented drawing methods and how often the panel refreshes
+DEBUG_TIMED_METHODS = ("load_pokemon_images", "update_hp_bars", "update_discard_piles",
+                       "update_prize_cards", "update_deck_display", "update_bench")
+DEBUG_REFRESH_MS = 500
+
+# AI choices per player, in menu order; the names of mcts.AGENTS, which is only imported to start a battle.
+# The menus are only shown when the engine exposes turn options for the search agents to choose from.
+AGENT_NAMES = ("Heuristic", "MCTS", "MCTS (parallel)")
+
+# Rollouts per move for search agents; a time budget only applies when this is 0
+SEARCH_ROLLOUTS = 200
+
+# Upper bound for decoded card art kept in memory (RGBA bytes)
+CARD_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class CardImageCache:
+    """LRU cache of decoded, resized card PhotoImages keyed by (name, size)"""
+
+    def __init__(self, max_bytes=CARD_IMAGE_CACHE_BYTES, atlases=None):
+        self.max_bytes = max_bytes
+        self.atlases = atlases or {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+
+    def get(self, name, size):
+        key = (name, size)
+        photo = self._images.get(key)
+        if photo is not None:
+            self._images.move_to_end(key)
+            self.hits += 1
+            return photo
+
+        self.misses += 1
+        photo = self.load(name, size)
+        self._images[key] = photo
+        self.current_bytes += size[0] * size[1] * 4
+
+        # Evict least recently used images until we are back under the cap,
+        # always keeping the one we just loaded
+        while self.current_bytes > self.max_bytes and len(self._images) > 1:
+            (_, old_size), _ = self._images.popitem(last=False)
+            self.current_bytes -= old_size[0] * old_size[1] * 4
+        return photo
+
+    def load(self, name, size):
+        """Decode one card at size, from its atlas if there is one for that size"""
+        from PIL import Image, ImageTk
+        atlas = self.atlases.get(size)
+        if atlas is not None and name in atlas:
+            image = atlas.crop(name)
+        else:
+            image = Image.open(f"{CARD_IMAGE_FOLDER}{name}.png").resize(size)
+        return ImageTk.PhotoImage(image)
+
+    def clear(self):
+        self._images.clear()
+        self.current_bytes = 0
+
 
 class BattleGUI:
-    def __init__(self, root):
+    def __init__(self, root, sound=True, startup_report=False, profile_turns=None, log_lines=BATTLE_LOG_MAX_LINES):
         try:
             self.root = root
             self.root.title("Pokémon TCG AI Battle")
@@ -27,13 +116,50 @@ class BattleGUI:
             self.root.configure(bg="black")
             self.root.state("zoomed")
 
-            self.simulation_running = False
-            self.card_images = {}
-            self.p1_bench_images = []
-            self.p2_bench_images = []
-
-            # Initialize pygame mixer
-            pygame.mixer.init()
+            self.startup_report = startup_report
+            self.scheduler = PlaybackScheduler()
+            self.battle_thread = None
+            self.replay = None
+            # Retained canvas items: key -> [item id, coords, options]
+            self.canvas_items = {}
+            # Last drawn fingerprint per board zone, see zone_fingerprints
+            self.drawn_zones = {}
+            # Decoded background source and its scaled PhotoImage for the current canvas size
+            self.background_source = None
+            self.background_image = None
+            self.background_size = None
+            self.background_resize_job = None
+            # Tk is only touched from the main thread, the battle thread posts here
+            self.ui_queue = queue.Queue(maxsize=UI_QUEUE_SIZE)
+            # The board is drawn from snapshots, never from the Players the battle thread mutates.
+            # pending_board is a one-slot (run, board) handoff, only touched under board_lock.
+            self.player1 = None
+            self.player2 = None
+            self.pending_board = None
+            self.board_lock = threading.Lock()
+            # Every line streams to the on-disk log as it is logged; only the lines waiting
+            # for the widget are buffered, and that buffer is bounded
+            self.log_buffer = deque(maxlen=LOG_BUFFER_MAX_LINES)
+            self.log_dropped = 0
+            self.battle_log_max_lines = log_lines
+            self.battle_log_file = None
+            self.battle_log_lock = threading.Lock()
+            try:
+                from sprite_atlas import load_atlases
+                atlases = load_atlases(CARD_IMAGE_FOLDER)
+            except Exception as e:
+                print(f"Sprite atlas unavailable, loading card images individually: {e}")
+                atlases = {}
+            self.card_images = CardImageCache(atlases=atlases)
+            # Rolling timings shown in the debug panel
+            self.perf = PerfStats()
+            for name in DEBUG_TIMED_METHODS:
+                setattr(self, name, self.perf.timed(name, getattr(self, name)))
+            self.debug_visible = False
+            self.debug_job = None
+
+            # Sound bank, the mixer starts on the first sound played
+            self.sounds = SoundManager(enabled=sound)
             self.main_frame = tk.Frame(self.root, bg="black")
             self.main_frame.pack(expand=True, fill=tk.BOTH)
             self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")
@@ -47,16 +173,75 @@ class BattleGUI:
             self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
             self.match_entry.pack(side=tk.LEFT)
             self.match_entry.insert(0, "1")
+            self.seed_label = tk.Label(self.match_frame, text="Seed:", font=("Arial", 14), bg="black", fg="white")
+            self.seed_label.pack(side=tk.LEFT, padx=10)
+            self.seed_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=11)
+            self.seed_entry.pack(side=tk.LEFT)
             self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
             self.button_frame.pack(pady=10)
             self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
             self.start_button.pack(side=tk.LEFT, padx=10)
             self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
             self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
+            self.replay_button = tk.Button(self.button_frame, text="Replay Seed", command=self.replay_seed, font=("Arial", 14, "bold"), bg="purple", fg="white")
+            self.replay_button.pack(side=tk.LEFT, padx=10)
+            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.exit, font=("Arial", 14, "bold"), bg="blue", fg="white")
             self.exit_button.pack(side=tk.LEFT, padx=10)
+            self.playback_frame = tk.Frame(self.sidebar_frame, bg="black")
+            self.playback_frame.pack(pady=5)
+            self.speed_label = tk.Label(self.playback_frame, text="Speed:", font=("Arial", 14), bg="black", fg="white")
+            self.speed_label.pack(side=tk.LEFT, padx=10)
+            self.speed_names = {self.speed_name(speed): speed for speed in PLAYBACK_SPEEDS}
+            self.speed_var = tk.StringVar(value=self.speed_name(self.scheduler.speed))
+            self.speed_menu = tk.OptionMenu(self.playback_frame, self.speed_var, *self.speed_names, command=self.change_speed)
+            self.speed_menu.pack(side=tk.LEFT)
+            self.pause_button = tk.Button(self.playback_frame, text="Pause", command=self.toggle_pause, font=("Arial", 14, "bold"), bg="orange", fg="white")
+            self.pause_button.pack(side=tk.LEFT, padx=10)
+            self.step_button = tk.Button(self.playback_frame, text="Step", command=self.scheduler.step, font=("Arial", 14, "bold"), bg="gray", fg="white")
+            self.step_button.pack(side=tk.LEFT, padx=10)
+            self.replay_open_button = tk.Button(self.playback_frame, text="Open Replay", command=self.open_replay, font=("Arial", 14, "bold"), bg="teal", fg="white")
+            self.replay_open_button.pack(side=tk.LEFT, padx=10)
+            self.debug_button = tk.Button(self.playback_frame, text="Debug", command=self.toggle_debug_panel, font=("Arial", 14, "bold"), bg="gray", fg="white")
+            self.debug_button.pack(side=tk.LEFT, padx=10)
+            # AI selection per player, with the search budget for lookahead agents; without
+            # engine support for search both players always use Game's own AI
+            self.agent_vars = {}
+            if engine_supports_search():
+                self.ai_frame = tk.Frame(self.sidebar_frame, bg="black")
+                self.ai_frame.pack(pady=5)
+                for name in PLAYER_NAMES:
+                    tk.Label(self.ai_frame, text=f"{name}:", font=("Arial", 14), bg="black", fg="white").pack(side=tk.LEFT, padx=5)
+                    self.agent_vars[name] = tk.StringVar(value=AGENT_NAMES[0])
+                    tk.OptionMenu(self.ai_frame, self.agent_vars[name], *AGENT_NAMES).pack(side=tk.LEFT)
+                self.budget_label = tk.Label(self.ai_frame, text="Budget (ms):", font=("Arial", 14), bg="black", fg="white")
+                self.budget_label.pack(side=tk.LEFT, padx=5)
+                self.budget_entry = tk.Entry(self.ai_frame, font=("Arial", 14), width=5)
+                self.budget_entry.pack(side=tk.LEFT)
+                self.budget_entry.insert(0, "500")
+                # A rollout budget makes searches independent of machine speed, so seeds replay exactly
+                tk.Label(self.ai_frame, text="Rollouts:", font=("Arial", 14), bg="black", fg="white").pack(side=tk.LEFT, padx=5)
+                self.rollouts_entry = tk.Entry(self.ai_frame, font=("Arial", 14), width=5)
+                self.rollouts_entry.pack(side=tk.LEFT)
+                self.rollouts_entry.insert(0, str(SEARCH_ROLLOUTS))
+            # cProfile capture for a range of turns, off unless ticked
+            self.profile_frame = tk.Frame(self.sidebar_frame, bg="black")
+            self.profile_frame.pack(pady=5)
+            self.profile_var = tk.BooleanVar(value=profile_turns is not None)
+            self.profile_check = tk.Checkbutton(self.profile_frame, text="Profile turns:", variable=self.profile_var,
+                                                font=("Arial", 14), bg="black", fg="white", selectcolor="black")
+            self.profile_check.pack(side=tk.LEFT, padx=5)
+            self.profile_entry = tk.Entry(self.profile_frame, font=("Arial", 14), width=7)
+            self.profile_entry.pack(side=tk.LEFT)
+            self.profile_entry.insert(0, "%d-%d" % profile_turns if profile_turns else "1-10")
+            # Debug panel, only packed while toggled on
+            self.debug_label = tk.Label(self.sidebar_frame, font=("Courier", 11), bg="black", fg="lime", justify=tk.LEFT, anchor="w")
+            # Turn scrubber, only shown while a replay is loaded
+            self.replay_scale = tk.Scale(self.sidebar_frame, from_=0, to=0, orient=tk.HORIZONTAL, label="Replay Turn",
+                                         command=self.show_replay_turn, font=("Arial", 12), bg="black", fg="white",
+                                         highlightthickness=0)
             self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
             self.battle_log_label.pack(pady=5)
+            from tkinter import scrolledtext
             self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
             self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
             self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
@@ -75,41 +260,105 @@ class BattleGUI:
 
             # Add background image to battle_canvas
             try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
+                self.draw_background()
             except FileNotFoundError as e:
                 self.log_error(f"Background image not found: {e}. Continuing without background image.")
             except Exception as e:
                 self.log_error(f"Error loading background image: {e}. Continuing without background image.")
+            self.battle_canvas.bind("<Configure>", self.on_canvas_configure)
+            self.root.protocol("WM_DELETE_WINDOW", self.exit)
 
             sys.stderr = self.ErrorLogger(self)
             self.log_message("✅ GUI Initialized Successfully.")
+            self.root.after(UI_FRAME_MS, self.pump_ui_queue)
+            STARTUP.mark("widgets")
+            self.battle_canvas.bind("<Map>", self.on_first_frame, add="+")
         except Exception as e:
             print(f"GUI Init Error: {str(e)}")
             traceback.print_exc()
 
+    def draw_item(self, key, kind, coords, **options):
+        """Create the canvas item for key once, then only push coords/options that changed"""
+        options.setdefault("state", tk.NORMAL)
+        coords = tuple(coords)
+        item = self.canvas_items.get(key)
+        if item is None:
+            create = getattr(self.battle_canvas, f"create_{kind}")
+            item_id = create(*coords, **options)
+            self.canvas_items[key] = [item_id, coords, options]
+            return item_id
+
+        item_id, old_coords, old_options = item
+        if coords != old_coords:
+            self.battle_canvas.coords(item_id, *coords)
+            item[1] = coords
+        changed = {k: v for k, v in options.items() if old_options.get(k) != v}
+        if changed:
+            self.battle_canvas.itemconfigure(item_id, **changed)
+            old_options.update(changed)
+        return item_id
+
+    def hide_item(self, key):
+        item = self.canvas_items.get(key)
+        if item is not None and item[2].get("state") != tk.HIDDEN:
+            self.battle_canvas.itemconfigure(item[0], state=tk.HIDDEN)
+            item[2]["state"] = tk.HIDDEN
+
+    def load_background(self, size):
+        """Decode background.jpg once, using JPEG draft mode to skip detail finer than size"""
+        source = self.background_source
+        if source is not None and source.width >= size[0] and source.height >= size[1]:
+            return source
+        from PIL import Image
+        with Image.open(f"{IMAGE_FOLDER}background.jpg") as background_image:
+            background_image.draft("RGB", size)
+            self.background_source = background_image.convert("RGB")
+        return self.background_source
+
+    def draw_background(self, size=None):
+        """Show the background scaled to size, rescaling only when the size changed"""
+        size = size or self.background_size or BACKGROUND_SIZE
+        if self.background_image is None or size != self.background_size:
+            source = self.load_background(size)
+            from PIL import Image, ImageTk
+            self.background_image = ImageTk.PhotoImage(source.resize(size, Image.LANCZOS))
+            self.background_size = size
+        self.draw_item("background", "image", (0, 0), image=self.background_image, anchor=tk.NW)
+
+    def on_canvas_configure(self, event):
+        """Debounce canvas resizes so a window drag only rescales the background once"""
+        size = (event.width, event.height)
+        if size == self.background_size or self.background_source is None:
+            return
+        if self.background_resize_job is not None:
+            self.root.after_cancel(self.background_resize_job)
+        self.background_resize_job = self.root.after(BACKGROUND_RESIZE_DEBOUNCE_MS, self.resize_background, size)
+
+    def resize_background(self, size):
+        self.background_resize_job = None
+        try:
+            self.draw_background(size)
+        except Exception as e:
+            self.log_error(f"Error resizing background image: {e}")
+
     def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW, tags="pokemon_image")
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW, tags="pokemon_image")
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
+        for key, pokemon, y in (("p1_pokemon_image", p1_pokemon, 350), ("p2_pokemon_image", p2_pokemon, 250)):
+            try:
+                photo = self.card_images.get(pokemon, (150, 150))
+                self.draw_item(key, "image", (500, y), image=photo, anchor=tk.NW, tags="pokemon_image")
+            except FileNotFoundError as e:
+                self.hide_item(key)
+                self.log_message(f"❌ Image Load Error: {e}")
+            except Exception as e:
+                self.hide_item(key)
+                self.log_message(f"❌ Unexpected Error Loading Image: {e}")
 
     def load_deck_images(self, deck, frame):
         for widget in frame.winfo_children():
             widget.destroy()
         for card in deck:
             try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
+                card_photo = self.card_images.get(card['name'], (50, 50))
                 card_label = tk.Label(frame, image=card_photo, bg="black")
                 card_label.image = card_photo
                 card_label.pack(side=tk.LEFT, padx=2)
@@ -119,12 +368,6 @@ class BattleGUI:
                 self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
 
     def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
         # Update Active Pokémon HP bars
         try:
             # Player 1 active Pokémon HP bar
@@ -141,9 +384,12 @@ class BattleGUI:
                 if p1_hp / p1_max_hp <= 0.25:
                     bar_color = "red"
                     
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
+                self.draw_item("p1_hp_bar", "rectangle", (500, 500, 500 + p1_width, 520), fill=bar_color, tags="hp_bar")
+                self.draw_item("p1_hp_text", "text", (550, 490), text=f"HP: {p1_hp}/{p1_max_hp}", 
+                               fill="white", font=("Arial", 12, "bold"), tags="hp_text")
+            else:
+                self.hide_item("p1_hp_bar")
+                self.hide_item("p1_hp_text")
         except Exception as e:
             self.log_error(f"Error updating P1 active HP bar: {str(e)}")
         
@@ -162,17 +408,159 @@ class BattleGUI:
                 if p2_hp / p2_max_hp <= 0.25:
                     bar_color = "red"
                     
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
+                self.draw_item("p2_hp_bar", "rectangle", (500, 200, 500 + p2_width, 220), fill=bar_color, tags="hp_bar")
+                self.draw_item("p2_hp_text", "text", (550, 190), text=f"HP: {p2_hp}/{p2_max_hp}", 
+                               fill="white", font=("Arial", 12, "bold"), tags="hp_text")
+            else:
+                self.hide_item("p2_hp_bar")
+                self.hide_item("p2_hp_text")
         except Exception as e:
             self.log_error(f"Error updating P2 active HP bar: {str(e)}")
 
+    def on_first_frame(self, event):
+        """Close the startup report once the board is first mapped on screen"""
+        self.battle_canvas.unbind("<Map>")
+        STARTUP.mark("first frame")
+        self.log_message(f"⏱️ {STARTUP.report()}")
+        if self.startup_report:
+            print(STARTUP.report())
+
+    def play_sound(self, name):
+        try:
+            self.sounds.play(name)
+        except Exception as e:
+            self.log_error(f"Error playing sound: {str(e)}")
+
+    @staticmethod
+    def on_ui_thread():
+        return threading.current_thread() is threading.main_thread()
+
+    def post_ui(self, func, *args):
+        """Queue func(*args) for the Tk main loop, blocking the caller while the queue is full"""
+        self.ui_queue.put((func, args))
+
+    @staticmethod
+    def board_snapshot(player1, player2):
+        """Read-only copy of what the board shows for both players"""
+        return (ReplayPlayer(player1.name, player_state(player1)),
+                ReplayPlayer(player2.name, player_state(player2)))
+
+    def request_redraw(self, player1, player2, run=None):
+        """Ask for a redraw of the board as it is now; requests made before the next frame collapse into one
+
+        Must be called from the thread that owns player1 and player2, the snapshot is taken here.
+        run is the battle run posting the board; it is dropped if that run is stopped or
+        replaced before the next frame.
+        """
+        board = self.board_snapshot(player1, player2)
+        if self.on_ui_thread():
+            self.show_board(board)
+        else:
+            with self.board_lock:
+                self.pending_board = (run, board)
+
+    def take_pending_board(self):
+        """Swap out the latest board the battle thread posted, None if there is none or its run has ended"""
+        with self.board_lock:
+            pending, self.pending_board = self.pending_board, None
+        if pending is None:
+            return None
+        run, board = pending
+        return board if self.scheduler.running(run) else None
+
+    def show_board(self, board):
+        self.player1, self.player2 = board
+        self.update_battle_display()
+
+    def pump_ui_queue(self):
+        """Run queued UI commands on the main loop within a per-frame time budget"""
+        deadline = time.perf_counter() + UI_FRAME_BUDGET
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    func, args = self.ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    func(*args)
+                except Exception as e:
+                    self.log_error(f"UI Update Error: {str(e)}")
+
+            self.flush_battle_log()
+
+            # Only the latest board state matters, so draw it once per frame
+            board = self.take_pending_board()
+            if board is not None:
+                self.show_board(board)
+        except Exception as e:
+            self.log_error(f"UI Update Error: {str(e)}")
+        finally:
+            self.root.after(UI_FRAME_MS, self.pump_ui_queue)
+
     def log_message(self, message):
-        self.battle_log.insert(tk.END, message + "\n")
+        # Safe from any thread: written to disk right away, shown by flush_battle_log on the main loop
+        line = message + "\n"
+        self.write_battle_log_file(line)
+        if len(self.log_buffer) == self.log_buffer.maxlen:
+            self.log_dropped += 1
+        self.log_buffer.append(line)
+
+    def write_battle_log_file(self, text, flush=False):
+        with self.battle_log_lock:
+            if self.battle_log_file is None:
+                return
+            try:
+                self.battle_log_file.write(text)
+                if flush:
+                    self.battle_log_file.flush()
+                return
+            except OSError as e:
+                self.battle_log_file = None
+                error = e
+        self.log_error(f"Error writing battle log file: {str(error)}")
+
+    def flush_battle_log(self):
+        """Show buffered log lines in the widget, keeping only the newest on screen, and flush the log file"""
+        self.write_battle_log_file("", flush=True)
+        lines = []
+        if self.log_dropped:
+            lines.append(f"⚠️ {self.log_dropped} log lines not shown while the display was busy, see the log file\n")
+            self.log_dropped = 0
+        while self.log_buffer:
+            lines.append(self.log_buffer.popleft())
+        if not lines:
+            return
+        text = "".join(lines)
+
+        self.battle_log.insert(tk.END, text)
+        line_count = int(self.battle_log.index("end-1c").split(".")[0])
+        excess = line_count - self.battle_log_max_lines
+        if excess > 0:
+            self.battle_log.delete("1.0", f"{excess + 1}.0")
         self.battle_log.yview(tk.END)
 
+    def close_battle_log_file(self):
+        with self.battle_log_lock:
+            log_file, self.battle_log_file = self.battle_log_file, None
+        if log_file is not None:
+            log_file.close()
+
+    def open_battle_log_file(self):
+        """Start a new on-disk log for this battle run, closing the previous one"""
+        self.close_battle_log_file()
+        try:
+            os.makedirs(LOG_FOLDER, exist_ok=True)
+            path = os.path.join(LOG_FOLDER, time.strftime("battle_%Y%m%d_%H%M%S.log"))
+            log_file = open(path, "a", encoding="utf-8")
+            with self.battle_log_lock:
+                self.battle_log_file = log_file
+        except OSError as e:
+            self.log_error(f"Error opening battle log file: {str(e)}")
+
     def log_error(self, message):
+        if not self.on_ui_thread():
+            self.post_ui(self.log_error, message)
+            return
         self.error_log.insert(tk.END, "❌ " + message + "\n")
         self.error_log.yview(tk.END)
 
@@ -187,133 +575,160 @@ class BattleGUI:
         def flush(self):
             pass
 
-    def run_battle(self, num_matches):
+    def run_battle(self, num_matches, seed, run, agents, profiler=None):
+        """Play num_matches on the battle thread for run, an id from PlaybackScheduler.reset
+
+        The recorder, game, agents and profiler belong to the run. The process-wide
+        random module does not: setup_match reseeds it for every match, so
+        launch_battle only starts a run once the previous run's thread has exited.
+        """
+        recorder = MatchRecorder()
         try:
+            # Start any worker processes now rather than inside the first move's budget
+            for agent in agents.values():
+                agent.warm_up()
             for match in range(num_matches):
-                if not self.simulation_running:
+                if not self.scheduler.running(run):
                     self.log_message("⏹️ Battle simulation terminated.")
                     break
                 
-                self.log_message(f"⚡ Match {match + 1} Begins!")
-                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))
-                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))
-                
-                # Setup prize cards (6 for each player)
-                if self.player1.deck:
-                    self.player1.prize_cards = self.player1.deck[:6]
-                    self.player1.deck = self.player1.deck[6:]
-                
-                if self.player2.deck:
-                    self.player2.prize_cards = self.player2.deck[:6]
-                    self.player2.deck = self.player2.deck[6:]
-                
-                # Initialize game
-                self.game = Game(self.player1, self.player2, ai_enabled=True)
+                # Only the first match replays a given seed, the rest get fresh ones
+                match_seed = seed if seed is not None and match == 0 else new_seed()
+                self.log_message(f"⚡ Match {match + 1} Begins! (seed {match_seed})")
+                # Create decks, prize cards and the game
+                player1, player2, game = setup_match(standard_pokemon_cards, match_seed)
+                recorder.start_match(match_seed, player1, player2)
+                if profiler is not None:
+                    profiler.start_match(match_seed)
+                for agent in agents.values():
+                    agent.new_match()
+                events = events_for(game)
+                log_cursor = events.cursor()
+                record_cursor = events.cursor()
                 
                 # Initial setup
-                self.update_battle_display()
+                self.request_redraw(player1, player2, run)
                 
                 # Draw initial hands (7 cards)
-                self.player1.draw_cards(7)
-                self.player2.draw_cards(7)
+                draw_opening_hands(player1, player2)
                 
                 # Show hands
-                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")
-                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")
+                self.log_message(f"{player1.name}'s hand: {player1.show_hand()}")
+                self.log_message(f"{player2.name}'s hand: {player2.show_hand()}")
 
                 # Game loop
                 turn_count = 0
-                while not self.game.is_over() and turn_count < 100:  # Add turn limit to prevent infinite loops
-                    if not self.simulation_running:
+                while not game.is_over() and turn_count < MAX_TURNS:
+                    if not self.scheduler.running(run):
                         self.log_message("⏹️ Battle simulation terminated during turn.")
                         return
                     
-                    current_player = self.game.players[self.game.turn % 2]
-                    result = self.game.play_turn(current_player)
+                    turn_start = time.perf_counter()
+                    if profiler is not None and profiler.wants(turn_count + 1):
+                        current_player, result = profiler.profile(turn_count + 1, play_turn, game, agents)
+                    else:
+                        current_player, result = play_turn(game, agents)
+                    # Stopped (or restarted) while this turn was being played
+                    if not self.scheduler.running(run):
+                        return
+                    self.perf.record("play_turn", time.perf_counter() - turn_start)
+                    self.perf.mark_turn()
+                    recorder.record_turn(game.turn, current_player,
+                                         [event.action for event in record_cursor.read()],
+                                         player1, player2)
                     
                     # Update the battle display after each turn
-                    self.update_battle_display()
-                    
-                    # Log each action from the action log
-                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")
-                    for action in current_player.action_log:
-                        self.log_message(f"  ▶️ {action}")
-                    
-                    # Check if we're still running
-                    if not self.simulation_running:
-                        return
+                    self.request_redraw(player1, player2, run)
+                    
+                    # Log the actions taken since the last turn
+                    self.log_message(f"🎮 {current_player.name}'s Turn {game.turn}:")
+                    agent = agents.get(current_player.name)
+                    if agent is not None:
+                        self.log_message(f"  🤖 {agent.name} searched {agent.last_rollouts} rollouts")
+                    for event in log_cursor.read():
+                        self.log_message(f"  ▶️ {event.action}")
                         
-                    # Add a small delay between turns
-                    self.root.update()
-                    time.sleep(0.5)
+                    # Pace turns; returns early if the battle is stopped
+                    if not self.scheduler.wait(TURN_DELAY, run):
+                        return
                     turn_count += 1
                     
                     if result:
                         break
                 
                 # Final update of the display
-                self.update_battle_display()
+                self.request_redraw(player1, player2, run)
                 
                 # Determine winner
-                if self.player1.active_pokemon is None and not self.player1.bench:
-                    winner = self.player2.name
-                elif self.player2.active_pokemon is None and not self.player2.bench:
-                    winner = self.player1.name
-                else:
-                    winner = self.game.players[self.game.turn % 2].name
-                    
+                winner = determine_winner(game, player1, player2)
+                recorder.end_match(winner, turn_count)
+                self.write_profile(profiler)
                 self.log_message(f"🏆 {winner} Wins the Battle!")
                 # Only play sound if simulation is still running
-                if self.simulation_running:
-                    pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")
-                    pygame.mixer.music.play()
+                if self.scheduler.running(run):
+                    self.post_ui(self.play_sound, "win")
                     
                     # Short delay between matches
-                    self.root.update()
-                    time.sleep(2)
+                    self.scheduler.wait(MATCH_DELAY, run)
                 
         except Exception as e:
             self.log_error(f"Battle Error: {str(e)}")
             traceback.print_exc()
+        finally:
+            # Keep whatever was recorded or profiled of an interrupted match
+            recorder.close()
+            self.write_profile(profiler)
+            for agent in agents.values():
+                agent.close()
 
-    def create_deck(self, card_pool, deck_size):
-        if not card_pool:
-            raise ValueError("Card pool is empty. Cannot create a deck.")
-        if len(card_pool) >= deck_size:
-            return random.sample(card_pool, deck_size)
-        else:
-            deck = card_pool * (deck_size // len(card_pool))
-            deck += random.sample(card_pool, deck_size % len(card_pool))
-            return deck
+    def write_profile(self, profiler):
+        if profiler is None:
+            return
+        try:
+            paths = profiler.end_match()
+        except OSError as e:
+            self.log_error(f"Error writing profile: {str(e)}")
+            return
+        if paths:
+            self.log_message(f"📈 Profile written to {paths[0]} and {paths[1]}")
+
+    def exit(self):
+        """Stop any battle and close the on-disk log before leaving the main loop"""
+        self.scheduler.stop()
+        try:
+            self.close_battle_log_file()
+        except Exception as e:
+            print(f"Error closing battle log file: {e}")
+        self.root.quit()
 
     def stop_battle(self):
         """Completely stop the battle and reset the game state"""
-        self.simulation_running = False
+        self.scheduler.stop()
         
         try:
             # Play stop sound
-            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")
-            pygame.mixer.music.play()
+            self.sounds.play("stop_battle")
         except Exception as e:
             self.log_error(f"Error playing sound: {str(e)}")
         
         # Clear the battle canvas
         self.battle_canvas.delete("all")
+        self.canvas_items.clear()
+        self.drawn_zones.clear()
         
-        # Reset game state
+        # Reset game state, dropping any board the battle thread had queued; one posted
+        # after this belongs to a stopped run and is skipped by take_pending_board
+        with self.board_lock:
+            self.pending_board = None
         self.player1 = None
         self.player2 = None
-        self.game = None
         
         # Redraw the game areas
         self.define_areas()
         
-        # Try to reload the background image
+        # Put the cached background image back
         try:
-            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-            background_image = background_image.resize((1200, 700), Image.LANCZOS)
-            self.background_image = ImageTk.PhotoImage(background_image)
-            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
+            self.draw_background()
         except Exception:
             # If background fails to load, create a plain black background
             pass
@@ -336,20 +751,170 @@ class BattleGUI:
         self.log_message("🛑 AI Battle Stopped!")
         self.log_message("Click 'Start Battle' to begin a new battle.")
 
-    def start_battle(self):
-        try:
-            self.simulation_running = True
+    @staticmethod
+    def speed_name(speed):
+        return "Max" if speed is None else f"{speed:g}x"
+
+    def change_speed(self, name):
+        self.scheduler.set_speed(self.speed_names[name])
+
+    def toggle_pause(self):
+        paused = self.scheduler.toggle_pause()
+        self.pause_button.config(text="Resume" if paused else "Pause")
+
+    def create_agents(self, budget, rollouts):
+        """Build the selected search agent for each player, None meaning Game's own AI
+
+        rollouts > 0 bounds every search by rollouts alone; otherwise budget is the
+        time per move in seconds.
+        """
+        from mcts import AGENTS
+        agents = {}
+        for name, var in self.agent_vars.items():
+            agent_class = AGENTS[var.get()]
+            if agent_class is None:
+                continue
+            if rollouts > 0:
+                agents[name] = agent_class(time_budget=None, max_rollouts=rollouts)
+            else:
+                agents[name] = agent_class(time_budget=budget)
+        return agents
+
+    def open_replay(self):
+        """Load a recorded match and show the turn scrubber"""
+        from tkinter import filedialog
+        from replay import MatchReplay
+        path = filedialog.askopenfilename(initialdir=RECORDING_FOLDER, title="Open Match Recording",
+                                          filetypes=[("Match recordings", "*.jsonl"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            replay = MatchReplay(path)
+        except Exception as e:
+            self.log_error(f"Error loading replay: {str(e)}")
+            return
+
+        # A replay takes over the board, so stop any running battle first; its lines don't belong in that battle's log
+        self.scheduler.stop()
+        self.close_battle_log_file()
+        self.replay = replay
+        self.battle_log.delete(1.0, tk.END)
+        self.log_message(f"📼 Replaying match (seed {replay.header['seed']}), {replay.turn_count} turns")
+        if replay.result:
+            self.log_message(f"🏆 {replay.result['winner']} won after {replay.result['turns']} turns")
+        self.replay_scale.configure(to=replay.turn_count)
+        self.replay_scale.pack(after=self.playback_frame, fill=tk.X, padx=10)
+        self.replay_scale.set(0)
+        self.show_replay_turn(0)
+
+    def show_replay_turn(self, value):
+        if self.replay is None:
+            return
+        try:
+            self.player1, self.player2, record = self.replay.players_at(int(value))
+            self.update_battle_display()
+            if record["t"] == "turn":
+                self.log_message(f"🎮 {record['p']}'s Turn {record['n']}:")
+                for action in record["a"]:
+                    self.log_message(f"  ▶️ {action}")
+        except Exception as e:
+            self.log_error(f"Error showing replay turn: {str(e)}")
+
+    def close_replay(self):
+        if self.replay is not None:
+            self.replay = None
+            self.replay_scale.pack_forget()
+
+    def replay_seed(self):
+        """Replay the single match played with the seed typed into the seed box"""
+        try:
+            seed = int(self.seed_entry.get())
+        except ValueError:
+            self.log_error("Enter a match seed to replay.")
+            return
+        self.start_battle(num_matches=1, seed=seed, replay=True)
+
+    def start_battle(self, num_matches=None, seed=None, replay=False):
+        # Read every input before touching any state, so a typo can't leave a half started battle
+        try:
+            if num_matches is None:
+                num_matches = int(self.match_entry.get())
+            if self.agent_vars:
+                budget = float(self.budget_entry.get()) / 1000
+                rollouts = int(self.rollouts_entry.get())
+            profile_turns = parse_turn_range(self.profile_entry.get()) if self.profile_var.get() else None
+        except ValueError as e:
+            self.log_error(f"Start Battle Error: {str(e)}")
+            return
+        searching = any(var.get() != AGENT_NAMES[0] for var in self.agent_vars.values())
+        forced_rollouts = searching and replay and rollouts <= 0
+        if forced_rollouts:
+            # A time budget searches further on a faster machine, so it can't replay a seed
+            rollouts = SEARCH_ROLLOUTS
+
+        try:
+            agents = self.create_agents(budget, rollouts) if searching else {}
+            profiler = TurnProfiler(*profile_turns) if profile_turns else None
+            self.close_replay()
+            run = self.scheduler.reset()
+            self.open_battle_log_file()
             self.battle_log.delete(1.0, tk.END)
             self.error_log.delete(1.0, tk.END)
             self.log_message("⚔️ AI Battle Started!")
-            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")
-            pygame.mixer.music.play()
-            num_matches = int(self.match_entry.get())
-            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))
-            battle_thread.start()
+            if forced_rollouts:
+                self.log_message(f"⚠️ Replaying with {rollouts} rollouts per move, a time-budgeted search can't be replayed exactly.")
+            self.play_sound("start_battle")
+            self.launch_battle(num_matches, seed, run, agents, profiler)
         except Exception as e:
             self.log_error(f"Start Battle Error: {str(e)}")
 
+    def launch_battle(self, num_matches, seed, run, agents, profiler):
+        """Start run_battle for run on a new thread once the previous battle thread has exited
+
+        A stopped run can still be inside play_turn, drawing from the random module the
+        new run's first match is about to seed, so its seed would not replay exactly.
+        This polls from the Tk loop instead of joining, since the old thread may be
+        waiting for the UI queue to drain.
+        """
+        if run != self.scheduler.run:
+            # Another start came in while this one waited
+            for agent in agents.values():
+                agent.close()
+            return
+        if self.battle_thread is not None and self.battle_thread.is_alive():
+            self.root.after(UI_FRAME_MS, self.launch_battle, num_matches, seed, run, agents, profiler)
+            return
+        self.battle_thread = threading.Thread(target=self.run_battle, args=(num_matches, seed, run, agents, profiler),
+                                              daemon=True)
+        self.battle_thread.start()
+
+    def toggle_debug_panel(self):
+        self.debug_visible = not self.debug_visible
+        if self.debug_visible:
+            self.debug_label.pack(before=self.profile_frame, fill=tk.X, padx=10)
+            self.refresh_debug_panel()
+        else:
+            if self.debug_job is not None:
+                self.root.after_cancel(self.debug_job)
+                self.debug_job = None
+            self.debug_label.pack_forget()
+
+    def refresh_debug_panel(self):
+        """Redraw the debug figures, rescheduling itself while the panel is shown"""
+        self.debug_job = None
+        if not self.debug_visible:
+            return
+        cache = self.card_images
+        lookups = cache.hits + cache.misses
+        hit_rate = cache.hits / lookups * 100 if lookups else 0.0
+        lines = [f"{'ms':<22} {'last':>7} {'mean':>7} {'max':>7}"]
+        lines += self.perf.lines()
+        lines.append(f"canvas items   {len(self.battle_canvas.find_all())}")
+        lines.append(f"image cache    {hit_rate:.1f}% hits ({cache.hits}/{lookups})")
+        lines.append(f"turns/sec      {self.perf.turns_per_second():.2f}")
+        self.debug_label.config(text="\n".join(lines))
+        self.debug_job = self.root.after(DEBUG_REFRESH_MS, self.refresh_debug_panel)
+
     def create_area(self, x1, y1, x2, y2, label):
         self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")
         self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))
@@ -392,45 +957,66 @@ class BattleGUI:
         self.create_area(1050, 50, 1100, 150, "Stadium P2")
         self.create_area(500, 250, 600, 350, "Active P2")
 
+    @staticmethod
+    def pokemon_fingerprint(pokemon):
+        if not pokemon:
+            return None
+        return (pokemon['name'], pokemon.get('hp'), pokemon.get('max_hp'))
+
+    def zone_fingerprints(self):
+        """Cheap snapshot of the Player state each board zone shows"""
+        p1, p2 = self.player1, self.player2
+        return {
+            "active": (self.pokemon_fingerprint(p1.active_pokemon), self.pokemon_fingerprint(p2.active_pokemon)),
+            "bench": (tuple(self.pokemon_fingerprint(p) for p in p1.bench[:5]),
+                      tuple(self.pokemon_fingerprint(p) for p in p2.bench[:5])),
+            "discard": (
+                len(p1.discard_pile), p1.discard_pile[-1]['name'] if p1.discard_pile else None,
+                len(p2.discard_pile), p2.discard_pile[-1]['name'] if p2.discard_pile else None,
+            ),
+            "prize": (len(p1.prize_cards), len(p2.prize_cards)),
+            "deck": (len(p1.deck), len(p2.deck)),
+        }
+
     def update_battle_display(self):
-        """Update the entire battle display"""
-        # Clear previous elements
-        self.battle_canvas.delete("pokemon_image")
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("discard_pile")
-        self.battle_canvas.delete("prize_card")
-        self.battle_canvas.delete("deck_display")
-        
-        # Update active Pokemon images
-        if self.player1 and self.player2:
+        """Update the board zones whose fingerprint changed since the last draw"""
+        if not (self.player1 and self.player2):
+            return
+
+        fingerprints = self.zone_fingerprints()
+        dirty = {zone for zone, fingerprint in fingerprints.items()
+                 if zone not in self.drawn_zones or self.drawn_zones[zone] != fingerprint}
+        self.drawn_zones = fingerprints
+
+        # Update active Pokemon images and HP bars
+        if "active" in dirty:
             self.load_pokemon_images(
                 self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",
                 self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"
             )
-            
-            # Update HP bars
             self.update_hp_bars()
-            
-            # Update discard piles
+        
+        # Update discard piles
+        if "discard" in dirty:
             self.update_discard_piles()
-            
-            # Update prize cards
+        
+        # Update prize cards
+        if "prize" in dirty:
             self.update_prize_cards()
-            
-            # Update decks
+        
+        # Update decks
+        if "deck" in dirty:
             self.update_deck_display()
-            
-            # Update bench Pokemon
+        
+        # Update bench Pokemon
+        if "bench" in dirty:
             self.update_bench()
+            self.update_bench_hp()
 
     def update_prize_cards(self):
         """Display prize cards on the game board"""
         try:
             # Create a solid color rectangle instead of loading an image
-            self.battle_canvas.delete("prize_card")  # Clear existing prize cards
-            
             # Define the dimensions of our prize card rectangle
             card_width = 40
             card_height = 60
@@ -458,180 +1044,174 @@ class BattleGUI:
             # Display the prize card backs and count for each player
             # For Player 1
             p1_prize_count = min(6, len(self.player1.prize_cards))  # Maximum of 6 prize cards
-            for i in range(p1_prize_count):
-                x, y = prize_slots_p1[i]
+            for i, (x, y) in enumerate(prize_slots_p1):
+                if i >= p1_prize_count:
+                    self.hide_item(("p1_prize", i))
+                    continue
                 # Draw a blue rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card_width/2, y - card_height/2,
-                    x + card_width/2, y + card_height/2,
+                self.draw_item(
+                    ("p1_prize", i), "rectangle",
+                    (x - card_width/2, y - card_height/2,
+                     x + card_width/2, y + card_height/2),
                     fill="blue", outline="white", tags="prize_card"
                 )
             
             # Show prize count
-            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
+            self.draw_item("p1_prize_text", "text", (125, 50), text=f"Prize Cards: {p1_prize_count}",
+                           fill="white", font=("Arial", 10), tags="prize_card")
             
             # For Player 2
             p2_prize_count = min(6, len(self.player2.prize_cards))  # Maximum of 6 prize cards
-            for i in range(p2_prize_count):
-                x, y = prize_slots_p2[i]
+            for i, (x, y) in enumerate(prize_slots_p2):
+                if i >= p2_prize_count:
+                    self.hide_item(("p2_prize", i))
+                    continue
                 # Draw a red rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card_width/2, y - card_height/2,
-                    x + card_width/2, y + card_height/2,
+                self.draw_item(
+                    ("p2_prize", i), "rectangle",
+                    (x - card_width/2, y - card_height/2,
+                     x + card_width/2, y + card_height/2),
                     fill="red", outline="white", tags="prize_card"
                 )
                 
             # Show prize count
-            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
+            self.draw_item("p2_prize_text", "text", (125, 650), text=f"Prize Cards: {p2_prize_count}",
+                           fill="white", font=("Arial", 10), tags="prize_card")
         except Exception as e:
             self.log_error(f"Error updating prize cards: {str(e)}")
 
-    ```python
-    def update_prize_cards(self):
-        """Display prize cards on the game board"""
-        try:
-            # Create a solid color rectangle instead of loading an image
-            self.battle_canvas.delete("prize_card")  # Clear existing prize cards
-            
-            # Define the dimensions of our prize card rectangle
-            card_width = 40
-            card_height = 60
-            
-            # Player 1 prize cards (6 slots)
-            prize_slots_p1 = [
-                (75, 100),  # Prize P1 Slot 1
-                (175, 100), # Prize P1 Slot 2
-                (75, 200),  # Prize P1 Slot 3
-                (175, 200), # Prize P1 Slot 4
-                (75, 300),  # Prize P1 Slot 5
-                (175, 300)  # Prize P1 Slot 6
-            ]
-            
-            # Player 2 prize cards (6 slots)
-            prize_slots_p2 = [
-                (75, 600),  # Prize P2 Slot 1
-                (175, 600), # Prize P2 Slot 2
-                (75, 500),  # Prize P2 Slot 3
-                (175, 500), # Prize P2 Slot 4
-                (75, 400),  # Prize P2 Slot 5
-                (175, 400)  # Prize P2 Slot 6
-            ]
-            
-            # Display the prize card backs and count for each player
-            # For Player 1
-            p1_prize_count = min(6, len(self.player1.prize_cards))  # Maximum of 6 prize cards
-            for i in range(p1_prize_count):
-                x, y = prize_slots_p1[i]
-                # Draw a blue rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card_width/2, y - card_height/2,
-                    x + card_width/2, y + card_height/2,
-                    fill="blue", outline="white", tags="prize_card"
-                )
-            
-            # Show prize count
-            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-            
-            # For Player 2
-            p2_prize_count = min(6, len(self.player2.prize_cards))  # Maximum of 6 prize cards
-            for i in range(p2_prize_count):
-                x, y = prize_slots_p2[i]
-                # Draw a red rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card_width/2, y - card_height/2,
-                    x + card_width/2, y + card_height/2,
-                    fill="red", outline="white", tags="prize_card"
-                )
-                
-            # Show prize count
-            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-        except Exception as e:
-            self.log_error(f"Error updating prize cards: {str(e)}")
-    
     def update_deck_display(self):
         """Display decks on the game board"""
         try:
-            # Clear previous deck display
-            self.battle_canvas.delete("deck_display")
-            
             # Define card dimensions
             card_width = 40
             card_height = 60
             
             # Player 1 deck
+            # Create a visual indication of deck with slight offset cards
+            p1_stack = min(5, len(self.player1.deck))
+            for i in range(5):
+                if i >= p1_stack:
+                    self.hide_item(("p1_deck", i))
+                    continue
+                # Offset each card slightly to create a stack effect
+                offset = i * 2
+                # Draw a blue rectangle for each card in the stack
+                self.draw_item(
+                    ("p1_deck", i), "rectangle",
+                    ((75 + offset) - card_width/2, (600 - offset) - card_height/2,
+                     (75 + offset) + card_width/2, (600 - offset) + card_height/2),
+                    fill="blue", outline="white", tags="deck_display"
+                )
+            
+            # Show deck count
             if self.player1.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player1.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a blue rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card_width/2, (600 - offset) - card_height/2,
-                        (75 + offset) + card_width/2, (600 - offset) + card_height/2,
-                        fill="blue", outline="white", tags="deck_display"
-                    )
-                
-                # Show deck count
-                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
+                self.draw_item("p1_deck_text", "text", (75, 650), text=f"Deck: {len(self.player1.deck)}",
+                               fill="white", font=("Arial", 10), tags="deck_display")
+            else:
+                self.hide_item("p1_deck_text")
             
             # Player 2 deck
+            p2_stack = min(5, len(self.player2.deck))
+            for i in range(5):
+                if i >= p2_stack:
+                    self.hide_item(("p2_deck", i))
+                    continue
+                # Offset each card slightly to create a stack effect
+                offset = i * 2
+                # Draw a red rectangle for each card in the stack
+                self.draw_item(
+                    ("p2_deck", i), "rectangle",
+                    ((75 + offset) - card_width/2, (100 - offset) - card_height/2,
+                     (75 + offset) + card_width/2, (100 - offset) + card_height/2),
+                    fill="red", outline="white", tags="deck_display"
+                )
+                
+            # Show deck count
             if self.player2.deck:
-                # Create a visual indication of deck
+                self.draw_item("p2_deck_text", "text", (75, 50), text=f"Deck: {len(self.player2.deck)}",
+                               fill="white", font=("Arial", 10), tags="deck_display")
+            else:
+                self.hide_item("p2_deck_text")
+        except Exception as e:
+            self.log_error(f"Error updating deck display: {str(e)}")
 
     def update_bench(self):
         """Update the bench Pokemon display"""
-        # Clear previous bench images
-        self.battle_canvas.delete("bench_image")
-        
         # Player 1 bench
         try:
-            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon
+            bench = self.player1.bench[:5]  # Maximum 5 bench Pokemon
+            for i in range(5):
+                if i >= len(bench):
+                    self.hide_item(("p1_bench", i))
+                    continue
+                pokemon = bench[i]
                 try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p1_bench_images'):
-                        self.p1_bench_images = []
-                    while len(self.p1_bench_images) <= i:
-                        self.p1_bench_images.append(None)
-                    self.p1_bench_images[i] = bench_photo
+                    bench_photo = self.card_images.get(pokemon['name'], (50, 50))
                     
                     # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
+                    self.draw_item(("p1_bench", i), "image", (375 + (i * 100), 500), image=bench_photo, 
+                                   anchor=tk.CENTER, tags="bench_image")
                 except Exception as e:
+                    self.hide_item(("p1_bench", i))
                     self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
         except Exception as e:
             self.log_error(f"Error updating P1 bench: {str(e)}")
         
         # Player 2 bench
         try:
-            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon
+            bench = self.player2.bench[:5]  # Maximum 5 bench Pokemon
+            for i in range(5):
+                if i >= len(bench):
+                    self.hide_item(("p2_bench", i))
+                    continue
+                pokemon = bench[i]
                 try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p2_bench_images'):
-                        self.p2_bench_images = []
-                    while len(self.p2_bench_images) <= i:
-                        self.p2_bench_images.append(None)
-                    self.p2_bench_images[i] = bench_photo
+                    bench_photo = self.card_images.get(pokemon['name'], (50, 50))
                     
                     # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
+                    self.draw_item(("p2_bench", i), "image", (375 + (i * 100), 100), image=bench_photo, 
+                                   anchor=tk.CENTER, tags="bench_image")
                 except Exception as e:
+                    self.hide_item(("p2_bench", i))
                     self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
         except Exception as e:
             self.log_error(f"Error updating P2 bench: {str(e)}")
 
+    def update_bench_hp(self):
+        """Draw an HP mini-bar and label under each bench Pokémon"""
+        for prefix, player, bar_y, text_y in (("p1", self.player1, 555, 570), ("p2", self.player2, 130, 140)):
+            try:
+                bench = player.bench[:5]  # Maximum 5 bench Pokemon
+                for i in range(5):
+                    pokemon = bench[i] if i < len(bench) else None
+                    if not pokemon or 'hp' not in pokemon:
+                        self.hide_item((prefix, "bench_hp_bar", i))
+                        self.hide_item((prefix, "bench_hp_text", i))
+                        continue
+                    hp = max(0, pokemon['hp'])
+                    max_hp = max(1, pokemon.get('max_hp', pokemon.get('hp', 100)))
+
+                    # HP bar color based on percentage
+                    bar_color = "green"
+                    if hp / max_hp <= 0.5:
+                        bar_color = "yellow"
+                    if hp / max_hp <= 0.25:
+                        bar_color = "red"
+
+                    # Position bench HP text and mini-bar next to each bench slot
+                    x_pos = 375 + (i * 100)
+                    width = 50
+                    bar_width = int((hp / max_hp) * width)
+                    self.draw_item((prefix, "bench_hp_bar", i), "rectangle",
+                                   (x_pos - width/2, bar_y, x_pos - width/2 + bar_width, bar_y + 5),
+                                   fill=bar_color, tags="hp_bar")
+                    self.draw_item((prefix, "bench_hp_text", i), "text", (x_pos, text_y),
+                                   text=f"{pokemon['name']}\n{hp}/{max_hp} HP", fill="white", font=("Arial", 10),
+                                   tags="hp_text", anchor=tk.CENTER, justify=tk.CENTER)
+            except Exception as e:
+                self.log_error(f"Error updating {prefix.upper()} bench HP: {str(e)}")
+
     def update_discard_piles(self):
         """Update the discard pile display"""
         try:
@@ -640,3095 +1220,42 @@ class BattleGUI:
                 # Show the top card of the discard pile
                 top_card = self.player1.discard_pile[-1]
                 try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p1_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
+                    card_photo = self.card_images.get(top_card['name'], (50, 50))
+                    self.draw_item("p1_discard_image", "image", (175, 600), image=card_photo, anchor=tk.CENTER, tags="discard_pile")
+                    self.draw_item("p1_discard_text", "text", (175, 630), text=f"Discard ({len(self.player1.discard_pile)})", 
+                                   fill="white", font=("Arial", 10), tags="discard_pile")
                 except Exception as e:
                     self.log_error(f"Error updating P1 discard pile: {str(e)}")
+            else:
+                self.hide_item("p1_discard_image")
+                self.hide_item("p1_discard_text")
             
             # Player 2 discard pile
             if self.player2.discard_pile:
                 # Show the top card of the discard pile
                 top_card = self.player2.discard_pile[-1]
                 try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p2_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
+                    card_photo = self.card_images.get(top_card['name'], (50, 50))
+                    self.draw_item("p2_discard_image", "image", (175, 100), image=card_photo, anchor=tk.CENTER, tags="discard_pile")
+                    self.draw_item("p2_discard_text", "text", (175, 130), text=f"Discard ({len(self.player2.discard_pile)})", 
+                                   fill="white", font=("Arial", 10), tags="discard_pile")
                 except Exception as e:
                     self.log_error(f"Error updating P2 discard pile: {str(e)}")
+            else:
+                self.hide_item("p2_discard_image")
+                self.hide_item("p2_discard_text")
         except Exception as e:
             self.log_error(f"Error updating discard piles: {str(e)}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pokémon TCG AI Battle")
+    parser.add_argument("--silent", action="store_true", help="run without sound")
+    parser.add_argument("--startup-report", action="store_true", help="print per-phase startup timings")
+    parser.add_argument("--profile-turns", metavar="RANGE", type=parse_turn_range, default=None, help="profile turns RANGE (e.g. 10-20) of each match")
+    parser.add_argument("--log-lines", type=int, default=BATTLE_LOG_MAX_LINES,
+                        help="lines kept in the battle log widget, the log file keeps everything")
+    args = parser.parse_args()
     root = tk.Tk()
-    app = BattleGUI(root)
+    app = BattleGUI(root, sound=not args.silent, startup_report=args.startup_report, profile_turns=args.profile_turns,
+                    log_lines=args.log_lines)
     root.mainloop()
-``````
-</copilot-edited-file>  ## The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:
-
-```python
-import tkinter as tk
-from tkinter import scrolledtext, Canvas, PhotoImage, messagebox
-import logging
-import random
-import threading
-import sys
-import traceback
-import time
-from PIL import Image, ImageTk
-import pygame
-from collections import defaultdict
-
-# Import game components
-from src.card import standard_pokemon_cards, standard_trainer_cards
-from src.player_utils import Player, Game
-
-IMAGE_FOLDER = "src/images/gui/"
-CARD_IMAGE_FOLDER = "src/images/cards/"
-SOUND_FOLDER = "sounds/"
-
-class BattleGUI:
-    def __init__(self, root):    def __init__(self, root):
-        try:
-            self.root = root
-            self.root.title("Pokémon TCG AI Battle")
-            self.root.geometry("1920x1080")
-            self.root.configure(bg="black")
-            self.root.state("zoomed")
-
-            self.simulation_running = False
-            self.card_images = {}
-
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            self.main_frame = tk.Frame(self.root, bg="black")
-            self.main_frame.pack(expand=True, fill=tk.BOTH)
-            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")
-            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)
-            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")
-            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)
-            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.match_frame.pack(pady=5)
-            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")
-            self.match_label.pack(side=tk.LEFT, padx=10)
-            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
-            self.match_entry.pack(side=tk.LEFT)
-            self.match_entry.insert(0, "1")
-            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.button_frame.pack(pady=10)
-            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
-            self.start_button.pack(side=tk.LEFT, padx=10)
-            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
-            self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
-            self.exit_button.pack(side=tk.LEFT, padx=10)
-            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
-            self.battle_log_label.pack(pady=5)
-            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
-            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
-            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
-            self.error_log_label.pack(pady=5)
-            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")
-            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)
-
-            # Add frames for player decks
-            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p1.pack(pady=5)
-            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p2.pack(pady=5)
-
-            # Define areas on the game board
-            self.define_areas()
-
-            # Add background image to battle_canvas
-            try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-            except FileNotFoundError as e:
-                self.log_error(f"Background image not found: {e}. Continuing without background image.")
-            except Exception as e:
-                self.log_error(f"Error loading background image: {e}. Continuing without background image.")
-
-            sys.stderr = self.ErrorLogger(self)
-            self.log_message("✅ GUI Initialized Successfully.")
-        except Exception as e:
-            print(f"GUI Init Error: {str(e)}")
-            traceback.print_exc()
-
-    def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
-
-    def load_deck_images(self, deck, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        for card in deck:
-            try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
-                card_label = tk.Label(frame, image=card_photo, bg="black")
-                card_label.image = card_photo
-                card_label.pack(side=tk.LEFT, padx=2)
-            except FileNotFoundError as e:
-                self.log_message(f"❌ Deck Image Load Error: {e}")
-            except Exception as e:
-                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
-
-    def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
-        # Update Active Pokémon HP bars
-        try:
-            # Player 1 active Pokémon HP bar
-            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:
-                p1_hp = max(0, self.player1.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))
-                p1_width = int((p1_hp / p1_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p1_hp / p1_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p1_hp / p1_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P1 active HP bar: {str(e)}")
-        
-        try:
-            # Player 2 active Pokémon HP bar
-            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:
-                p2_hp = max(0, self.player2.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))
-                p2_width = int((p2_hp / p2_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p2_hp / p2_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p2_hp / p2_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P2 active HP bar: {str(e)}")
-            
-        # Update Bench Pokémon HP Displays
-        try:
-            # Player 1 bench HP displays
-            for i, pokemon in enumerate(self.player1.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar below each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench HP: {str(e)}")
-            
-        try:
-            # Player 2 bench HP displays
-            for i, pokemon in enumerate(self.player2.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar above each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench HP: {str(e)}")
-
-    def log_message(self, message):
-        self.battle_log.insert(tk.END, message + "\n")
-        self.battle_log.yview(tk.END)
-
-    def log_error(self, message):
-        self.error_log.insert(tk.END, "❌ " + message + "\n")
-        self.error_log.yview(tk.END)
-
-    class ErrorLogger:
-        def __init__(self, gui):
-            self.gui = gui
-
-        def write(self, message):
-            if message.strip():
-                self.gui.log_error(message)
-
-        def flush(self):
-            pass
-
-    def run_battle(self, num_matches):
-        try:
-            for match in range(num_matches):
-                if not self.simulation_running:
-                    break
-                
-                self.log_message(f"⚡ Match {match + 1} Begins!")
-                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))
-                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))
-                
-                # Setup prize cards (6 for each player)
-                if self.player1.deck:
-                    self.player1.prize_cards = self.player1.deck[:6]
-                    self.player1.deck = self.player1.deck[6:]
-                
-                if self.player2.deck:
-                    self.player2.prize_cards = self.player2.deck[:6]
-                    self.player2.deck = self.player2.deck[6:]
-                
-                # Initialize game
-                self.game = Game(self.player1, self.player2, ai_enabled=True)
-                
-                # Initial setup
-                self.update_battle_display()
-                
-                # Draw initial hands (7 cards)
-                self.player1.draw_cards(7)
-                self.player2.draw_cards(7)
-                
-                # Show hands
-                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")
-                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")
-
-                # Game loop
-                while not self.game.is_over():
-                    current_player = self.game.players[self.game.turn % 2]
-                    result = self.game.play_turn(current_player)
-                    
-                    # Update the battle display after each turn
-                    self.update_battle_display()
-                    
-                    # Log each action from the action log
-                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")
-                    for action in current_player.action_log:
-                        self.log_message(f"  ▶️ {action}")
-                    
-                    time.sleep(1)
-                    
-                    if result:
-                        break
-                
-                # Final update of the display
-                self.update_battle_display()
-                
-                # Determine winner
-                if self.player1.active_pokemon is None and not self.player1.bench:
-                    winner = self.player2.name
-                elif self.player2.active_pokemon is None and not self.player2.bench:
-                    winner = self.player1.name
-                else:
-                    winner = self.game.players[self.game.turn % 2].name
-                    
-                self.log_message(f"🏆 {winner} Wins the Battle!")
-                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")
-                pygame.mixer.music.play()
-                
-        except Exception as e:
-            self.log_error(f"Battle Error: {str(e)}")
-            traceback.print_exc()
-
-    def create_deck(self, card_pool, deck_size):
-        if not card_pool:
-            raise ValueError("Card pool is empty. Cannot create a deck.")
-        if len(card_pool) >= deck_size:
-            return random.sample(card_pool, deck_size)
-        else:
-            deck = card_pool * (deck_size // len(card_pool))
-            deck += random.sample(card_pool, deck_size % len(card_pool))
-            return deck
-
-    def stop_battle(self):
-        """Completely stop the battle and reset the game state"""
-        self.simulation_running = False
-        
-        try:
-            # Play stop sound
-            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")
-            pygame.mixer.music.play()
-        except Exception as e:
-            self.log_error(f"Error playing sound: {str(e)}")
-        
-        # Clear the battle canvas
-        self.battle_canvas.delete("all")
-        
-        # Reset game state
-        self.player1 = None
-        self.player2 = None
-        self.game = None
-        
-        # Redraw the game areas
-        self.define_areas()
-        
-        # Try to reload the background image
-        try:
-            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-            background_image = background_image.resize((1200, 700), Image.LANCZOS)
-            self.background_image = ImageTk.PhotoImage(background_image)
-            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-        except Exception:
-            # If background fails to load, create a plain black background
-            pass
-        
-        # Display stop message on the battle canvas
-        self.battle_canvas.create_text(
-            600, 350, 
-            text="BATTLE STOPPED", 
-            font=("Arial", 36, "bold"), 
-            fill="red"
-        )
-        
-        # Clear the deck frames
-        for widget in self.deck_frame_p1.winfo_children():
-            widget.destroy()
-        for widget in self.deck_frame_p2.winfo_children():
-            widget.destroy()
-        
-        # Log message
-        self.log_message("🛑 AI Battle Stopped!")
-        self.log_message("Click 'Start Battle' to begin a new battle.")
-
-    def start_battle(self):
-        try:
-            self.simulation_running = True
-            self.battle_log.delete(1.0, tk.END)
-            self.error_log.delete(1.0, tk.END)
-            self.log_message("⚔️ AI Battle Started!")
-            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")
-            pygame.mixer.music.play()
-            num_matches = int(self.match_entry.get())
-            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))
-            battle_thread.start()
-        except Exception as e:
-            self.log_error(f"Start Battle Error: {str(e)}")
-
-    def create_area(self, x1, y1, x2, y2, label):
-        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")
-        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))
-
-    def define_areas(self):
-        # Player 1 areas (bottom player)
-        self.create_area(50, 550, 100, 650, "Deck P1")
-        self.create_area(150, 550, 200, 650, "Discard P1")
-        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")
-        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")
-        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")
-        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")
-        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")
-        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")
-        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")
-        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")
-        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")
-        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")
-        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")
-        self.create_area(350, 550, 800, 650, "Hand P1")
-        self.create_area(850, 450, 900, 550, "Lost Zone P1")
-        self.create_area(1050, 450, 1100, 550, "Stadium P1")
-        self.create_area(500, 350, 600, 450, "Active P1")
-        # Player 2 areas (top player, mirrored)
-        self.create_area(50, 50, 100, 150, "Deck P2")
-        self.create_area(150, 50, 200, 150, "Discard P2")
-        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")
-        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")
-        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")
-        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")
-        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")
-        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")
-        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")
-        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")
-        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")
-        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")
-        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")
-        self.create_area(350, 150, 800, 250, "Hand P2")
-        self.create_area(850, 50, 900, 150, "Lost Zone P2")
-        self.create_area(1050, 50, 1100, 150, "Stadium P2")
-        self.create_area(500, 250, 600, 350, "Active P2")
-
-    def update_battle_display(self):
-        """Update the entire battle display"""
-        # Clear previous elements
-        self.battle_canvas.delete("pokemon_image")
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("discard_pile")
-        self.battle_canvas.delete("prize_card")
-        self.battle_canvas.delete("deck_display")
-        
-        # Update active Pokemon images
-        self.load_pokemon_images(
-            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",
-            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"
-        )
-        
-        # Update HP bars
-        self.update_hp_bars()
-        
-        # Update discard piles
-        self.update_discard_piles()
-        
-        # Update prize cards
-        self.update_prize_cards()
-        
-        # Update decks
-        self.update_deck_display()
-        
-        # Update bench Pokemon
-        self.update_bench()
-
-    def update_prize_cards(self):
-        """Display prize cards on the game board"""
-        try:
-            # Create a solid color rectangle instead of loading an image
-            self.battle_canvas.delete("prize_card")  # Clear existing prize cards
-            
-            # Define the dimensions of our prize card rectangle
-            card_width = 40
-            card_height = 60
-            
-            # Player 1 prize cards (6 slots)
-            prize_slots_p1 = [
-                (75, 100),  # Prize P1 Slot 1
-                (175, 100), # Prize P1 Slot 2
-                (75, 200),  # Prize P1 Slot 3
-                (175, 200), # Prize P1 Slot 4
-                (75, 300),  # Prize P1 Slot 5
-                (175, 300)  # Prize P1 Slot 6
-            ]
-            
-            # Player 2 prize cards (6 slots)
-            prize_slots_p2 = [
-                (75, 600),  # Prize P2 Slot 1
-                (175, 600), # Prize P2 Slot 2
-                (75, 500),  # Prize P2 Slot 3
-                (175, 500), # Prize P2 Slot 4
-                (75, 400),  # Prize P2 Slot 5
-                (175, 400)  # Prize P2 Slot 6
-            ]
-            
-            # Display the prize card backs and count for each player
-            # For Player 1
-            p1_prize_count = min(6, len(self.player1.prize_cards))  # Maximum of 6 prize cards
-            for i in range(p1_prize_count):
-                x, y = prize_slots_p1[i]
-                # Draw a blue rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card_width/2, y - card_height/2,
-                    x + card_width/2, y + card_height/2,
-                    fill="blue", outline="white", tags="prize_card"
-                )
-            
-            # Show prize count
-            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-            
-            # For Player 2
-            p2_prize_count = min(6, len(self.player2.prize_cards))  # Maximum of 6 prize cards
-            for i in range(p2_prize_count):
-                x, y = prize_slots_p2[i]
-                # Draw a red rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card_width/2, y - card_height/2,
-                    x + card_width/2, y + card_height/2,
-                    fill="red", outline="white", tags="prize_card"
-                )
-                
-            # Show prize count
-            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-        except Exception as e:
-            self.log_error(f"Error updating prize cards: {str(e)}")
-
-    def update_deck_display(self):
-        """Display decks on the game board"""
-        try:
-            # Clear previous deck display
-            self.battle_canvas.delete("deck_display")
-            
-            # Define card dimensions
-            card_width = 40
-            card_height = 60
-            
-            # Player 1 deck
-            if self.player1.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player1.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a blue rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card_width/2, (600 - offset) - card_height/2,
-                        (75 + offset) + card_width/2, (600 - offset) + card_height/2,
-                        fill="blue", outline="white", tags="deck_display"
-                    )
-                
-                # Show deck count
-                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-            
-            # Player 2 deck
-            if self.player2.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player2.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a red rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card_width/2, (100 - offset) - card_height/2,
-                        (75 + offset) + card_width/2, (100 - offset) + card_height/2,
-                        fill="red", outline="white", tags="deck_display"
-                    )
-                    
-                # Show deck count
-                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-        except Exception as e:
-            self.log_error(f"Error updating deck display: {str(e)}")
-
-    def update_bench(self):
-        """Update the bench Pokemon display"""
-        # Clear previous bench images
-        self.battle_canvas.delete("bench_image")
-        
-        # Player 1 bench
-        try:
-            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p1_bench_images'):
-                        self.p1_bench_images = []
-                    while len(self.p1_bench_images) <= i:
-                        self.p1_bench_images.append(None)
-                    self.p1_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench: {str(e)}")
-        
-        # Player 2 bench
-        try:
-            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p2_bench_images'):
-                        self.p2_bench_images = []
-                    while len(self.p2_bench_images) <= i:
-                        self.p2_bench_images.append(None)
-                    self.p2_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench: {str(e)}")
-
-    def update_discard_piles(self):
-        """Update the discard pile display"""
-        try:
-            # Player 1 discard pile
-            if self.player1.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player1.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p1_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P1 discard pile: {str(e)}")
-            
-            # Player 2 discard pile
-            if self.player2.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player2.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p2_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P2 discard pile: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating discard piles: {str(e)}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = BattleGUI(root)
-    root.mainloop()
-```
-
-
-The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:
-
-```python
-import tkinter as tk
-from tkinter import scrolledtext, Canvas, PhotoImage, messagebox
-import logging
-import random
-import threading
-import sys
-import traceback
-import time
-from PIL import Image, ImageTk
-import pygame
-from collections import defaultdict
-
-# Import game components
-from src.card import standard_pokemon_cards, standard_trainer_cards
-from src.player_utils import Player, Game
-
-IMAGE_FOLDER = "src/images/gui/"
-CARD_IMAGE_FOLDER = "src/images/cards/"
-SOUND_FOLDER = "sounds/"
-
-class BattleGUI:
-    def __init__(self, root):
-        try:
-            self.root = root
-            self.root.title("Pokémon TCG AI Battle")
-            self.root.geometry("1920x1080")
-            self.root.configure(bg="black")
-            self.root.state("zoomed")
-
-            self.simulation_running = False
-            self.card_images = {}
-
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            self.main_frame = tk.Frame(self.root, bg="black")
-            self.main_frame.pack(expand=True, fill=tk.BOTH)
-            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")
-            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)
-            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")
-            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)
-            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.match_frame.pack(pady=5)
-            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")
-            self.match_label.pack(side=tk.LEFT, padx=10)
-            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
-            self.match_entry.pack(side=tk.LEFT)
-            self.match_entry.insert(0, "1")
-            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.button_frame.pack(pady=10)
-            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
-            self.start_button.pack(side=tk.LEFT, padx=10)
-            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
-            self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
-            self.exit_button.pack(side=tk.LEFT, padx=10)
-            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
-            self.battle_log_label.pack(pady=5)
-            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
-            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
-            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
-            self.error_log_label.pack(pady=5)
-            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")
-            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)
-
-            # Add frames for player decks
-            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p1.pack(pady=5)
-            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p2.pack(pady=5)
-
-            # Define areas on the game board
-            self.define_areas()
-
-            # Add background image to battle_canvas
-            try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-            except FileNotFoundError as e:
-                self.log_error(f"Background image not found: {e}. Continuing without background image.")
-            except Exception as e:
-                self.log_error(f"Error loading background image: {e}. Continuing without background image.")
-
-            sys.stderr = self.ErrorLogger(self)
-            self.log_message("✅ GUI Initialized Successfully.")
-        except Exception as e:
-            print(f"GUI Init Error: {str(e)}")
-            traceback.print_exc()
-
-    def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
-
-    def load_deck_images(self, deck, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        for card in deck:
-            try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
-                card_label = tk.Label(frame, image=card_photo, bg="black")
-                card_label.image = card_photo
-                card_label.pack(side=tk.LEFT, padx=2)
-            except FileNotFoundError as e:
-                self.log_message(f"❌ Deck Image Load Error: {e}")
-            except Exception as e:
-                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
-
-    def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
-        # Update Active Pokémon HP bars
-        try:
-            # Player 1 active Pokémon HP bar
-            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:
-                p1_hp = max(0, self.player1.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))
-                p1_width = int((p1_hp / p1_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p1_hp / p1_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p1_hp / p1_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P1 active HP bar: {str(e)}")
-        
-        try:
-            # Player 2 active Pokémon HP bar
-            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:
-                p2_hp = max(0, self.player2.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))
-                p2_width = int((p2_hp / p2_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p2_hp / p2_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p2_hp / p2_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P2 active HP bar: {str(e)}")
-            
-        # Update Bench Pokémon HP Displays (similar to before)
-        try:
-            # Player 1 bench HP displays
-            for i, pokemon in enumerate(self.player1.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar below each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench HP: {str(e)}")
-            
-        try:
-            # Player 2 bench HP displays
-            for i, pokemon in enumerate(self.player2.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar above each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench HP: {str(e)}")
-
-    def log_message(self, message):
-        self.battle_log.insert(tk.END, message + "\n")
-        self.battle_log.yview(tk.END)
-
-    def log_error(self, message):
-        self.error_log.insert(tk.END, "❌ " + message + "\n")
-        self.error_log.yview(tk.END)
-
-    class ErrorLogger:
-        def __init__(self, gui):
-            self.gui = gui
-
-        def write(self, message):
-            if message.strip():
-                self.gui.log_error(message)
-
-        def flush(self):
-            pass
-
-    def run_battle(self, num_matches):
-        try:
-            for match in range(num_matches):
-                if not self.simulation_running:
-                    break
-                
-                self                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")                pygame.mixer.music.play()                        except Exception as e:            self.log_error(f"Battle Error: {str(e)}")            traceback.print_exc()    def create_deck(self, card_pool, deck_size):        if not card_pool:            raise ValueError("Card pool is empty. Cannot create a deck.")        if len(card_pool) >= deck_size:            return random.sample(card_pool, deck_size)        else:            deck = card_pool * (deck_size // len(card_pool))            deck += random.sample(card_pool, deck_size % len(card_pool))            return deck    def stop_battle(self):        """Completely stop the battle and reset the game state"""        self.simulation_running = False                try:            # Play stop sound            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")            pygame.mixer.music.play()        except Exception as e:            self.log_error(f"Error playing sound: {str(e)}")                # Clear the battle canvas        self.battle_canvas.delete("all")                # Reset game state        self.player1 = None        self.player2 = None        self.game = None                # Redraw the game areas        self.define_areas()                # Try to reload the background image        try:            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")            background_image = background_image.resize((1200, 700), Image.LANCZOS)            self.background_image = ImageTk.PhotoImage(background_image)            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)        except Exception:            # If background fails to load, create a plain black background            pass                # Display stop message on the battle canvas        self.battle_canvas.create_text(            600, 350,             text="BATTLE STOPPED",             font=("Arial", 36, "bold"),             fill="red"        )                # Clear the deck frames        for widget in self.deck_frame_p1.winfo_children():            widget.destroy()        for widget in self.deck_frame_p2.winfo_children():            widget.destroy()                # Log message        self.log_message("🛑 AI Battle Stopped!")        self.log_message("Click 'Start Battle' to begin a new battle.")    def start_battle(self):        try:            self.simulation_running = True            self.battle_log.delete(1.0, tk.END)            self.error_log.delete(1.0, tk.END)            self.log_message("⚔️ AI Battle Started!")            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")            pygame.mixer.music.play()            num_matches = int(self.match_entry.get())            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))            battle_thread.start()        except Exception as e:            self.log_error(f"Start Battle Error: {str(e)}")    def create_area(self, x1, y1, x2, y2, label):        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))    def define_areas(self):        # Player 1 areas (bottom player)        self.create_area(50, 550, 100, 650, "Deck P1")        self.create_area(150, 550, 200, 650, "Discard P1")        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")        self.create_area(350, 550, 800, 650, "Hand P1")        self.create_area(850, 450, 900, 550, "Lost Zone P1")        self.create_area(1050, 450, 1100, 550, "Stadium P1")        self.create_area(500, 350, 600, 450, "Active P1")        # Player 2 areas (top player, mirrored)        self.create_area(50, 50, 100, 150, "Deck P2")        self.create_area(150, 50, 200, 150, "Discard P2")        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")        self.create_area(350, 150, 800, 250, "Hand P2")        self.create_area(850, 50, 900, 150, "Lost Zone P2")        self.create_area(1050, 50, 1100, 150, "Stadium P2")        self.create_area(500, 250, 600, 350, "Active P2")    def update_battle_display(self):        """Update the entire battle display"""        # Clear previous elements        self.battle_canvas.delete("pokemon_image")        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("discard_pile")        self.battle_canvas.delete("prize_card")        self.battle_canvas.delete("deck_display")                # Update active Pokemon images        self.load_pokemon_images(            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"        )                # Update HP bars        self.update_hp_bars()                # Update discard piles        self.update_discard_piles()                # Update prize cards        self.update_prize_cards()                # Update decks        self.update_deck_display()                # Update bench Pokemon        self.update_bench()    def update_prize_cards(self):        """Display prize cards on the game board"""        try:            # Create a solid color rectangle instead of loading an image            self.battle_canvas.delete("prize_card")  # Clear existing prize cards                        # Define the dimensions of our prize card rectangle            card_width = 40            card_height = 60                        # Player 1 prize cards (6 slots)            prize_slots_p1 = [                (75, 100),  # Prize P1 Slot 1                (175, 100), # Prize P1 Slot 2                (75, 200),  # Prize P1 Slot 3                (175, 200), # Prize P1 Slot 4                (75, 300),  # Prize P1 Slot 5                (175, 300)  # Prize P1 Slot 6            ]                        # Player 2 prize cards (6 slots)            prize_slots_p2 = [                (75, 600),  # Prize P2 Slot 1                (175, 600), # Prize P2 Slot 2                (75, 500),  # Prize P2 Slot 3                (175, 500), # Prize P2 Slot 4                (75, 400),  # Prize P2 Slot 5                (175, 400)  # Prize P2 Slot 6            ]                        # Display the prize card backs and count for each player            # For Player 1            p1_prize_count = min(6, len(self.player1.prize_cards))  # Maximum of 6 prize cards            for i in range(p1_prize_count):                x, y = prize_slots_p1[i]                # Draw a blue rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card_width/2, y - card_height/2,                    x + card_width/2, y + card.height/2,                    fill="blue", outline="white", tags="prize_card"                )                        # Show prize count            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")                        # For Player 2            p2_prize_count = min(6, len(self.player2.prize_cards))  # Maximum of 6 prize cards            for i in range(p2_prize_count):                x, y = prize_slots_p2[i]                # Draw a red rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card_width/2, y - card_height/2,                    x + card_width/2, y + card.height/2,                    fill="red", outline="white", tags="prize_card"                )                            # Show prize count            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")        except Exception as e:            self.log_error(f"Error updating prize cards: {str(e)}")    def update_deck_display(self):        """Display decks on the game board"""        try:            # Clear previous deck display            self.battle_canvas.delete("deck_display")                        # Define card dimensions            card_width = 40            card_height = 60                        # Player 1 deck            if self.player1.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player1.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a blue rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card_width/2, (600 - offset) - card_height/2,                        (75 + offset) + card_width/2, (600 - offset) + card.height/2,                        fill="blue", outline="white", tags="deck_display"                    )                                # Show deck count                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")                        # Player 2 deck            if self.player2.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player2.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a red rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card_width/2, (100 - offset) - card_height/2,                        (75 + offset) + card_width/2, (100 - offset) + card.height/2,                        fill="red", outline="white", tags="deck_display"                    )                                    # Show deck count                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")        except Exception as e:            self.log_error(f"Error updating deck display: {str(e)}")    def update_bench(self):        """Update the bench Pokemon display"""        # Clear previous bench images        self.battle_canvas.delete("bench_image")                # Player 1 bench        try:            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p1_bench_images'):                        self.p1_bench_images = []                    while len(self.p1_bench_images) <= i:                        self.p1_bench_images.append(None)                    self.p1_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P1 bench: {str(e)}")                # Player 2 bench        try:            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p2_bench_images'):                        self.p2_bench_images = []                    while len(self.p2_bench_images) <= i:                        self.p2_bench_images.append(None)                    self.p2_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P2 bench: {str(e)}")    def update_discard_piles(self):        """Update the discard pile display"""        try:            # Player 1 discard pile            if self.player1.discard_pile:                # Show the top card of the discard pile                top_card = self.player1.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p1_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P1 discard pile: {str(e)}")                        # Player 2 discard pile            if self.player2.discard_pile:                # Show the top card of the discard pile                top_card = self.player2.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p2_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P2 discard pile: {str(e)}")        except Exception as e:            self.log_error(f"Error updating discard piles: {str(e)}")if __name__ == "__main__":    root = tk.Tk()    app = BattleGUI(root)    root.mainloop()```The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:```pythonimport tkinter as tkfrom tkinter import scrolledtext, Canvas, PhotoImage, messageboximport loggingimport randomimport threadingimport sysimport tracebackimport timefrom PIL import Image, ImageTkimport pygamefrom collections import defaultdict# Import game componentsfrom src.card import standard_pokemon_cards, standard_trainer_cardsfrom src.player_utils import Player, GameIMAGE_FOLDER = "src/images/gui/"CARD_IMAGE_FOLDER = "src/images/cards/"SOUND_FOLDER = "sounds/"class BattleGUI:    def __init__(self, root):        try:            self.root = root            self.root.title("Pokémon TCG AI Battle")            self.root.geometry("1920x1080")            self.root.configure(bg="black")            self.root.state("zoomed")            self.simulation_running = False            self.card_images = {}            # Initialize pygame mixer            pygame.mixer.init()            self.main_frame = tk.Frame(self.root, bg="black")            self.main_frame.pack(expand=True, fill=tk.BOTH)            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")            self.match_frame.pack(pady=5)            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")            self.match_label.pack(side=tk.LEFT, padx=10)            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)            self.match_entry.pack(side=tk.LEFT)            self.match_entry.insert(0, "1")            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")            self.button_frame.pack(pady=10)            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")            self.start_button.pack(side=tk.LEFT, padx=10)            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")            self.stop_button.pack(side=tk.LEFT, padx=10)            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")            self.exit_button.pack(side=tk.LEFT, padx=10)            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")            self.battle_log_label.pack(pady=5)            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")            self.error_log_label.pack(pady=5)            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)            # Add frames for player decks            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p1.pack(pady=5)            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p2.pack(pady=5)            # Define areas on the game board            self.define_areas()            # Add background image to battle_canvas            try:                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")                background_image = background_image.resize((1200, 700), Image.LANCZOS)                self.background_image = ImageTk.PhotoImage(background_image)                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)            except FileNotFoundError as e:                self.log_error(f"Background image not found: {e}. Continuing without background image.")            except Exception as e:                self.log_error(f"Error loading background image: {e}. Continuing without background image.")            sys.stderr = self.ErrorLogger(self)            self.log_message("✅ GUI Initialized Successfully.")        except Exception as e:            print(f"GUI Init Error: {str(e)}")            traceback.print_exc()    def load_pokemon_images(self, p1_pokemon, p2_pokemon):        try:            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))            self.p1_photo = ImageTk.PhotoImage(p1_image)            self.p2_photo = ImageTk.PhotoImage(p2_image)            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)        except FileNotFoundError as e:            self.log_message(f"❌ Image Load Error: {e}")        except Exception as e:            self.log_message(f"❌ Unexpected Error Loading Image: {e}")    def load_deck_images(self, deck, frame):        for widget in frame.winfo_children():            widget.destroy()        for card in deck:            try:                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))                card_photo = ImageTk.PhotoImage(card_image)                card_label = tk.Label(frame, image=card_photo, bg="black")                card_label.image = card_photo                card_label.pack(side=tk.LEFT, padx=2)            except FileNotFoundError as e:                self.log_message(f"❌ Deck Image Load Error: {e}")            except Exception as e:                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")    def update_hp_bars(self):        # Clear existing HP bars and related visuals        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("status_effect")                # Update Active Pokémon HP bars        try:            # Player 1 active Pokémon HP bar            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:                p1_hp = max(0, self.player1.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))                p1_width = int((p1_hp / p1_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p1_hp / p1_max_hp <= 0.5:                    bar_color = "yellow"                if p1_hp / p1_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P1 active HP bar: {str(e)}")                try:            # Player 2 active Pokémon HP bar            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:                p2_hp = max(0, self.player2.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))                p2_width = int((p2_hp / p2_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p2_hp / p2_max_hp <= 0.5:                    bar_color = "yellow"                if p2_hp / p2_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P2 active HP bar: {str(e)}")                    # Update Bench Pokémon HP Displays (similar to before)        try:            # Player 1 bench HP displays            for i, pokemon in enumerate(self.player1.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar below each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P1 bench HP: {str(e)}")                    try:            # Player 2 bench HP displays            for i, pokemon in enumerate(self.player2.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar above each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P2 bench HP: {str(e)}")    def log_message(self, message):        self.battle_log.insert(tk.END, message + "\n")        self.battle_log.yview(tk.END)    def log_error(self, message):        self.error_log.insert(tk.END, "❌ " + message + "\n")        self.error_log.yview(tk.END)    class ErrorLogger:        def __init__(self, gui):            self.gui = gui        def write(self, message):            if message.strip():                self.gui.log_error(message)        def flush(self):            pass    def run_battle(self, num_matches):        try:            for match in range(num_matches):                if not self.simulation_running:                    break                                self.log_message(f"⚡ Match {match + 1} Begins!")                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))                                # Setup prize cards (6 for each player)                if self.player1.deck:                    self.player1.prize_cards = self.player1.deck[:6]                    self.player1.deck = self.player1.deck[6:]                                if self.player2.deck:                    self.player2.prize_cards = self.player2.deck[:6]                    self.player2.deck = self.player2.deck[6:]                                # Initialize game                self.game = Game(self.player1, self.player2, ai_enabled=True)                                # Initial setup                self.update_battle_display()                                # Draw initial hands (7 cards)                self.player1.draw_cards(7)                self.player2.draw_cards(7)                                # Show hands                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")                # Game loop                while not self.game.is_over():                    current_player = self.game.players[self.game.turn % 2]                    result = self.game.play_turn(current_player)                                        # Update the battle display after each turn                    self.update_battle_display()                                        # Log each action from the action log                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")                    for action in current_player.action_log:                        self.log_message(f"  ▶️ {action}")                                        time.sleep(1)                                        if result:                        break                                # Final update of the display                self.update_battle_display()                                # Determine winner                if self.player1.active_pokemon is None and not self.player1.bench:                    winner = self.player2.name                elif self.player2.active_pokemon is None and not self.player2.bench:                    winner = self.player1.name                else:                    winner = self.game.players[self.game.turn % 2].name                                    self.log_message(f"🏆 {winner} Wins the Battle!")                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")                pygame.mixer.music.play()                        except Exception as e:            self.log_error(f"Battle Error: {str(e)}")            traceback.print_exc()    def create_deck(self, card_pool, deck_size):        if not card_pool:            raise ValueError("Card pool is empty. Cannot create a deck.")        if len(card_pool) >= deck_size:            return random.sample(card_pool, deck_size)        else:            deck = card_pool * (deck_size // len(card_pool))            deck += random.sample(card_pool, deck_size % len(card_pool))            return deck    def stop_battle(self):        """Completely stop the battle and reset the game state"""        self.simulation_running = False                try:            # Play stop sound            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")            pygame.mixer.music.play()        except Exception as e:            self.log_error(f"Error playing sound: {str(e)}")                # Clear the battle canvas        self.battle_canvas.delete("all")                # Reset game state        self.player1 = None        self.player2 = None        self.game = None                # Redraw the game areas        self.define_areas()                # Try to reload the background image        try:            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")            background_image = background_image.resize((1200, 700), Image.LANCZOS)            self.background_image = ImageTk.PhotoImage(background_image)            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)        except Exception:            # If background fails to load, create a plain black background            pass                # Display stop message on the battle canvas        self.battle_canvas.create_text(            600, 350,             text="BATTLE STOPPED",             font=("Arial", 36, "bold"),             fill="red"        )                # Clear the deck frames        for widget in self.deck_frame_p1.winfo_children():            widget.destroy()        for widget in self.deck_frame_p2.winfo_children():            widget.destroy()                # Log message        self.log_message("🛑 AI Battle Stopped!")        self.log_message("Click 'Start Battle' to begin a new battle.")    def start_battle(self):        try:            self.simulation_running = True            self.battle_log.delete(1.0, tk.END)            self.error_log.delete(1.0, tk.END)            self.log_message("⚔️ AI Battle Started!")            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")            pygame.mixer.music.play()            num_matches = int(self.match_entry.get())            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))            battle_thread.start()        except Exception as e:            self.log_error(f"Start Battle Error: {str(e)}")    def create_area(self, x1, y1, x2, y2, label):        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))    def define_areas(self):        # Player 1 areas (bottom player)        self.create_area(50, 550, 100, 650, "Deck P1")        self.create_area(150, 550, 200, 650, "Discard P1")        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")        self.create_area(350, 550, 800, 650, "Hand P1")        self.create_area(850, 450, 900, 550, "Lost Zone P1")        self.create_area(1050, 450, 1100, 550, "Stadium P1")        self.create_area(500, 350, 600, 450, "Active P1")        # Player 2 areas (top player, mirrored)        self.create_area(50, 50, 100, 150, "Deck P2")        self.create_area(150, 50, 200, 150, "Discard P2")        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")        self.create_area(350, 150, 800, 250, "Hand P2")        self.create_area(850, 50, 900, 150, "Lost Zone P2")        self.create_area(1050, 50, 1100, 150, "Stadium P2")        self.create_area(500, 250, 600, 350, "Active P2")    def update_battle_display(self):        """Update the entire battle display"""        # Clear previous elements        self.battle_canvas.delete("pokemon_image")        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("discard_pile")        self.battle_canvas.delete("prize_card")        self.battle_canvas.delete("deck_display")                # Update active Pokemon images        self.load_pokemon_images(            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"        )                # Update HP bars        self.update_hp_bars()                # Update discard piles        self.update_discard_piles()                # Update prize cards        self.update_prize_cards()                # Update decks        self.update_deck_display()                # Update bench Pokemon        self.update_bench()    def update_prize_cards(self):        """Display prize cards on the game board"""        try:            # Create a solid color rectangle instead of loading an image            self.battle_canvas.delete("prize_card")  # Clear existing prize cards                        # Define the dimensions of our prize card rectangle            card_width = 40            card_height = 60                        # Player 1 prize cards (6 slots)            prize_slots_p1 = [                (75, 100),  # Prize P1 Slot 1                (175, 100), # Prize P1 Slot 2                (75, 200),  # Prize P1 Slot 3                (175, 200), # Prize P1 Slot 4                (75, 300),  # Prize P1 Slot 5                (175, 300)  # Prize P1 Slot 6            ]                        # Player 2 prize cards (6 slots)            prize_slots_p2 = [                (75, 600),  # Prize P2 Slot 1                (175, 600), # Prize P2 Slot 2                (75, 500),  # Prize P2 Slot 3                (175, 500), # Prize P2 Slot 4                (75, 400),  # Prize P2 Slot 5                (175, 400)  # Prize P2 Slot 6            ]                        # Display the prize card backs and count for each player            # For Player 1            p1_prize_count = min(6, len(self.player1.prize_cards))  # Maximum of 6 prize cards            for i in range(p1_prize_count):                x, y = prize_slots_p1[i]                # Draw a blue rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card_width/2, y - card_height/2,                    x + card_width/2, y + card.height/2,                    fill="blue", outline="white", tags="prize_card"                )                        # Show prize count            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")                        # For Player 2            p2_prize_count = min(6, len(self.player2.prize_cards))  # Maximum of 6 prize cards            for i in range(p2_prize_count):                x, y = prize_slots_p2[i]                # Draw a red rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card_width/2, y - card_height/2,                    x + card.width/2, y + card.height/2,                    fill="red", outline="white", tags="prize_card"                )                            # Show prize count            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")        except Exception as e:            self.log_error(f"Error updating prize cards: {str(e)}")    def update_deck_display(self):        """Display decks on the game board"""        try:            # Clear previous deck display            self.battle_canvas.delete("deck_display")                        # Define card dimensions            card_width = 40            card_height = 60                        # Player 1 deck            if self.player1.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player1.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a blue rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,                        fill="blue", outline="white", tags="deck_display"                    )                                # Show deck count                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")                        # Player 2 deck            if self.player2.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player2.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a red rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,                        fill="red", outline="white", tags="deck_display"                    )                                    # Show deck count                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")        except Exception as e:            self.log_error(f"Error updating deck display: {str(e)}")    def update_bench(self):        """Update the bench Pokemon display"""        # Clear previous bench images        self.battle_canvas.delete("bench_image")                # Player 1 bench        try:            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p1_bench_images'):                        self.p1_bench_images = []                    while len(self.p1_bench_images) <= i:                        self.p1_bench_images.append(None)                    self.p1_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P1 bench: {str(e)}")                # Player 2 bench        try:            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p2_bench_images'):                        self.p2_bench_images = []                    while len(self.p2_bench_images) <= i:                        self.p2_bench_images.append(None)                    self.p2_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P2 bench: {str(e)}")    def update_discard_piles(self):        """Update the discard pile display"""        try:            # Player 1 discard pile            if self.player1.discard_pile:                # Show the top card of the discard pile                top_card = self.player1.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p1_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P1 discard pile: {str(e)}")                        # Player 2 discard pile            if self.player2.discard_pile:                # Show the top card of the discard pile                top_card = self.player2.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p2_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P2 discard pile: {str(e)}")        except Exception as e:            self.log_error(f"Error updating discard piles: {str(e)}")if __name__ == "__main__":    root = tk.Tk()    app = BattleGUI(root)    root.mainloop()```The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:```pythonimport tkinter as tkfrom tkinter import scrolledtext, Canvas, PhotoImage, messageboximport loggingimport randomimport threadingimport sysimport tracebackimport timefrom PIL import Image, ImageTkimport pygamefrom collections import defaultdict# Import game componentsfrom src.card import standard_pokemon_cards, standard_trainer_cardsfrom src.player_utils import Player, GameIMAGE_FOLDER = "src/images/gui/"CARD_IMAGE_FOLDER = "src/images/cards/"SOUND_FOLDER = "sounds/"class BattleGUI:    def __init__(self, root):        try:            self.root = root            self.root.title("Pokémon TCG AI Battle")            self.root.geometry("1920x1080")            self.root.configure(bg="black")            self.root.state("zoomed")            self.simulation_running = False            self.card_images = {}            # Initialize pygame mixer            pygame.mixer.init()            self.main_frame = tk.Frame(self.root, bg="black")            self.main_frame.pack(expand=True, fill=tk.BOTH)            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")            self.match_frame.pack(pady=5)            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")            self.match_label.pack(side=tk.LEFT, padx=10)            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)            self.match_entry.pack(side=tk.LEFT)            self.match_entry.insert(0, "1")            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")            self.button_frame.pack(pady=10)            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")            self.start_button.pack(side=tk.LEFT, padx=10)            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")            self.stop_button.pack(side=tk.LEFT, padx=10)            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")            self.exit_button.pack(side=tk.LEFT, padx=10)            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")            self.battle_log_label.pack(pady=5)            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")            self.error_log_label.pack(pady=5)            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)            # Add frames for player decks            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p1.pack(pady=5)            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p2.pack(pady=5)            # Define areas on the game board            self.define_areas()            # Add background image to battle_canvas            try:                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")                background_image = background_image.resize((1200, 700), Image.LANCZOS)                self.background_image = ImageTk.PhotoImage(background_image)                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)            except FileNotFoundError as e:                self.log_error(f"Background image not found: {e}. Continuing without background image.")            except Exception as e:                self.log_error(f"Error loading background image: {e}. Continuing without background image.")            sys.stderr = self.ErrorLogger(self)            self.log_message("✅ GUI Initialized Successfully.")        except Exception as e:            print(f"GUI Init Error: {str(e)}")            traceback.print_exc()    def load_pokemon_images(self, p1_pokemon, p2_pokemon):        try:            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))            self.p1_photo = ImageTk.PhotoImage(p1_image)            self.p2_photo = ImageTk.PhotoImage(p2_image)            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)        except FileNotFoundError as e:            self.log_message(f"❌ Image Load Error: {e}")        except Exception as e:            self.log_message(f"❌ Unexpected Error Loading Image: {e}")    def load_deck_images(self, deck, frame):        for widget in frame.winfo_children():            widget.destroy()        for card in deck:            try:                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))                card_photo = ImageTk.PhotoImage(card_image)                card_label = tk.Label(frame, image=card_photo, bg="black")                card_label.image = card_photo                card_label.pack(side=tk.LEFT, padx=2)            except FileNotFoundError as e:                self.log_message(f"❌ Deck Image Load Error: {e}")            except Exception as e:                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")    def update_hp_bars(self):        # Clear existing HP bars and related visuals        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("status_effect")                # Update Active Pokémon HP bars        try:            # Player 1 active Pokémon HP bar            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:                p1_hp = max(0, self.player1.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))                p1_width = int((p1_hp / p1_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p1_hp / p1_max_hp <= 0.5:                    bar_color = "yellow"                if p1_hp / p1_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P1 active HP bar: {str(e)}")                try:            # Player 2 active Pokémon HP bar            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:                p2_hp = max(0, self.player2.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))                p2_width = int((p2_hp / p2_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p2_hp / p2_max_hp <= 0.5:                    bar_color = "yellow"                if p2_hp / p2_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P2 active HP bar: {str(e)}")                    # Update Bench Pokémon HP Displays (similar to before)        try:            # Player 1 bench HP displays            for i, pokemon in enumerate(self.player1.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar below each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P1 bench HP: {str(e)}")                    try:            # Player 2 bench HP displays            for i, pokemon in enumerate(self.player2.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar above each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P2 bench HP: {str(e)}")    def log_message(self, message):        self.battle_log.insert(tk.END, message + "\n")        self.battle_log.yview(tk.END)    def log_error(self, message):        self.error_log.insert(tk.END, "❌ " + message + "\n")        self.error_log.yview(tk.END)    class ErrorLogger:        def __init__(self, gui):            self.gui = gui        def write(self, message):            if message.strip():                self.gui.log_error(message)        def flush(self):            pass    def run_battle(self, num_matches):        try:            for match in range(num_matches):                if not self.simulation_running:                    break                                self.log_message(f"⚡ Match {match + 1} Begins!")                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))                                # Setup prize cards (6 for each player)                if self.player1.deck:                    self.player1.prize_cards = self.player1.deck[:6]                    self.player1.deck = self.player1.deck[6:]                                if self.player2.deck:                    self.player2.prize_cards = self.player2.deck[:6]                    self.player2.deck = self.player2.deck[6:]                                # Initialize game                self.game = Game(self.player1, self.player2, ai_enabled=True)                                # Initial setup                self.update_battle_display()                                # Draw initial hands (7 cards)                self.player1.draw_cards(7)                self.player2.draw_cards(7)                                # Show hands                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")                # Game loop                while not self.game.is_over():                    current_player = self.game.players[self.game.turn % 2]                    result = self.game.play_turn(current_player)                                        # Update the battle display after each turn                    self.update_battle_display()                                        # Log each action from the action log                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")                    for action in current_player.action_log:                        self.log_message(f"  ▶️ {action}")                                        time.sleep(1)                                        if result:                        break                                # Final update of the display                self.update_battle_display()                                # Determine winner                if self.player1.active_pokemon is None and not self.player1.bench:                    winner = self.player2.name                elif self.player2.active_pokemon is None and not self.player2.bench:                    winner = self.player1.name                else:                    winner = self.game.players[self.game.turn % 2].name                                    self.log_message(f"🏆 {winner} Wins the Battle!")                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")                pygame.mixer.music.play()                        except Exception as e:            self.log_error(f"Battle Error: {str(e)}")            traceback.print_exc()    def create_deck(self, card_pool, deck_size):        if not card_pool:            raise ValueError("Card pool is empty. Cannot create a deck.")        if len(card_pool) >= deck_size:            return random.sample(card_pool, deck_size)        else:            deck = card_pool * (deck_size // len(card_pool))            deck += random.sample(card_pool, deck_size % len(card_pool))            return deck    def stop_battle(self):        """Completely stop the battle and reset the game state"""        self.simulation_running = False                try:            # Play stop sound            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")            pygame.mixer.music.play()        except Exception as e:            self.log_error(f"Error playing sound: {str(e)}")                # Clear the battle canvas        self.battle_canvas.delete("all")                # Reset game state        self.player1 = None        self.player2 = None        self.game = None                # Redraw the game areas        self.define_areas()                # Try to reload the background image        try:            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")            background_image = background_image.resize((1200, 700), Image.LANCZOS)            self.background_image = ImageTk.PhotoImage(background_image)            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)        except Exception:            # If background fails to load, create a plain black background            pass                # Display stop message on the battle canvas        self.battle_canvas.create_text(            600, 350,             text="BATTLE STOPPED",             font=("Arial", 36, "bold"),             fill="red"        )                # Clear the deck frames        for widget in self.deck_frame_p1.winfo_children():            widget.destroy()        for widget in self.deck_frame_p2.winfo_children():            widget.destroy()                # Log message        self.log_message("🛑 AI Battle Stopped!")        self.log_message("Click 'Start Battle' to begin a new battle.")    def start_battle(self):        try:            self.simulation_running = True            self.battle_log.delete(1.0, tk.END)            self.error_log.delete(1.0, tk.END)            self.log_message("⚔️ AI Battle Started!")            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")            pygame.mixer.music.play()            num_matches = int(self.match_entry.get())            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))            battle_thread.start()        except Exception as e:            self.log_error(f"Start Battle Error: {str(e)}")    def create_area(self, x1, y1, x2, y2, label):        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))    def define_areas(self):        # Player 1 areas (bottom player)        self.create_area(50, 550, 100, 650, "Deck P1")        self.create_area(150, 550, 200, 650, "Discard P1")        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")        self.create_area(350, 550, 800, 650, "Hand P1")        self.create_area(850, 450, 900, 550, "Lost Zone P1")        self.create_area(1050, 450, 1100, 550, "Stadium P1")        self.create_area(500, 350, 600, 450, "Active P1")        # Player 2 areas (top player, mirrored)        self.create_area(50, 50, 100, 150, "Deck P2")        self.create_area(150, 50, 200, 150, "Discard P2")        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")        self.create_area(350, 150, 800, 250, "Hand P2")        self.create_area(850, 50, 900, 150, "Lost Zone P2")        self.create_area(1050, 50, 1100, 150, "Stadium P2")        self.create_area(500, 250, 600, 350, "Active P2")    def update_battle_display(self):        """Update the entire battle display"""        # Clear previous elements        self.battle_canvas.delete("pokemon_image")        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("discard_pile")        self.battle_canvas.delete("prize_card")        self.battle_canvas.delete("deck_display")                # Update active Pokemon images        self.load_pokemon_images(            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"        )                # Update HP bars        self.update_hp_bars()                # Update discard piles        self.update_discard_piles()                # Update prize cards        self.update_prize_cards()                # Update decks        self.update_deck_display()                # Update bench Pokemon        self.update_bench()    def update_prize_cards(self):        """Display prize cards on the game board"""        try:            # Create a solid color rectangle instead of loading an image            self.battle_canvas.delete("prize_card")  # Clear existing prize cards                        # Define the dimensions of our prize card rectangle            card_width = 40            card_height = 60                        # Player 1 prize cards (6 slots)            prize_slots_p1 = [                (75, 100),  # Prize P1 Slot 1                (175, 100), # Prize P1 Slot 2                (75, 200),  # Prize P1 Slot 3                (175, 200), # Prize P1 Slot 4                (75, 300),  # Prize P1 Slot 5                (175, 300)  # Prize P1 Slot 6            ]                        # Player 2 prize cards (6 slots)            prize_slots_p2 = [                (75, 600),  # Prize P2 Slot 1                (175, 600), # Prize P2 Slot 2                (75, 500),  # Prize P2 Slot 3                (175, 500), # Prize P2 Slot 4                (75, 400),  # Prize P2 Slot 5                (175, 400)  # Prize P2 Slot 6            ]                        # Display the prize card backs and count for each player            # For Player 1            p1_prize_count = min(6, len(self.player1.prize_cards))  # Maximum of 6 prize cards            for i in range(p1_prize_count):                x, y = prize_slots_p1[i]                # Draw a blue rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card.width/2, y - card.height/2,                    x + card.width/2, y + card.height/2,                    fill="blue", outline="white", tags="prize_card"                )                        # Show prize count            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")                        # For Player 2            p2_prize_count = min(6, len(self.player2.prize_cards))  # Maximum of 6 prize cards            for i in range(p2_prize_count):                x, y = prize_slots_p2[i]                # Draw a red rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card.width/2, y - card.height/2,                    x + card.width/2, y + card.height/2,                    fill="red", outline="white", tags="prize_card"                )                            # Show prize count            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")        except Exception as e:            self.log_error(f"Error updating prize cards: {str(e)}")    def update_deck_display(self):        """Display decks on the game board"""        try:            # Clear previous deck display            self.battle_canvas.delete("deck_display")                        # Define card dimensions            card_width = 40            card_height = 60                        # Player 1 deck            if self.player1.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player1.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a blue rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,                        fill="blue", outline="white", tags="deck_display"                    )                                # Show deck count                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")                        # Player 2 deck            if self.player2.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player2.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a red rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,                        fill="red", outline="white", tags="deck_display"                    )                                    # Show deck count                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")        except Exception as e:            self.log_error(f"Error updating deck display: {str(e)}")    def update_bench(self):        """Update the bench Pokemon display"""        # Clear previous bench images        self.battle_canvas.delete("bench_image")                # Player 1 bench        try:            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p1_bench_images'):                        self.p1_bench_images = []                    while len(self.p1_bench_images) <= i:                        self.p1_bench_images.append(None)                    self.p1_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P1 bench: {str(e)}")                # Player 2 bench        try:            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p2_bench_images'):                        self.p2_bench_images = []                    while len(self.p2_bench_images) <= i:                        self.p2_bench_images.append(None)                    self.p2_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P2 bench: {str(e)}")    def update_discard_piles(self):        """Update the discard pile display"""        try:            # Player 1 discard pile            if self.player1.discard_pile:                # Show the top card of the discard pile                top_card = self.player1.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p1_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P1 discard pile: {str(e)}")                        # Player 2 discard pile            if self.player2.discard_pile:                # Show the top card of the discard pile                top_card = self.player2.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p2_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P2 discard pile: {str(e)}")        except Exception as e:            self.log_error(f"Error updating discard piles: {str(e)}")if __name__ == "__main__":    root = tk.Tk()    app = BattleGUI(root)    root.mainloop()```The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:```pythonimport tkinter as tkfrom tkinter import scrolledtext, Canvas, PhotoImage, messageboximport loggingimport randomimport threadingimport sysimport tracebackimport timefrom PIL import Image, ImageTkimport pygamefrom collections import defaultdict# Import game componentsfrom src.card import standard_pokemon_cards, standard_trainer_cardsfrom src.player_utils import Player, GameIMAGE_FOLDER = "src/images/gui/"CARD_IMAGE_FOLDER = "src/images/cards/"SOUND_FOLDER = "sounds/"class BattleGUI:    def __init__(self, root):        try:            self.root = root            self.root.title("Pokémon TCG AI Battle")            self.root.geometry("1920x1080")            self.root.configure(bg="black")            self.root.state("zoomed")            self.simulation_running = False            self.card_images = {}            # Initialize pygame mixer            pygame.mixer.init()            self.main_frame = tk.Frame(self.root, bg="black")            self.main_frame.pack(expand=True, fill=tk.BOTH)            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")            self.match_frame.pack(pady=5)            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")            self.match_label.pack(side=tk.LEFT, padx=10)            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)            self.match_entry.pack(side=tk.LEFT)            self.match_entry.insert(0, "1")            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")            self.button_frame.pack(pady=10)            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")            self.start_button.pack(side=tk.LEFT, padx=10)            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")            self.stop_button.pack(side=tk.LEFT, padx=10)            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")            self.exit_button.pack(side=tk.LEFT, padx=10)            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")            self.battle_log_label.pack(pady=5)            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")            self.error_log_label.pack(pady=5)            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)            # Add frames for player decks            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p1.pack(pady=5)            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p2.pack(pady=5)            # Define areas on the game board            self.define_areas()            # Add background image to battle_canvas            try:                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")                background_image = background_image.resize((1200, 700), Image.LANCZOS)                self.background_image = ImageTk.PhotoImage(background_image)                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)            except FileNotFoundError as e:                self.log_error(f"Background image not found: {e}. Continuing without background image.")            except Exception as e:                self.log_error(f"Error loading background image: {e}. Continuing without background image.")            sys.stderr = self.ErrorLogger(self)            self.log_message("✅ GUI Initialized Successfully.")        except Exception as e:            print(f"GUI Init Error: {str(e)}")            traceback.print_exc()    def load_pokemon_images(self, p1_pokemon, p2_pokemon):        try:            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))            self.p1_photo = ImageTk.PhotoImage(p1_image)            self.p2_photo = ImageTk.PhotoImage(p2_image)            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)        except FileNotFoundError as e:            self.log_message(f"❌ Image Load Error: {e}")        except Exception as e:            self.log_message(f"❌ Unexpected Error Loading Image: {e}")    def load_deck_images(self, deck, frame):        for widget in frame.winfo_children():            widget.destroy()        for card in deck:            try:                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))                card_photo = ImageTk.PhotoImage(card_image)                card_label = tk.Label(frame, image=card_photo, bg="black")                card_label.image = card_photo                card_label.pack(side=tk.LEFT, padx=2)            except FileNotFoundError as e:                self.log_message(f"❌ Deck Image Load Error: {e}")            except Exception as e:                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")    def update_hp_bars(self):        # Clear existing HP bars and related visuals        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("status_effect")                # Update Active Pokémon HP bars        try:            # Player 1 active Pokémon HP bar            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:                p1_hp = max(0, self.player1.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))                p1_width = int((p1_hp / p1_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p1_hp / p1_max_hp <= 0.5:                    bar_color = "yellow"                if p1_hp / p1_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P1 active HP bar: {str(e)}")                try:            # Player 2 active Pokémon HP bar            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:                p2_hp = max(0, self.player2.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))                p2_width = int((p2_hp / p2_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p2_hp / p2_max_hp <= 0.5:                    bar_color = "yellow"                if p2_hp / p2_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P2 active HP bar: {str(e)}")                    # Update Bench Pokémon HP Displays (similar to before)        try:            # Player 1 bench HP displays            for i, pokemon in enumerate(self.player1.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar below each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P1 bench HP: {str(e)}")                    try:            # Player 2 bench HP displays            for i, pokemon in enumerate(self.player2.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar above each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P2 bench HP: {str(e)}")    def log_message(self, message):        self.battle_log.insert(tk.END, message + "\n")        self.battle_log.yview(tk.END)    def log_error(self, message):        self.error_log.insert(tk.END, "❌ " + message + "\n")        self.error_log.yview(tk.END)    class ErrorLogger:        def __init__(self, gui):            self.gui = gui        def write(self, message):            if message.strip():                self.gui.log_error(message)        def flush(self):            pass    def run_battle(self, num_matches):        try:            for match in range(num_matches):                if not self.simulation_running:                    break                                self.log_message(f"⚡ Match {match + 1} Begins!")                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))                                # Setup prize cards (6 for each player)                if self.player1.deck:                    self.player1.prize_cards = self.player1.deck[:6]                    self.player1.deck = self.player1.deck[6:]                                if self.player2.deck:                    self.player2.prize_cards = self.player2.deck[:6]                    self.player2.deck = self.player2.deck[6:]                                # Initialize game                self.game = Game(self.player1, self.player2, ai_enabled=True)                                # Initial setup                self.update_battle_display()                                # Draw initial hands (7 cards)                self.player1.draw_cards(7)                self.player2.draw_cards(7)                                # Show hands                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")                # Game loop                while not self.game.is_over():                    current_player = self.game.players[self.game.turn % 2]                    result = self.game.play_turn(current_player)                                        # Update the battle display after each turn                    self.update_battle_display()                                        # Log each action from the action log                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")                    for action in current_player.action_log:                        self.log_message(f"  ▶️ {action}")                                        time.sleep(1)                                        if result:                        break                                # Final update of the display                self.update_battle_display()                                # Determine winner                if self.player1.active_pokemon is None and not self.player1.bench:                    winner = self.player2.name                elif self.player2.active_pokemon is None and not self.player2.bench:                    winner = self.player1.name                else:                    winner = self.game.players[self.game.turn % 2].name                                    self.log_message(f"🏆 {winner} Wins the Battle!")                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")                pygame.mixer.music.play()                        except Exception as e:            self.log_error(f"Battle Error: {str(e)}")            traceback.print_exc()    def create_deck(self, card_pool, deck_size):        if not card_pool:            raise ValueError("Card pool is empty. Cannot create a deck.")        if len(card_pool) >= deck size:            return random.sample(card_pool, deck_size)        else:            deck = card_pool * (deck_size // len(card_pool))            deck += random.sample(card_pool, deck size % len(card_pool))            return deck    def stop_battle(self):        """Completely stop the battle and reset the game state"""        self.simulation_running = False                try:            # Play stop sound            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")            pygame.mixer.music.play()        except Exception as e:            self.log_error(f"Error playing sound: {str(e)}")                # Clear the battle canvas        self.battle_canvas.delete("all")                # Reset game state        self.player1 = None        self.player2 = None        self.game = None                # Redraw the game areas        self.define_areas()                # Try to reload the background image        try:            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")            background_image = background_image.resize((1200, 700), Image.LANCZOS)            self.background_image = ImageTk.PhotoImage(background_image)            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)        except Exception:            # If background fails to load, create a plain black background            pass                # Display stop message on the battle canvas        self.battle_canvas.create_text(            600, 350,             text="BATTLE STOPPED",             font=("Arial", 36, "bold"),             fill="red"        )                # Clear the deck frames        for widget in self.deck_frame_p1.winfo_children():            widget.destroy()        for widget in self.deck_frame_p2.winfo_children():            widget.destroy()                # Log message        self.log_message("🛑 AI Battle Stopped!")        self.log_message("Click 'Start Battle' to begin a new battle.")    def start_battle(self):        try:            self.simulation_running = True            self.battle_log.delete(1.0, tk.END)            self.error_log.delete(1.0, tk.END)            self.log_message("⚔️ AI Battle Started!")            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")            pygame.mixer.music.play()            num_matches = int(self.match_entry.get())            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))            battle_thread.start()        except Exception as e:            self.log_error(f"Start Battle Error: {str(e)}")    def create_area(self, x1, y1, x2, y2, label):        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))    def define_areas(self):        # Player 1 areas (bottom player)        self.create_area(50, 550, 100, 650, "Deck P1")        self.create_area(150, 550, 200, 650, "Discard P1")        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")        self.create_area(350, 550, 800, 650, "Hand P1")        self.create_area(850, 450, 900, 550, "Lost Zone P1")        self.create_area(1050, 450, 1100, 550, "Stadium P1")        self.create_area(500, 350, 600, 450, "Active P1")        # Player 2 areas (top player, mirrored)        self.create_area(50, 50, 100, 150, "Deck P2")        self.create_area(150, 50, 200, 150, "Discard P2")        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")        self.create_area(350, 150, 800, 250, "Hand P2")        self.create_area(850, 50, 900, 150, "Lost Zone P2")        self.create_area(1050, 50, 1100, 150, "Stadium P2")        self.create_area(500, 250, 600, 350, "Active P2")    def update_battle_display(self):        """Update the entire battle display"""        # Clear previous elements        self.battle_canvas.delete("pokemon_image")        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("discard_pile")        self.battle_canvas.delete("prize_card")        self.battle_canvas.delete("deck_display")                # Update active Pokemon images        self.load_pokemon_images(            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"        )                # Update HP bars        self.update_hp_bars()                # Update discard piles        self.update_discard_piles()                # Update prize cards        self.update_prize_cards()                # Update decks        self.update_deck_display()                # Update bench Pokemon        self.update_bench()    def update_prize_cards(self):        """Display prize cards on the game board"""        try:            # Create a solid color rectangle instead of loading an image            self.battle_canvas.delete("prize_card")  # Clear existing prize cards                        # Define the dimensions of our prize card rectangle            card_width = 40            card height = 60                        # Player 1 prize cards (6 slots)            prize_slots_p1 = [                (75, 100),  # Prize P1 Slot 1                (175, 100), # Prize P1 Slot 2                (75, 200),  # Prize P1 Slot 3                (175, 200), # Prize P1 Slot 4                (75, 300),  # Prize P1 Slot 5                (175, 300)  # Prize P1 Slot 6            ]                        # Player 2 prize cards (6 slots)            prize_slots_p2 = [                (75, 600),  # Prize P2 Slot 1                (175, 600), # Prize P2 Slot 2                (75, 500),  # Prize P2 Slot 3                (175, 500), # Prize P2 Slot 4                (75, 400),  # Prize P2 Slot 5                (175, 400)  # Prize P2 Slot 6            ]                        # Display the prize card backs and count for each player            # For Player 1            p1_prize_count = min(6, len(self.player1.prize cards))  # Maximum of 6 prize cards            for i in range(p1_prize_count):                x, y = prize_slots_p1[i]                # Draw a blue rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card.width/2, y - card.height/2,                    x + card.width/2, y + card.height/2,                    fill="blue", outline="white", tags="prize_card"                )                        # Show prize count            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")                        # For Player 2            p2_prize_count = min(6, len(self.player2.prize cards))  # Maximum of 6 prize cards            for i in range(p2_prize_count):                x, y = prize_slots_p2[i]                # Draw a red rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card.width/2, y - card.height/2,                    x + card.width/2, y + card.height/2,                    fill="red", outline="white", tags="prize_card"                )                            # Show prize count            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")        except Exception as e:            self.log_error(f"Error updating prize cards: {str(e)}")    def update_deck_display(self):        """Display decks on the game board"""        try:            # Clear previous deck display            self.battle_canvas.delete("deck_display")                        # Define card dimensions            card width = 40            card height = 60                        # Player 1 deck            if self.player1.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player1.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a blue rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,                        fill="blue", outline="white", tags="deck_display"                    )                                # Show deck count                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")                        # Player 2 deck            if self.player2.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player2.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a red rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,                        fill="red", outline="white", tags="deck_display"                    )                                    # Show deck count                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")        except Exception as e:            self.log_error(f"Error updating deck display: {str(e)}")    def update_bench(self):        """Update the bench Pokemon display"""        # Clear previous bench images        self.battle_canvas.delete("bench_image")                # Player 1 bench        try:            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p1_bench_images'):                        self.p1_bench_images = []                    while len(self.p1_bench_images) <= i:                        self.p1_bench_images.append(None)                    self.p1_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P1 bench: {str(e)}")                # Player 2 bench        try:            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p2_bench_images'):                        self.p2_bench_images = []                    while len(self.p2_bench_images) <= i:                        self.p2_bench_images.append(None)                    self.p2_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P2 bench: {str(e)}")    def update_discard_piles(self):        """Update the discard pile display"""        try:            # Player 1 discard pile            if self.player1.discard_pile:                # Show the top card of the discard pile                top_card = self.player1.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p1_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P1 discard pile: {str(e)}")                        # Player 2 discard pile            if self.player2.discard_pile:                # Show the top card of the discard pile                top_card = self.player2.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p2_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P2 discard pile: {str(e)}")        except Exception as e:            self.log_error(f"Error updating discard piles: {str(e)}")if __name__ == "__main__":    root = tk.Tk()    app = BattleGUI(root)    root.mainloop()```The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:```pythonimport tkinter as tkfrom tkinter import scrolledtext, Canvas, PhotoImage, messageboximport loggingimport randomimport threadingimport sysimport tracebackimport timefrom PIL import Image, ImageTkimport pygamefrom collections import defaultdict# Import game componentsfrom src.card import standard_pokemon_cards, standard_trainer_cardsfrom src.player_utils import Player, GameIMAGE_FOLDER = "src/images/gui/"CARD_IMAGE_FOLDER = "src/images/cards/"SOUND_FOLDER = "sounds/"class BattleGUI:    def __init__(self, root):        try:            self.root = root            self.root.title("Pokémon TCG AI Battle")            self.root.geometry("1920x1080")            self.root.configure(bg="black")            self.root.state("zoomed")            self.simulation_running = False            self.card_images = {}            # Initialize pygame mixer            pygame.mixer.init()            self.main_frame = tk.Frame(self.root, bg="black")            self.main_frame.pack(expand=True, fill=tk.BOTH)            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")            self.match_frame.pack(pady=5)            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")            self.match_label.pack(side=tk.LEFT, padx=10)            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)            self.match_entry.pack(side=tk.LEFT)            self.match_entry.insert(0, "1")            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")            self.button_frame.pack(pady=10)            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")            self.start_button.pack(side=tk.LEFT, padx=10)            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")            self.stop_button.pack(side=tk.LEFT, padx=10)            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")            self.exit_button.pack(side=tk.LEFT, padx=10)            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")            self.battle_log_label.pack(pady=5)            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")            self.error_log_label.pack(pady=5)            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)            # Add frames for player decks            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p1.pack(pady=5)            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")            self.deck_frame_p2.pack(pady=5)            # Define areas on the game board            self.define_areas()            # Add background image to battle_canvas            try:                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")                background_image = background_image.resize((1200, 700), Image.LANCZOS)                self.background_image = ImageTk.PhotoImage(background_image)                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)            except FileNotFoundError as e:                self.log_error(f"Background image not found: {e}. Continuing without background image.")            except Exception as e:                self.log_error(f"Error loading background image: {e}. Continuing without background image.")            sys.stderr = self.ErrorLogger(self)            self.log_message("✅ GUI Initialized Successfully.")        except Exception as e:            print(f"GUI Init Error: {str(e)}")            traceback.print_exc()    def load_pokemon_images(self, p1_pokemon, p2_pokemon):        try:            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))            self.p1_photo = ImageTk.PhotoImage(p1_image)            self.p2_photo = ImageTk.PhotoImage(p2_image)            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)        except FileNotFoundError as e:            self.log_message(f"❌ Image Load Error: {e}")        except Exception as e:            self.log_message(f"❌ Unexpected Error Loading Image: {e}")    def load_deck_images(self, deck, frame):        for widget in frame.winfo_children():            widget.destroy()        for card in deck:            try:                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))                card_photo = ImageTk.PhotoImage(card_image)                card_label = tk.Label(frame, image=card_photo, bg="black")                card_label.image = card_photo                card_label.pack(side=tk.LEFT, padx=2)            except FileNotFoundError as e:                self.log_message(f"❌ Deck Image Load Error: {e}")            except Exception as e:                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")    def update_hp_bars(self):        # Clear existing HP bars and related visuals        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("status_effect")                # Update Active Pokémon HP bars        try:            # Player 1 active Pokémon HP bar            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:                p1_hp = max(0, self.player1.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))                p1_width = int((p1_hp / p1_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p1_hp / p1_max_hp <= 0.5:                    bar_color = "yellow"                if p1_hp / p1_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P1 active HP bar: {str(e)}")                try:            # Player 2 active Pokémon HP bar            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:                p2_hp = max(0, self.player2.active_pokemon['hp'])                # Fix division by zero error by ensuring max_hp is at least 1                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))                p2_width = int((p2_hp / p2_max_hp) * 100)                                # Different colors based on HP percentage                bar_color = "green"                if p2_hp / p2_max_hp <= 0.5:                    bar_color = "yellow"                if p2_hp / p2_max_hp <= 0.25:                    bar_color = "red"                                    self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}",                                              fill="white", font=("Arial", 12, "bold"), tags="hp_text")        except Exception as e:            self.log_error(f"Error updating P2 active HP bar: {str(e)}")                    # Update Bench Pokémon HP Displays (similar to before)        try:            # Player 1 bench HP displays            for i, pokemon in enumerate(self.player1.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar below each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P1 bench HP: {str(e)}")                    try:            # Player 2 bench HP displays            for i, pokemon in enumerate(self.player2.bench):                if 'hp' in pokemon:                    hp = max(0, pokemon['hp'])                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))                                        # HP bar color based on percentage                    bar_color = "green"                    if hp / max_hp <= 0.5:                        bar_color = "yellow"                    if hp / max_hp <= 0.25:                        bar_color = "red"                                        # Position bench HP text and mini-bar above each bench slot                    x_pos = 375 + (i * 100)                    width = 50                    bar_width = int((hp / max_hp) * width)                                        self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135,                                                       fill=bar_color, tags="hp_bar")                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP",                                                   fill="white", font=("Arial", 10), tags="hp_text",                                                  anchor=tk.CENTER, justify=tk.CENTER)        except Exception as e:            self.log_error(f"Error updating P2 bench HP: {str(e)}")    def log_message(self, message):        self.battle_log.insert(tk.END, message + "\n")        self.battle_log.yview(tk.END)    def log_error(self, message):        self.error_log.insert(tk.END, "❌ " + message + "\n")        self.error_log.yview(tk.END)    class ErrorLogger:        def __init__(self, gui):            self.gui = gui        def write(self, message):            if message.strip():                self.gui.log_error(message)        def flush(self):            pass    def run_battle(self, num_matches):        try:            for match in range(num_matches):                if not self.simulation_running:                    break                                self.log_message(f"⚡ Match {match + 1} Begins!")                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))                                # Setup prize cards (6 for each player)                if self.player1.deck:                    self.player1.prize_cards = self.player1.deck[:6]                    self.player1.deck = self.player1.deck[6:]                                if self.player2.deck:                    self.player2.prize_cards = self.player2.deck[:6]                    self.player2.deck = self.player2.deck[6:]                                # Initialize game                self.game = Game(self.player1, self.player2, ai_enabled=True)                                # Initial setup                self.update_battle_display()                                # Draw initial hands (7 cards)                self.player1.draw_cards(7)                self.player2.draw_cards(7)                                # Show hands                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")                # Game loop                while not self.game.is_over():                    current_player = self.game.players[self.game.turn % 2]                    result = self.game.play_turn(current_player)                                        # Update the battle display after each turn                    self.update_battle_display()                                        # Log each action from the action log                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")                    for action in current_player.action_log:                        self.log_message(f"  ▶️ {action}")                                        time.sleep(1)                                        if result:                        break                                # Final update of the display                self.update_battle_display()                                # Determine winner                if self.player1.active_pokemon is None and not self.player1.bench:                    winner = self.player2.name                elif self.player2.active_pokemon is None and not self.player2.bench:                    winner = self.player1.name                else:                    winner = self.game.players[self.game.turn % 2].name                                    self.log_message(f"🏆 {winner} Wins the Battle!")                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")                pygame.mixer.music.play()                        except Exception as e:            self.log_error(f"Battle Error: {str(e)}")            traceback.print_exc()    def create_deck(self, card_pool, deck_size):        if not card_pool:            raise ValueError("Card pool is empty. Cannot create a deck.")        if len(card_pool) >= deck_size:            return random.sample(card_pool, deck_size)        else:            deck = card_pool * (deck_size // len(card_pool))            deck += random.sample(card_pool, deck_size % len(card_pool))            return deck    def stop_battle(self):        """Completely stop the battle and reset the game state"""        self.simulation_running = False                try:            # Play stop sound            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")            pygame.mixer.music.play()        except Exception as e:            self.log_error(f"Error playing sound: {str(e)}")                # Clear the battle canvas        self.battle_canvas.delete("all")                # Reset game state        self.player1 = None        self.player2 = None        self.game = None                # Redraw the game areas        self.define_areas()                # Try to reload the background image        try:            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")            background_image = background_image.resize((1200, 700), Image.LANCZOS)            self.background_image = ImageTk.PhotoImage(background_image)            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)        except Exception:            # If background fails to load, create a plain black background            pass                # Display stop message on the battle canvas        self.battle_canvas.create_text(            600, 350,             text="BATTLE STOPPED",             font=("Arial", 36, "bold"),             fill="red"        )                # Clear the deck frames        for widget in self.deck_frame_p1.winfo_children():            widget.destroy()        for widget in self.deck_frame_p2.winfo_children():            widget.destroy()                # Log message        self.log_message("🛑 AI Battle Stopped!")        self.log_message("Click 'Start Battle' to begin a new battle.")    def start_battle(self):        try:            self.simulation_running = True            self.battle_log.delete(1.0, tk.END)            self.error_log.delete(1.0, tk.END)            self.log_message("⚔️ AI Battle Started!")            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")            pygame.mixer.music.play()            num_matches = int(self.match_entry.get())            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))            battle_thread.start()        except Exception as e:            self.log_error(f"Start Battle Error: {str(e)}")    def create_area(self, x1, y1, x2, y2, label):        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))    def define_areas(self):        # Player 1 areas (bottom player)        self.create_area(50, 550, 100, 650, "Deck P1")        self.create_area(150, 550, 200, 650, "Discard P1")        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")        self.create_area(350, 550, 800, 650, "Hand P1")        self.create_area(850, 450, 900, 550, "Lost Zone P1")        self.create_area(1050, 450, 1100, 550, "Stadium P1")        self.create_area(500, 350, 600, 450, "Active P1")        # Player 2 areas (top player, mirrored)        self.create_area(50, 50, 100, 150, "Deck P2")        self.create_area(150, 50, 200, 150, "Discard P2")        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")        self.create_area(350, 150, 800, 250, "Hand P2")        self.create_area(850, 50, 900, 150, "Lost Zone P2")        self.create_area(1050, 50, 1100, 150, "Stadium P2")        self.create_area(500, 250, 600, 350, "Active P2")    def update_battle_display(self):        """Update the entire battle display"""        # Clear previous elements        self.battle_canvas.delete("pokemon_image")        self.battle_canvas.delete("hp_bar")        self.battle_canvas.delete("hp_text")        self.battle_canvas.delete("damage_info")        self.battle_canvas.delete("discard_pile")        self.battle_canvas.delete("prize_card")        self.battle_canvas.delete("deck_display")                # Update active Pokemon images        self.load_pokemon_images(            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"        )                # Update HP bars        self.update_hp_bars()                # Update discard piles        self.update_discard_piles()                # Update prize cards        self.update_prize_cards()                # Update decks        self.update_deck_display()                # Update bench Pokemon        self.update_bench()    def update_prize_cards(self):        """Display prize cards on the game board"""        try:            # Create a solid color rectangle instead of loading an image            self.battle_canvas.delete("prize_card")  # Clear existing prize cards                        # Define the dimensions of our prize card rectangle            card width = 40            card height = 60                        # Player 1 prize cards (6 slots)            prize_slots_p1 = [                (75, 100),  # Prize P1 Slot 1                (175, 100), # Prize P1 Slot 2                (75, 200),  # Prize P1 Slot 3                (175, 200), # Prize P1 Slot 4                (75, 300),  # Prize P1 Slot 5                (175, 300)  # Prize P1 Slot 6            ]                        # Player 2 prize cards (6 slots)            prize_slots_p2 = [                (75, 600),  # Prize P2 Slot 1                (175, 600), # Prize P2 Slot 2                (75, 500),  # Prize P2 Slot 3                (175, 500), # Prize P2 Slot 4                (75, 400),  # Prize P2 Slot 5                (175, 400)  # Prize P2 Slot 6            ]                        # Display the prize card backs and count for each player            # For Player 1            p1_prize_count = min(6, len(self.player1.prize cards))  # Maximum of 6 prize cards            for i in range(p1_prize_count):                x, y = prize_slots_p1[i]                # Draw a blue rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card.width/2, y - card.height/2,                    x + card.width/2, y + card.height/2,                    fill="blue", outline="white", tags="prize_card"                )                        # Show prize count            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")                        # For Player 2            p2_prize_count = min(6, len(self.player2.prize cards))  # Maximum of 6 prize cards            for i in range(p2_prize_count):                x, y = prize_slots_p2[i]                # Draw a red rectangle as the card back                self.battle_canvas.create_rectangle(                    x - card.width/2, y - card.height/2,                    x + card.width/2, y + card.height/2,                    fill="red", outline="white", tags="prize_card"                )                            # Show prize count            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",                                         fill="white", font=("Arial", 10), tags="prize_card")        except Exception as e:            self.log_error(f"Error updating prize cards: {str(e)}")    def update_deck_display(self):        """Display decks on the game board"""        try:            # Clear previous deck display            self.battle_canvas.delete("deck_display")                        # Define card dimensions            card width = 40            card height = 60                        # Player 1 deck            if self.player1.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player1.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a blue rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,                        fill="blue", outline="white", tags="deck_display"                    )                                # Show deck count                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")                        # Player 2 deck            if self.player2.deck:                # Create a visual indication of deck with slight offset cards                for i in range(min(5, len(self.player2.deck))):                    # Offset each card slightly to create a stack effect                    offset = i * 2                    # Draw a red rectangle for each card in the stack                    self.battle_canvas.create_rectangle(                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,                        fill="red", outline="white", tags="deck_display"                    )                                    # Show deck count                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",                                             fill="white", font=("Arial", 10), tags="deck_display")        except Exception as e:            self.log_error(f"Error updating deck display: {str(e)}")    def update_bench(self):        """Update the bench Pokemon display"""        # Clear previous bench images        self.battle_canvas.delete("bench_image")                # Player 1 bench        try:            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p1_bench_images'):                        self.p1_bench_images = []                    while len(self.p1_bench_images) <= i:                        self.p1_bench_images.append(None)                    self.p1_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P1 bench: {str(e)}")                # Player 2 bench        try:            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon                try:                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))                    bench_photo = ImageTk.PhotoImage(bench_img)                                        # Store reference to prevent garbage collection                    if not hasattr(self, 'p2_bench_images'):                        self.p2_bench_images = []                    while len(self.p2_bench_images) <= i:                        self.p2_bench_images.append(None)                    self.p2_bench_images[i] = bench_photo                                        # Position: 350 + 100*i is the x-coordinate for bench slots                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo,                                                   anchor=tk.CENTER, tags="bench_image")                except Exception as e:                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")        except Exception as e:            self.log_error(f"Error updating P2 bench: {str(e)}")    def update_discard_piles(self):        """Update the discard pile display"""        try:            # Player 1 discard pile            if self.player1.discard_pile:                # Show the top card of the discard pile                top_card = self.player1.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p1_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P1 discard pile: {str(e)}")                        # Player 2 discard pile            if self.player2.discard_pile:                # Show the top card of the discard pile                top_card = self.player2.discard_pile[-1]                try:                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))                    card_photo = ImageTk.PhotoImage(card_image)                    self.p2_discard_image = card_photo  # Keep reference                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})",                                                    fill="white", font=("Arial", 10), tags="discard_pile")                except Exception as e:                    self.log_error(f"Error updating P2 discard pile: {str(e)}")        except Exception as e:            self.log_error(f"Error updating discard piles: {str(e)}")if __name__ == "__main__":    root = tk.Tk()    app = BattleGUI(root)    root.mainloop()```The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:```pythonimport tkinter as tkfrom tkinter import scrolledtext, Canvas, PhotoImage, messageboximport loggingimport randomimport threadingimport sysimport tracebackimport timefrom PIL import Image, ImageTkimport pygamefrom collections import defaultdict# Import game componentsfrom src.card import standard_pokemon_cards, standard_trainer_cardsfrom src.player_utils import Player, GameIMAGE_FOLDER = "src/images/gui/"CARD_IMAGE_FOLDER = "src/images/cards/"SOUND_FOLDER = "sounds/"class BattleGUI:    def __init__(self, root):        try:            self.root = root            self.root.title("Pokémon TCG AI Battle")            self.root.geometry("1920x1080")            self.root.configure(bg="black")            self.root.state("zoomed")            self.simulation_running = False            self.card_images = {}            # Initialize pygame mixer            pygame.mixer.init()            self.main_frame = tk.Frame(self.root, bg="black")            self.main_frame.pack(expand=True, fill=tk.BOTH)            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")            self.match_frame.pack(pady=5)            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")
-            self.match_label.pack(side=tk.LEFT, padx=10)
-            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
-            self.match_entry.pack(side=tk.LEFT)
-            self.match_entry.insert(0, "1")
-            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.button_frame.pack(pady=10)
-            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
-            self.start_button.pack(side=tk.LEFT, padx=10)
-            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
-            self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
-            self.exit_button.pack(side=tk.LEFT, padx=10)
-            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
-            self.battle_log_label.pack(pady=5)
-            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
-            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
-            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
-            self.error_log_label.pack(pady=5)
-            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")
-            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)
-
-            # Add frames for player decks
-            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p1.pack(pady=5)
-            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p2.pack(pady=5)
-
-            # Define areas on the game board
-            self.define_areas()
-
-            # Add background image to battle_canvas
-            try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-            except FileNotFoundError as e:
-                self.log_error(f"Background image not found: {e}. Continuing without background image.")
-            except Exception as e:
-                self.log_error(f"Error loading background image: {e}. Continuing without background image.")
-
-            sys.stderr = self.ErrorLogger(self)
-            self.log_message("✅ GUI Initialized Successfully.")
-        except Exception as e:
-            print(f"GUI Init Error: {str(e)}")
-            traceback.print_exc()
-
-    def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
-
-    def load_deck_images(self, deck, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        for card in deck:
-            try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
-                card_label = tk.Label(frame, image=card_photo, bg="black")
-                card_label.image = card_photo
-                card_label.pack(side=tk.LEFT, padx=2)
-            except FileNotFoundError as e:
-                self.log_message(f"❌ Deck Image Load Error: {e}")
-            except Exception as e:
-                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
-
-    def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
-        # Update Active Pokémon HP bars
-        try:
-            # Player 1 active Pokémon HP bar
-            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:
-                p1_hp = max(0, self.player1.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))
-                p1_width = int((p1_hp / p1_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p1_hp / p1_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p1_hp / p1_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P1 active HP bar: {str(e)}")
-        
-        try:
-            # Player 2 active Pokémon HP bar
-            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:
-                p2_hp = max(0, self.player2.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))
-                p2_width = int((p2_hp / p2_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p2_hp / p2_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p2_hp / p2_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P2 active HP bar: {str(e)}")
-            
-        # Update Bench Pokémon HP Displays (similar to before)
-        try:
-            # Player 1 bench HP displays
-            for i, pokemon in enumerate(self.player1.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar below each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench HP: {str(e)}")
-            
-        try:
-            # Player 2 bench HP displays
-            for i, pokemon in enumerate(self.player2.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar above each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench HP: {str(e)}")
-
-    def log_message(self, message):
-        self.battle_log.insert(tk.END, message + "\n")
-        self.battle_log.yview(tk.END)
-
-    def log_error(self, message):
-        self.error_log.insert(tk.END, "❌ " + message + "\n")
-        self.error_log.yview(tk.END)
-
-    class ErrorLogger:
-        def __init__(self, gui):
-            self.gui = gui
-
-        def write(self, message):
-            if message.strip():
-                self.gui.log_error(message)
-
-        def flush(self):
-            pass
-
-    def run_battle(self, num_matches):
-        try:
-            for match in range(num_matches):
-                if not self.simulation_running:
-                    break
-                
-                self.log_message(f"⚡ Match {match + 1} Begins!")
-                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))
-                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))
-                
-                # Setup prize cards (6 for each player)
-                if self.player1.deck:
-                    self.player1.prize_cards = self.player1.deck[:6]
-                    self.player1.deck = self.player1.deck[6:]
-                
-                if self.player2.deck:
-                    self.player2.prize_cards = self.player2.deck[:6]
-                    self.player2.deck = self.player2.deck[6:]
-                
-                # Initialize game
-                self.game = Game(self.player1, self.player2, ai_enabled=True)
-                
-                # Initial setup
-                self.update_battle_display()
-                
-                # Draw initial hands (7 cards)
-                self.player1.draw_cards(7)
-                self.player2.draw_cards(7)
-                
-                # Show hands
-                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")
-                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")
-
-                # Game loop
-                while not self.game.is_over():
-                    current_player = self.game.players[self.game.turn % 2]
-                    result = self.game.play_turn(current_player)
-                    
-                    # Update the battle display after each turn
-                    self.update_battle_display()
-                    
-                    # Log each action from the action log
-                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")
-                    for action in current_player.action_log:
-                        self.log_message(f"  ▶️ {action}")
-                    
-                    time.sleep(1)
-                    
-                    if result:
-                        break
-                
-                # Final update of the display
-                self.update_battle_display()
-                
-                # Determine winner
-                if self.player1.active_pokemon is None and not self.player1.bench:
-                    winner = self.player2.name
-                elif self.player2.active_pokemon is None and not self.player2.bench:
-                    winner = self.player1.name
-                else:
-                    winner = self.game.players[self.game.turn % 2].name
-                    
-                self.log_message(f"🏆 {winner} Wins the Battle!")
-                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")
-                pygame.mixer.music.play()
-                
-        except Exception as e:
-            self.log_error(f"Battle Error: {str(e)}")
-            traceback.print_exc()
-
-    def create_deck(self, card_pool, deck_size):
-        if not card_pool:
-            raise ValueError("Card pool is empty. Cannot create a deck.")
-        if len(card_pool) >= deck_size:
-            return random.sample(card_pool, deck_size)
-        else:
-            deck = card_pool * (deck_size // len(card_pool))
-            deck += random.sample(card_pool, deck_size % len(card_pool))
-            return deck
-
-    def stop_battle(self):
-        """Completely stop the battle and reset the game state"""
-        self.simulation_running = False
-        
-        try:
-            # Play stop sound
-            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")
-            pygame.mixer.music.play()
-        except Exception as e:
-            self.log_error(f"Error playing sound: {str(e)}")
-        
-        # Clear the battle canvas
-        self.battle_canvas.delete("all")
-        
-        # Reset game state
-        self.player1 = None
-        self.player2 = None
-        self.game = None
-        
-        # Redraw the game areas
-        self.define_areas()
-        
-        # Try to reload the background image
-        try:
-            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-            background_image = background_image.resize((1200, 700), Image.LANCZOS)
-            self.background_image = ImageTk.PhotoImage(background_image)
-            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-        except Exception:
-            # If background fails to load, create a plain black background
-            pass
-        
-        # Display stop message on the battle canvas
-        self.battle_canvas.create_text(
-            600, 350, 
-            text="BATTLE STOPPED", 
-            font=("Arial", 36, "bold"), 
-            fill="red"
-        )
-        
-        # Clear the deck frames
-        for widget in self.deck_frame_p1.winfo_children():
-            widget.destroy()
-        for widget in self.deck_frame_p2.winfo_children():
-            widget.destroy()
-        
-        # Log message
-        self.log_message("🛑 AI Battle Stopped!")
-        self.log_message("Click 'Start Battle' to begin a new battle.")
-
-    def start_battle(self):
-        try:
-            self.simulation_running = True
-            self.battle_log.delete(1.0, tk.END)
-            self.error_log.delete(1.0, tk.END)
-            self.log_message("⚔️ AI Battle Started!")
-            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")
-            pygame.mixer.music.play()
-            num_matches = int(self.match_entry.get())
-            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))
-            battle_thread.start()
-        except Exception as e:
-            self.log_error(f"Start Battle Error: {str(e)}")
-
-    def create_area(self, x1, y1, x2, y2, label):
-        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")
-        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))
-
-    def define_areas(self):
-        # Player 1 areas (bottom player)
-        self.create_area(50, 550, 100, 650, "Deck P1")
-        self.create_area(150, 550, 200, 650, "Discard P1")
-        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")
-        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")
-        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")
-        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")
-        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")
-        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")
-        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")
-        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")
-        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")
-        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")
-        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")
-        self.create_area(350, 550, 800, 650, "Hand P1")
-        self.create_area(850, 450, 900, 550, "Lost Zone P1")
-        self.create_area(1050, 450, 1100, 550, "Stadium P1")
-        self.create_area(500, 350, 600, 450, "Active P1")
-        # Player 2 areas (top player, mirrored)
-        self.create_area(50, 50, 100, 150, "Deck P2")
-        self.create_area(150, 50, 200, 150, "Discard P2")
-        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")
-        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")
-        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")
-        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")
-        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")
-        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")
-        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")
-        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")
-        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")
-        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")
-        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")
-        self.create_area(350, 150, 800, 250, "Hand P2")
-        self.create_area(850, 50, 900, 150, "Lost Zone P2")
-        self.create_area(1050, 50, 1100, 150, "Stadium P2")
-        self.create_area(500, 250, 600, 350, "Active P2")
-
-    def update_battle_display(self):
-        """Update the entire battle display"""
-        # Clear previous elements
-        self.battle_canvas.delete("pokemon_image")
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("discard_pile")
-        self.battle_canvas.delete("prize_card")
-        self.battle_canvas.delete("deck_display")
-        
-        # Update active Pokemon images
-        self.load_pokemon_images(
-            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",
-            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"
-        )
-        
-        # Update HP bars
-        self.update_hp_bars()
-        
-        # Update discard piles
-        self.update_discard_piles()
-        
-        # Update prize cards
-        self.update_prize_cards()
-        
-        # Update decks
-        self.update_deck_display()
-        
-        # Update bench Pokemon
-        self.update_bench()
-
-    def update_prize_cards(self):
-        """Display prize cards on the game board"""
-        try:
-            # Create a solid color rectangle instead of loading an image
-            self.battle_canvas.delete("prize_card")  # Clear existing prize cards
-            
-            # Define the dimensions of our prize card rectangle
-            card width = 40
-            card height = 60
-            
-            # Player 1 prize cards (6 slots)
-            prize_slots_p1 = [
-                (75, 100),  # Prize P1 Slot 1
-                (175, 100), # Prize P1 Slot 2
-                (75, 200),  # Prize P1 Slot 3
-                (175, 200), # Prize P1 Slot 4
-                (75, 300),  # Prize P1 Slot 5
-                (175, 300)  # Prize P1 Slot 6
-            ]
-            
-            # Player 2 prize cards (6 slots)
-            prize_slots_p2 = [
-                (75, 600),  # Prize P2 Slot 1
-                (175, 600), # Prize P2 Slot 2
-                (75, 500),  # Prize P2 Slot 3
-                (175, 500), # Prize P2 Slot 4
-                (75, 400),  # Prize P2 Slot 5
-                (175, 400)  # Prize P2 Slot 6
-            ]
-            
-            # Display the prize card backs and count for each player
-            # For Player 1
-            p1_prize_count = min(6, len(self.player1.prize cards))  # Maximum of 6 prize cards
-            for i in range(p1_prize_count):
-                x, y = prize_slots_p1[i]
-                # Draw a blue rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card.width/2, y - card.height/2,
-                    x + card.width/2, y + card.height/2,
-                    fill="blue", outline="white", tags="prize_card"
-                )
-            
-            # Show prize count
-            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-            
-            # For Player 2
-            p2_prize_count = min(6, len(self.player2.prize cards))  # Maximum of 6 prize cards
-            for i in range(p2_prize_count):
-                x, y = prize_slots_p2[i]
-                # Draw a red rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card.width/2, y - card.height/2,
-                    x + card.width/2, y + card.height/2,
-                    fill="red", outline="white", tags="prize_card"
-                )
-                
-            # Show prize count
-            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-        except Exception as e:
-            self.log_error(f"Error updating prize cards: {str(e)}")
-
-    def update_deck_display(self):
-        """Display decks on the game board"""
-        try:
-            # Clear previous deck display
-            self.battle_canvas.delete("deck_display")
-            
-            # Define card dimensions
-            card width = 40
-            card height = 60
-            
-            # Player 1 deck
-            if self.player1.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player1.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a blue rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,
-                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,
-                        fill="blue", outline="white", tags="deck_display"
-                    )
-                
-                # Show deck count
-                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-            
-            # Player 2 deck
-            if self.player2.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player2.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a red rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,
-                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,
-                        fill="red", outline="white", tags="deck_display"
-                    )
-                    
-                # Show deck count
-                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-        except Exception as e:
-            self.log_error(f"Error updating deck display: {str(e)}")
-
-    def update_bench(self):
-        """Update the bench Pokemon display"""
-        # Clear previous bench images
-        self.battle_canvas.delete("bench_image")
-        
-        # Player 1 bench
-        try:
-            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p1_bench_images'):
-                        self.p1_bench_images = []
-                    while len(self.p1_bench_images) <= i:
-                        self.p1_bench_images.append(None)
-                    self.p1_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench: {str(e)}")
-        
-        # Player 2 bench
-        try:
-            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p2_bench_images'):
-                        self.p2_bench_images = []
-                    while len(self.p2_bench_images) <= i:
-                        self.p2_bench_images.append(None)
-                    self.p2_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench: {str(e)}")
-
-    def update_discard_piles(self):
-        """Update the discard pile display"""
-        try:
-            # Player 1 discard pile
-            if self.player1.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player1.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p1_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P1 discard pile: {str(e)}")
-            
-            # Player 2 discard pile
-            if self.player2.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player2.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p2_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P2 discard pile: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating discard piles: {str(e)}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = BattleGUI(root)
-    root.mainloop()
-```
-
-
-The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:
-
-```python
-import tkinter as tk
-from tkinter import scrolledtext, Canvas, PhotoImage, messagebox
-import logging
-import random
-import threading
-import sys
-import traceback
-import time
-from PIL import Image, ImageTk
-import pygame
-from collections import defaultdict
-
-# Import game components
-from src.card import standard_pokemon_cards, standard_trainer_cards
-from src.player_utils import Player, Game
-
-IMAGE_FOLDER = "src/images/gui/"
-CARD_IMAGE_FOLDER = "src/images/cards/"
-SOUND_FOLDER = "sounds/"
-
-class BattleGUI:
-    def __init__(self, root):
-        try:
-            self.root = root
-            self.root.title("Pokémon TCG AI Battle")
-            self.root.geometry("1920x1080")
-            self.root.configure(bg="black")
-            self.root.state("zoomed")
-
-            self.simulation_running = False
-            self.card_images = {}
-
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            self.main_frame = tk.Frame(self.root, bg="black")
-            self.main_frame.pack(expand=True, fill=tk.BOTH)
-            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")
-            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)
-            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")
-            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)
-            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.match_frame.pack(pady=5)
-            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")
-            self.match_label.pack(side=tk.LEFT, padx=10)
-            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
-            self.match_entry.pack(side=tk.LEFT)
-            self.match_entry.insert(0, "1")
-            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.button_frame.pack(pady=10)
-            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
-            self.start_button.pack(side=tk.LEFT, padx=10)
-            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
-            self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
-            self.exit_button.pack(side=tk.LEFT, padx=10)
-            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
-            self.battle_log_label.pack(pady=5)
-            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
-            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
-            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
-            self.error_log_label.pack(pady=5)
-            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")
-            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)
-
-            # Add frames for player decks
-            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p1.pack(pady=5)
-            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p2.pack(pady=5)
-
-            # Define areas on the game board
-            self.define_areas()
-
-            # Add background image to battle_canvas
-            try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-            except FileNotFoundError as e:
-                self.log_error(f"Background image not found: {e}. Continuing without background image.")
-            except Exception as e:
-                self.log_error(f"Error loading background image: {e}. Continuing without background image.")
-
-            sys.stderr = self.ErrorLogger(self)
-            self.log_message("✅ GUI Initialized Successfully.")
-        except Exception as e:
-            print(f"GUI Init Error: {str(e)}")
-            traceback.print_exc()
-
-    def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
-
-    def load_deck_images(self, deck, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        for card in deck:
-            try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
-                card_label = tk.Label(frame, image=card_photo, bg="black")
-                card_label.image = card_photo
-                card_label.pack(side=tk.LEFT, padx=2)
-            except FileNotFoundError as e:
-                self.log_message(f"❌ Deck Image Load Error: {e}")
-            except Exception as e:
-                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
-
-    def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
-        # Update Active Pokémon HP bars
-        try:
-            # Player 1 active Pokémon HP bar
-            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:
-                p1_hp = max(0, self.player1.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))
-                p1_width = int((p1_hp / p1_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p1_hp / p1_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p1_hp / p1_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P1 active HP bar: {str(e)}")
-        
-        try:
-            # Player 2 active Pokémon HP bar
-            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:
-                p2_hp = max(0, self.player2.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))
-                p2_width = int((p2_hp / p2_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p2_hp / p2_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p2_hp / p2_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P2 active HP bar: {str(e)}")
-            
-        # Update Bench Pokémon HP Displays (similar to before)
-        try:
-            # Player 1 bench HP displays
-            for i, pokemon in enumerate(self.player1.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar below each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench HP: {str(e)}")
-            
-        try:
-            # Player 2 bench HP displays
-            for i, pokemon in enumerate(self.player2.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar above each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench HP: {str(e)}")
-
-    def log_message(self, message):
-        self.battle_log.insert(tk.END, message + "\n")
-        self.battle_log.yview(tk.END)
-
-    def log_error(self, message):
-        self.error_log.insert(tk.END, "❌ " + message + "\n")
-        self.error_log.yview(tk.END)
-
-    class ErrorLogger:
-        def __init__(self, gui):
-            self.gui = gui
-
-        def write(self, message):
-            if message.strip():
-                self.gui.log_error(message)
-
-        def flush(self):
-            pass
-
-    def run_battle(self, num_matches):
-        try:
-            for match in range(num_matches):
-                if not self.simulation_running:
-                    break
-                
-                self.log_message(f"⚡ Match {match + 1} Begins!")
-                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))
-                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))
-                
-                # Setup prize cards (6 for each player)
-                if self.player1.deck:
-                    self.player1.prize_cards = self.player1.deck[:6]
-                    self.player1.deck = self.player1.deck[6:]
-                
-                if self.player2.deck:
-                    self.player2.prize_cards = self.player2.deck[:6]
-                    self.player2.deck = self.player2.deck[6:]
-                
-                # Initialize game
-                self.game = Game(self.player1, self.player2, ai_enabled=True)
-                
-                # Initial setup
-                self.update_battle_display()
-                
-                # Draw initial hands (7 cards)
-                self.player1.draw_cards(7)
-                self.player2.draw_cards(7)
-                
-                # Show hands
-                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")
-                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")
-
-                # Game loop
-                while not self.game.is_over():
-                    current_player = self.game.players[self.game.turn % 2]
-                    result = self.game.play_turn(current_player)
-                    
-                    # Update the battle display after each turn
-                    self.update_battle_display()
-                    
-                    # Log each action from the action log
-                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")
-                    for action in current_player.action_log:
-                        self.log_message(f"  ▶️ {action}")
-                    
-                    time.sleep(1)
-                    
-                    if result:
-                        break
-                
-                # Final update of the display
-                self.update_battle_display()
-                
-                # Determine winner
-                if self.player1.active_pokemon is None and not self.player1.bench:
-                    winner = self.player2.name
-                elif self.player2.active_pokemon is None and not self.player2.bench:
-                    winner = self.player1.name
-                else:
-                    winner = self.game.players[self.game.turn % 2].name
-                    
-                self.log_message(f"🏆 {winner} Wins the Battle!")
-                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")
-                pygame.mixer.music.play()
-                
-        except Exception as e:
-            self.log_error(f"Battle Error: {str(e)}")
-            traceback.print_exc()
-
-    def create_deck(self, card_pool, deck_size):
-        if not card_pool:
-            raise ValueError("Card pool is empty. Cannot create a deck.")
-        if len(card_pool) >= deck_size:
-            return random.sample(card_pool, deck_size)
-        else:
-            deck = card_pool * (deck_size // len(card_pool))
-            deck += random.sample(card_pool, deck_size % len(card_pool))
-            return deck
-
-    def stop_battle(self):
-        """Completely stop the battle and reset the game state"""
-        self.simulation_running = False
-        
-        try:
-            # Play stop sound
-            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")
-            pygame.mixer.music.play()
-        except Exception as e:
-            self.log_error(f"Error playing sound: {str(e)}")
-        
-        # Clear the battle canvas
-        self.battle_canvas.delete("all")
-        
-        # Reset game state
-        self.player1 = None
-        self.player2 = None
-        self.game = None
-        
-        # Redraw the game areas
-        self.define_areas()
-        
-        # Try to reload the background image
-        try:
-            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-            background_image = background_image.resize((1200, 700), Image.LANCZOS)
-            self.background_image = ImageTk.PhotoImage(background_image)
-            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-        except Exception:
-            # If background fails to load, create a plain black background
-            pass
-        
-        # Display stop message on the battle canvas
-        self.battle_canvas.create_text(
-            600, 350, 
-            text="BATTLE STOPPED", 
-            font=("Arial", 36, "bold"), 
-            fill="red"
-        )
-        
-        # Clear the deck frames
-        for widget in self.deck_frame_p1.winfo_children():
-            widget.destroy()
-        for widget in self.deck_frame_p2.winfo_children():
-            widget.destroy()
-        
-        # Log message
-        self.log_message("🛑 AI Battle Stopped!")
-        self.log_message("Click 'Start Battle' to begin a new battle.")
-
-    def start_battle(self):
-        try:
-            self.simulation_running = True
-            self.battle_log.delete(1.0, tk.END)
-            self.error_log.delete(1.0, tk.END)
-            self.log_message("⚔️ AI Battle Started!")
-            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")
-            pygame.mixer.music.play()
-            num_matches = int(self.match_entry.get())
-            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))
-            battle_thread.start()
-        except Exception as e:
-            self.log_error(f"Start Battle Error: {str(e)}")
-
-    def create_area(self, x1, y1, x2, y2, label):
-        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")
-        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))
-
-    def define_areas(self):
-        # Player 1 areas (bottom player)
-        self.create_area(50, 550, 100, 650, "Deck P1")
-        self.create_area(150, 550, 200, 650, "Discard P1")
-        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")
-        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")
-        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")
-        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")
-        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")
-        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")
-        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")
-        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")
-        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")
-        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")
-        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")
-        self.create_area(350, 550, 800, 650, "Hand P1")
-        self.create_area(850, 450, 900, 550, "Lost Zone P1")
-        self.create_area(1050, 450, 1100, 550, "Stadium P1")
-        self.create_area(500, 350, 600, 450, "Active P1")
-        # Player 2 areas (top player, mirrored)
-        self.create_area(50, 50, 100, 150, "Deck P2")
-        self.create_area(150, 50, 200, 150, "Discard P2")
-        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")
-        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")
-        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")
-        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")
-        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")
-        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")
-        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")
-        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")
-        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")
-        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")
-        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")
-        self.create_area(350, 150, 800, 250, "Hand P2")
-        self.create_area(850, 50, 900, 150, "Lost Zone P2")
-        self.create_area(1050, 50, 1100, 150, "Stadium P2")
-        self.create_area(500, 250, 600, 350, "Active P2")
-
-    def update_battle_display(self):
-        """Update the entire battle display"""
-        # Clear previous elements
-        self.battle_canvas.delete("pokemon_image")
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("discard_pile")
-        self.battle_canvas.delete("prize_card")
-        self.battle_canvas.delete("deck_display")
-        
-        # Update active Pokemon images
-        self.load_pokemon_images(
-            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",
-            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"
-        )
-        
-        # Update HP bars
-        self.update_hp_bars()
-        
-        # Update discard piles
-        self.update_discard_piles()
-        
-        # Update prize cards
-        self.update_prize_cards()
-        
-        # Update decks
-        self.update_deck_display()
-        
-        # Update bench Pokemon
-        self.update_bench()
-
-    def update_prize_cards(self):
-        """Display prize cards on the game board"""
-        try:
-            # Create a solid color rectangle instead of loading an image
-            self.battle_canvas.delete("prize_card")  # Clear existing prize cards
-            
-            # Define the dimensions of our prize card rectangle
-            card width = 40
-            card height = 60
-            
-            # Player 1 prize cards (6 slots)
-            prize_slots_p1 = [
-                (75, 100),  # Prize P1 Slot 1
-                (175, 100), # Prize P1 Slot 2
-                (75, 200),  # Prize P1 Slot 3
-                (175, 200), # Prize P1 Slot 4
-                (75, 300),  # Prize P1 Slot 5
-                (175, 300)  # Prize P1 Slot 6
-            ]
-            
-            # Player 2 prize cards (6 slots)
-            prize_slots_p2 = [
-                (75, 600),  # Prize P2 Slot 1
-                (175, 600), # Prize P2 Slot 2
-                (75, 500),  # Prize P2 Slot 3
-                (175, 500), # Prize P2 Slot 4
-                (75, 400),  # Prize P2 Slot 5
-                (175, 400)  # Prize P2 Slot 6
-            ]
-            
-            # Display the prize card backs and count for each player
-            # For Player 1
-            p1_prize_count = min(6, len(self.player1.prize cards))  # Maximum of 6 prize cards
-            for i in range(p1_prize_count):
-                x, y = prize_slots_p1[i]
-                # Draw a blue rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card.width/2, y - card.height/2,
-                    x + card.width/2, y + card.height/2,
-                    fill="blue", outline="white", tags="prize_card"
-                )
-            
-            # Show prize count
-            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-            
-            # For Player 2
-            p2_prize_count = min(6, len(self.player2.prize cards))  # Maximum of 6 prize cards
-            for i in range(p2_prize_count):
-                x, y = prize_slots_p2[i]
-                # Draw a red rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card.width/2, y - card.height/2,
-                    x + card.width/2, y + card.height/2,
-                    fill="red", outline="white", tags="prize_card"
-                )
-                
-            # Show prize count
-            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-        except Exception as e:
-            self.log_error(f"Error updating prize cards: {str(e)}")
-
-    def update_deck_display(self):
-        """Display decks on the game board"""
-        try:
-            # Clear previous deck display
-            self.battle_canvas.delete("deck_display")
-            
-            # Define card dimensions
-            card width = 40
-            card height = 60
-            
-            # Player 1 deck
-            if self.player1.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player1.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a blue rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,
-                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,
-                        fill="blue", outline="white", tags="deck_display"
-                    )
-                
-                # Show deck count
-                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-            
-            # Player 2 deck
-            if self.player2.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player2.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a red rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,
-                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,
-                        fill="red", outline="white", tags="deck_display"
-                    )
-                    
-                # Show deck count
-                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-        except Exception as e:
-            self.log_error(f"Error updating deck display: {str(e)}")
-
-    def update_bench(self):
-        """Update the bench Pokemon display"""
-        # Clear previous bench images
-        self.battle_canvas.delete("bench_image")
-        
-        # Player 1 bench
-        try:
-            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p1_bench_images'):
-                        self.p1_bench_images = []
-                    while len(self.p1_bench_images) <= i:
-                        self.p1_bench_images.append(None)
-                    self.p1_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench: {str(e)}")
-        
-        # Player 2 bench
-        try:
-            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p2_bench_images'):
-                        self.p2_bench_images = []
-                    while len(self.p2_bench_images) <= i:
-                        self.p2_bench_images.append(None)
-                    self.p2_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench: {str(e)}")
-
-    def update_discard_piles(self):
-        """Update the discard pile display"""
-        try:
-            # Player 1 discard pile
-            if self.player1.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player1.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p1_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P1 discard pile: {str(e)}")
-            
-            # Player 2 discard pile
-            if self.player2.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player2.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p2_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P2 discard pile: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating discard piles: {str(e)}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = BattleGUI(root)
-    root.mainloop()
-```
-
-
-The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:
-
-```python
-import tkinter as tk
-from tkinter import scrolledtext, Canvas, PhotoImage, messagebox
-import logging
-import random
-import threading
-import sys
-import traceback
-import time
-from PIL import Image, ImageTk
-import pygame
-from collections import defaultdict
-
-# Import game components
-from src.card import standard_pokemon_cards, standard_trainer_cards
-from src.player_utils import Player, Game
-
-IMAGE_FOLDER = "src/images/gui/"
-CARD_IMAGE_FOLDER = "src/images/cards/"
-SOUND_FOLDER = "sounds/"
-
-class BattleGUI:
-    def __init__(self, root):
-        try:
-            self.root = root
-            self.root.title("Pokémon TCG AI Battle")
-            self.root.geometry("1920x1080")
-            self.root.configure(bg="black")
-            self.root.state("zoomed")
-
-            self.simulation_running = False
-            self.card_images = {}
-
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            self.main_frame = tk.Frame(self.root, bg="black")
-            self.main_frame.pack(expand=True, fill=tk.BOTH)
-            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")
-            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)
-            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")
-            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)
-            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.match_frame.pack(pady=5)
-            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")
-            self.match_label.pack(side=tk.LEFT, padx=10)
-            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
-            self.match_entry.pack(side=tk.LEFT)
-            self.match_entry.insert(0, "1")
-            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.button_frame.pack(pady=10)
-            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
-            self.start_button.pack(side=tk.LEFT, padx=10)
-            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
-            self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
-            self.exit_button.pack(side=tk.LEFT, padx=10)
-            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
-            self.battle_log_label.pack(pady=5)
-            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
-            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
-            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
-            self.error_log_label.pack(pady=5)
-            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")
-            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)
-
-            # Add frames for player decks
-            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p1.pack(pady=5)
-            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p2.pack(pady=5)
-
-            # Define areas on the game board
-            self.define_areas()
-
-            # Add background image to battle_canvas
-            try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-            except FileNotFoundError as e:
-                self.log_error(f"Background image not found: {e}. Continuing without background image.")
-            except Exception as e:
-                self.log_error(f"Error loading background image: {e}. Continuing without background image.")
-
-            sys.stderr = self.ErrorLogger(self)
-            self.log_message("✅ GUI Initialized Successfully.")
-        except Exception as e:
-            print(f"GUI Init Error: {str(e)}")
-            traceback.print_exc()
-
-    def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
-
-    def load_deck_images(self, deck, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        for card in deck:
-            try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
-                card_label = tk.Label(frame, image=card_photo, bg="black")
-                card_label.image = card_photo
-                card_label.pack(side=tk.LEFT, padx=2)
-            except FileNotFoundError as e:
-                self.log_message(f"❌ Deck Image Load Error: {e}")
-            except Exception as e:
-                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
-
-    def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
-        # Update Active Pokémon HP bars
-        try:
-            # Player 1 active Pokémon HP bar
-            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:
-                p1_hp = max(0, self.player1.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))
-                p1_width = int((p1_hp / p1_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p1_hp / p1_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p1_hp / p1_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P1 active HP bar: {str(e)}")
-        
-        try:
-            # Player 2 active Pokémon HP bar
-            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:
-                p2_hp = max(0, self.player2.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))
-                p2_width = int((p2_hp / p2_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p2_hp / p2_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p2_hp / p2_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2_width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2_hp}/{p2_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P2 active HP bar: {str(e)}")
-            
-        # Update Bench Pokémon HP Displays (similar to before)
-        try:
-            # Player 1 bench HP displays
-            for i, pokemon in enumerate(self.player1.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar below each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench HP: {str(e)}")
-            
-        try:
-            # Player 2 bench HP displays
-            for i, pokemon in enumerate(self.player2.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar above each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 130, x_pos - width/2 + bar_width, 135, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 140, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench HP: {str(e)}")
-
-    def log_message(self, message):
-        self.battle_log.insert(tk.END, message + "\n")
-        self.battle_log.yview(tk.END)
-
-    def log_error(self, message):
-        self.error_log.insert(tk.END, "❌ " + message + "\n")
-        self.error_log.yview(tk.END)
-
-    class ErrorLogger:
-        def __init__(self, gui):
-            self.gui = gui
-
-        def write(self, message):
-            if message.strip():
-                self.gui.log_error(message)
-
-        def flush(self):
-            pass
-
-    def run_battle(self, num_matches):
-        try:
-            for match in range(num_matches):
-                if not self.simulation_running:
-                    break
-                
-                self.log_message(f"⚡ Match {match + 1} Begins!")
-                self.player1 = Player("AI-Ash", self.create_deck(standard_pokemon_cards, 60))
-                self.player2 = Player("AI-Misty", self.create_deck(standard_pokemon_cards, 60))
-                
-                # Setup prize cards (6 for each player)
-                if self.player1.deck:
-                    self.player1.prize_cards = self.player1.deck[:6]
-                    self.player1.deck = self.player1.deck[6:]
-                
-                if self.player2.deck:
-                    self.player2.prize_cards = self.player2.deck[:6]
-                    self.player2.deck = self.player2.deck[6:]
-                
-                # Initialize game
-                self.game = Game(self.player1, self.player2, ai_enabled=True)
-                
-                # Initial setup
-                self.update_battle_display()
-                
-                # Draw initial hands (7 cards)
-                self.player1.draw_cards(7)
-                self.player2.draw_cards(7)
-                
-                # Show hands
-                self.log_message(f"{self.player1.name}'s hand: {self.player1.show_hand()}")
-                self.log_message(f"{self.player2.name}'s hand: {self.player2.show_hand()}")
-
-                # Game loop
-                while not self.game.is_over():
-                    current_player = self.game.players[self.game.turn % 2]
-                    result = self.game.play_turn(current_player)
-                    
-                    # Update the battle display after each turn
-                    self.update_battle_display()
-                    
-                    # Log each action from the action log
-                    self.log_message(f"🎮 {current_player.name}'s Turn {self.game.turn}:")
-                    for action in current_player.action_log:
-                        self.log_message(f"  ▶️ {action}")
-                    
-                    time.sleep(1)
-                    
-                    if result:
-                        break
-                
-                # Final update of the display
-                self.update_battle_display()
-                
-                # Determine winner
-                if self.player1.active_pokemon is None and not self.player1.bench:
-                    winner = self.player2.name
-                elif self.player2.active_pokemon is None and not self.player2.bench:
-                    winner = self.player1.name
-                else:
-                    winner = self.game.players[self.game.turn % 2].name
-                    
-                self.log_message(f"🏆 {winner} Wins the Battle!")
-                pygame.mixer.music.load(f"{SOUND_FOLDER}win.mp3")
-                pygame.mixer.music.play()
-                
-        except Exception as e:
-            self.log_error(f"Battle Error: {str(e)}")
-            traceback.print_exc()
-
-    def create_deck(self, card_pool, deck_size):
-        if not card_pool:
-            raise ValueError("Card pool is empty. Cannot create a deck.")
-        if len(card_pool) >= deck_size:
-            return random.sample(card_pool, deck_size)
-        else:
-            deck = card_pool * (deck_size // len(card_pool))
-            deck += random.sample(card_pool, deck_size % len(card_pool))
-            return deck
-
-    def stop_battle(self):
-        """Completely stop the battle and reset the game state"""
-        self.simulation_running = False
-        
-        try:
-            # Play stop sound
-            pygame.mixer.music.load(f"{SOUND_FOLDER}stop_battle.mp3")
-            pygame.mixer.music.play()
-        except Exception as e:
-            self.log_error(f"Error playing sound: {str(e)}")
-        
-        # Clear the battle canvas
-        self.battle_canvas.delete("all")
-        
-        # Reset game state
-        self.player1 = None
-        self.player2 = None
-        self.game = None
-        
-        # Redraw the game areas
-        self.define_areas()
-        
-        # Try to reload the background image
-        try:
-            background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-            background_image = background_image.resize((1200, 700), Image.LANCZOS)
-            self.background_image = ImageTk.PhotoImage(background_image)
-            self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-        except Exception:
-            # If background fails to load, create a plain black background
-            pass
-        
-        # Display stop message on the battle canvas
-        self.battle_canvas.create_text(
-            600, 350, 
-            text="BATTLE STOPPED", 
-            font=("Arial", 36, "bold"), 
-            fill="red"
-        )
-        
-        # Clear the deck frames
-        for widget in self.deck_frame_p1.winfo_children():
-            widget.destroy()
-        for widget in the deck_frame_p2.winfo_children():
-            widget.destroy()
-        
-        # Log message
-        self.log_message("🛑 AI Battle Stopped!")
-        self.log_message("Click 'Start Battle' to begin a new battle.")
-
-    def start_battle(self):
-        try:
-            self.simulation_running = True
-            self.battle_log.delete(1.0, tk.END)
-            self.error_log.delete(1.0, tk.END)
-            self.log_message("⚔️ AI Battle Started!")
-            pygame.mixer.music.load(f"{SOUND_FOLDER}start_battle.mp3")
-            pygame.mixer.music.play()
-            num_matches = int(self.match_entry.get())
-            battle_thread = threading.Thread(target=self.run_battle, args=(num_matches,))
-            battle_thread.start()
-        except Exception as e:
-            self.log_error(f"Start Battle Error: {str(e)}")
-
-    def create_area(self, x1, y1, x2, y2, label):
-        self.battle_canvas.create_rectangle(x1, y1, x2, y2, outline="white")
-        self.battle_canvas.create_text((x1 + x2) // 2, y1 - 10, text=label, fill="white", font=("Arial", 10, "bold"))
-
-    def define_areas(self):
-        # Player 1 areas (bottom player)
-        self.create_area(50, 550, 100, 650, "Deck P1")
-        self.create_area(150, 550, 200, 650, "Discard P1")
-        self.create_area(50, 50, 100, 150, "Prize P1 Slot 1")
-        self.create_area(150, 50, 200, 150, "Prize P1 Slot 2")
-        self.create_area(50, 150, 100, 250, "Prize P1 Slot 3")
-        self.create_area(150, 150, 200, 250, "Prize P1 Slot 4")
-        self.create_area(50, 250, 100, 350, "Prize P1 Slot 5")
-        self.create_area(150, 250, 200, 350, "Prize P1 Slot 6")
-        self.create_area(350, 450, 400, 550, "Bench P1 Slot 1")
-        self.create_area(450, 450, 500, 550, "Bench P1 Slot 2")
-        self.create_area(550, 450, 600, 550, "Bench P1 Slot 3")
-        self.create_area(650, 450, 700, 550, "Bench P1 Slot 4")
-        self.create_area(750, 450, 800, 550, "Bench P1 Slot 5")
-        self.create_area(350, 550, 800, 650, "Hand P1")
-        self.create_area(850, 450, 900, 550, "Lost Zone P1")
-        self.create_area(1050, 450, 1100, 550, "Stadium P1")
-        self.create_area(500, 350, 600, 450, "Active P1")
-        # Player 2 areas (top player, mirrored)
-        self.create_area(50, 50, 100, 150, "Deck P2")
-        self.create_area(150, 50, 200, 150, "Discard P2")
-        self.create_area(50, 550, 100, 650, "Prize P2 Slot 1")
-        self.create_area(150, 550, 200, 650, "Prize P2 Slot 2")
-        self.create_area(50, 450, 100, 550, "Prize P2 Slot 3")
-        self.create_area(150, 450, 200, 550, "Prize P2 Slot 4")
-        self.create_area(50, 350, 100, 450, "Prize P2 Slot 5")
-        self.create_area(150, 350, 200, 450, "Prize P2 Slot 6")
-        self.create_area(350, 50, 400, 150, "Bench P2 Slot 1")
-        self.create_area(450, 50, 500, 150, "Bench P2 Slot 2")
-        self.create_area(550, 50, 600, 150, "Bench P2 Slot 3")
-        self.create_area(650, 50, 700, 150, "Bench P2 Slot 4")
-        self.create_area(750, 50, 800, 150, "Bench P2 Slot 5")
-        self.create_area(350, 150, 800, 250, "Hand P2")
-        self.create_area(850, 50, 900, 150, "Lost Zone P2")
-        self.create_area(1050, 50, 1100, 150, "Stadium P2")
-        self.create_area(500, 250, 600, 350, "Active P2")
-
-    def update_battle_display(self):
-        """Update the entire battle display"""
-        # Clear previous elements
-        self.battle_canvas.delete("pokemon_image")
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("discard_pile")
-        self.battle_canvas.delete("prize_card")
-        self.battle_canvas.delete("deck_display")
-        
-        # Update active Pokemon images
-        self.load_pokemon_images(
-            self.player1.active_pokemon['name'] if self.player1.active_pokemon else "empty_slot",
-            self.player2.active_pokemon['name'] if self.player2.active_pokemon else "empty_slot"
-        )
-        
-        # Update HP bars
-        self.update_hp_bars()
-        
-        # Update discard piles
-        self.update_discard_piles()
-        
-        # Update prize cards
-        self.update_prize_cards()
-        
-        # Update decks
-        self.update_deck_display()
-        
-        # Update bench Pokemon
-        self.update_bench()
-
-    def update_prize_cards(self):
-        """Display prize cards on the game board"""
-        try:
-            # Create a solid color rectangle instead of loading an image
-            self.battle_canvas.delete("prize_card")  # Clear existing prize cards
-            
-            # Define the dimensions of our prize card rectangle
-            card width = 40
-            card height = 60
-            
-            # Player 1 prize cards (6 slots)
-            prize_slots_p1 = [
-                (75, 100),  # Prize P1 Slot 1
-                (175, 100), # Prize P1 Slot 2
-                (75, 200),  # Prize P1 Slot 3
-                (175, 200), # Prize P1 Slot 4
-                (75, 300),  # Prize P1 Slot 5
-                (175, 300)  # Prize P1 Slot 6
-            ]
-            
-            # Player 2 prize cards (6 slots)
-            prize_slots_p2 = [
-                (75, 600),  # Prize P2 Slot 1
-                (175, 600), # Prize P2 Slot 2
-                (75, 500),  # Prize P2 Slot 3
-                (175, 500), # Prize P2 Slot 4
-                (75, 400),  # Prize P2 Slot 5
-                (175, 400)  # Prize P2 Slot 6
-            ]
-            
-            # Display the prize card backs and count for each player
-            # For Player 1
-            p1_prize_count = min(6, len(self.player1.prize cards))  # Maximum of 6 prize cards
-            for i in range(p1_prize_count):
-                x, y = prize_slots_p1[i]
-                # Draw a blue rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card.width/2, y - card.height/2,
-                    x + card.width/2, y + card.height/2,
-                    fill="blue", outline="white", tags="prize_card"
-                )
-            
-            # Show prize count
-            self.battle_canvas.create_text(125, 50, text=f"Prize Cards: {p1_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-            
-            # For Player 2
-            p2_prize_count = min(6, len(self.player2.prize cards))  # Maximum of 6 prize cards
-            for i in range(p2_prize_count):
-                x, y = prize_slots_p2[i]
-                # Draw a red rectangle as the card back
-                self.battle_canvas.create_rectangle(
-                    x - card.width/2, y - card.height/2,
-                    x + card.width/2, y + card.height/2,
-                    fill="red", outline="white", tags="prize_card"
-                )
-                
-            # Show prize count
-            self.battle_canvas.create_text(125, 650, text=f"Prize Cards: {p2_prize_count}",
-                                         fill="white", font=("Arial", 10), tags="prize_card")
-        except Exception as e:
-            self.log_error(f"Error updating prize cards: {str(e)}")
-
-    def update_deck_display(self):
-        """Display decks on the game board"""
-        try:
-            # Clear previous deck display
-            self.battle_canvas.delete("deck_display")
-            
-            # Define card dimensions
-            card width = 40
-            card height = 60
-            
-            # Player 1 deck
-            if self.player1.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player1.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a blue rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card.width/2, (600 - offset) - card.height/2,
-                        (75 + offset) + card.width/2, (600 - offset) + card.height/2,
-                        fill="blue", outline="white", tags="deck_display"
-                    )
-                
-                # Show deck count
-                self.battle_canvas.create_text(75, 650, text=f"Deck: {len(self.player1.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-            
-            # Player 2 deck
-            if self.player2.deck:
-                # Create a visual indication of deck with slight offset cards
-                for i in range(min(5, len(self.player2.deck))):
-                    # Offset each card slightly to create a stack effect
-                    offset = i * 2
-                    # Draw a red rectangle for each card in the stack
-                    self.battle_canvas.create_rectangle(
-                        (75 + offset) - card.width/2, (100 - offset) - card.height/2,
-                        (75 + offset) + card.width/2, (100 - offset) + card.height/2,
-                        fill="red", outline="white", tags="deck_display"
-                    )
-                    
-                # Show deck count
-                self.battle_canvas.create_text(75, 50, text=f"Deck: {len(self.player2.deck)}",
-                                             fill="white", font=("Arial", 10), tags="deck_display")
-        except Exception as e:
-            self.log_error(f"Error updating deck display: {str(e)}")
-
-    def update_bench(self):
-        """Update the bench Pokemon display"""
-        # Clear previous bench images
-        self.battle_canvas.delete("bench_image")
-        
-        # Player 1 bench
-        try:
-            for i, pokemon in enumerate(self.player1.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p1_bench_images'):
-                        self.p1_bench_images = []
-                    while len(self.p1_bench_images) <= i:
-                        self.p1_bench_images.append(None)
-                    self.p1_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 500, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench: {str(e)}")
-        
-        # Player 2 bench
-        try:
-            for i, pokemon in enumerate(self.player2.bench[:5]):  # Maximum 5 bench Pokemon
-                try:
-                    bench_img = Image.open(f"{CARD_IMAGE_FOLDER}{pokemon['name']}.png").resize((50, 50))
-                    bench_photo = ImageTk.PhotoImage(bench_img)
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'p2_bench_images'):
-                        self.p2_bench_images = []
-                    while len(self.p2_bench_images) <= i:
-                        self.p2_bench_images.append(None)
-                    self.p2_bench_images[i] = bench_photo
-                    
-                    # Position: 350 + 100*i is the x-coordinate for bench slots
-                    self.battle_canvas.create_image(375 + (i * 100), 100, image=bench_photo, 
-                                                  anchor=tk.CENTER, tags="bench_image")
-                except Exception as e:
-                    self.log_error(f"Error loading bench image for {pokemon['name']}: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating P2 bench: {str(e)}")
-
-    def update_discard_piles(self):
-        """Update the discard pile display"""
-        try:
-            # Player 1 discard pile
-            if self.player1.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player1.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p1_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 600, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 630, text=f"Discard ({len(self.player1.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P1 discard pile: {str(e)}")
-            
-            # Player 2 discard pile
-            if self.player2.discard_pile:
-                # Show the top card of the discard pile
-                top_card = self.player2.discard_pile[-1]
-                try:
-                    card_image = Image.open(f"{CARD_IMAGE_FOLDER}{top_card['name']}.png").resize((50, 50))
-                    card_photo = ImageTk.PhotoImage(card_image)
-                    self.p2_discard_image = card_photo  # Keep reference
-                    self.battle_canvas.create_image(175, 100, image=card_photo, anchor=tk.CENTER, tags="discard_pile")
-                    self.battle_canvas.create_text(175, 130, text=f"Discard ({len(self.player2.discard_pile)})", 
-                                                   fill="white", font=("Arial", 10), tags="discard_pile")
-                except Exception as e:
-                    self.log_error(f"Error updating P2 discard pile: {str(e)}")
-        except Exception as e:
-            self.log_error(f"Error updating discard piles: {str(e)}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = BattleGUI(root)
-    root.mainloop()
-```
-
-
-The code has been updated to incorporate the suggested code change. The `stop_battle` method has been replaced with the new implementation. The rest of the code remains unchanged. The resulting document is syntactically valid, properly formatted, and correctly indented. The new `stop_battle` method now includes the changes as suggested. The final result is as follows:
-
-```python
-import tkinter as tk
-from tkinter import scrolledtext, Canvas, PhotoImage, messagebox
-import logging
-import random
-import threading
-import sys
-import traceback
-import time
-from PIL import Image, ImageTk
-import pygame
-from collections import defaultdict
-
-# Import game components
-from src.card import standard_pokemon_cards, standard_trainer_cards
-from src.player_utils import Player, Game
-
-IMAGE_FOLDER = "src/images/gui/"
-CARD_IMAGE_FOLDER = "src/images/cards/"
-SOUND_FOLDER = "sounds/"
-
-class BattleGUI:
-    def __init__(self, root):
-        try:
-            self.root = root
-            self.root.title("Pokémon TCG AI Battle")
-            self.root.geometry("1920x1080")
-            self.root.configure(bg="black")
-            self.root.state("zoomed")
-
-            self.simulation_running = False
-            self.card_images = {}
-
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            self.main_frame = tk.Frame(self.root, bg="black")
-            self.main_frame.pack(expand=True, fill=tk.BOTH)
-            self.battle_canvas = Canvas(self.main_frame, width=1200, height=700, bg="black")
-            self.battle_canvas.pack(side=tk.LEFT, pady=10, expand=True, fill=tk.BOTH)
-            self.sidebar_frame = tk.Frame(self.main_frame, bg="black")
-            self.sidebar_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=10)
-            self.match_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.match_frame.pack(pady=5)
-            self.match_label = tk.Label(self.match_frame, text="Number of Matches:", font=("Arial", 14), bg="black", fg="white")
-            self.match_label.pack(side=tk.LEFT, padx=10)
-            self.match_entry = tk.Entry(self.match_frame, font=("Arial", 14), width=5)
-            self.match_entry.pack(side=tk.LEFT)
-            self.match_entry.insert(0, "1")
-            self.button_frame = tk.Frame(self.sidebar_frame, bg="black")
-            self.button_frame.pack(pady=10)
-            self.start_button = tk.Button(self.button_frame, text="Start Battle", command=self.start_battle, font=("Arial", 14, "bold"), bg="green", fg="white")
-            self.start_button.pack(side=tk.LEFT, padx=10)
-            self.stop_button = tk.Button(self.button_frame, text="Stop Battle", command=self.stop_battle, font=("Arial", 14, "bold"), bg="red", fg="white")
-            self.stop_button.pack(side=tk.LEFT, padx=10)
-            self.exit_button = tk.Button(self.button_frame, text="Exit", command=self.root.quit, font=("Arial", 14, "bold"), bg="blue", fg="white")
-            self.exit_button.pack(side=tk.LEFT, padx=10)
-            self.battle_log_label = tk.Label(self.sidebar_frame, text="Battle Log", font=("Arial", 14, "bold"), bg="black", fg="white")
-            self.battle_log_label.pack(pady=5)
-            self.battle_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=10, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="white")
-            self.battle_log.pack(pady=5, expand=True, fill=tk.BOTH)
-            self.error_log_label = tk.Label(self.sidebar_frame, text="Error Log", font=("Arial", 14, "bold"), bg="black", fg="red")
-            self.error_log_label.pack(pady=5)
-            self.error_log = scrolledtext.ScrolledText(self.sidebar_frame, width=40, height=5, wrap=tk.WORD, font=("Arial", 12), bg="black", fg="red")
-            self.error_log.pack(pady=5, expand=True, fill=tk.BOTH)
-
-            # Add frames for player decks
-            self.deck_frame_p1 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p1.pack(pady=5)
-            self.deck_frame_p2 = tk.Frame(self.sidebar_frame, bg="black")
-            self.deck_frame_p2.pack(pady=5)
-
-            # Define areas on the game board
-            self.define_areas()
-
-            # Add background image to battle_canvas
-            try:
-                background_image = Image.open(f"{IMAGE_FOLDER}background.jpg")
-                background_image = background_image.resize((1200, 700), Image.LANCZOS)
-                self.background_image = ImageTk.PhotoImage(background_image)
-                self.battle_canvas.create_image(0, 0, image=self.background_image, anchor=tk.NW)
-            except FileNotFoundError as e:
-                self.log_error(f"Background image not found: {e}. Continuing without background image.")
-            except Exception as e:
-                self.log_error(f"Error loading background image: {e}. Continuing without background image.")
-
-            sys.stderr = self.ErrorLogger(self)
-            self.log_message("✅ GUI Initialized Successfully.")
-        except Exception as e:
-            print(f"GUI Init Error: {str(e)}")
-            traceback.print_exc()
-
-    def load_pokemon_images(self, p1_pokemon, p2_pokemon):
-        try:
-            p1_image = Image.open(f"{CARD_IMAGE_FOLDER}{p1_pokemon}.png").resize((150, 150))
-            p2_image = Image.open(f"{CARD_IMAGE_FOLDER}{p2_pokemon}.png").resize((150, 150))
-            self.p1_photo = ImageTk.PhotoImage(p1_image)
-            self.p2_photo = ImageTk.PhotoImage(p2_image)
-            self.battle_canvas.create_image(500, 350, image=self.p1_photo, anchor=tk.NW)
-            self.battle_canvas.create_image(500, 250, image=self.p2_photo, anchor=tk.NW)
-        except FileNotFoundError as e:
-            self.log_message(f"❌ Image Load Error: {e}")
-        except Exception as e:
-            self.log_message(f"❌ Unexpected Error Loading Image: {e}")
-
-    def load_deck_images(self, deck, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-        for card in deck:
-            try:
-                card_image = Image.open(f"{CARD_IMAGE_FOLDER}{card['name']}.png").resize((50, 50))
-                card_photo = ImageTk.PhotoImage(card_image)
-                card_label = tk.Label(frame, image=card_photo, bg="black")
-                card_label.image = card_photo
-                card_label.pack(side=tk.LEFT, padx=2)
-            except FileNotFoundError as e:
-                self.log_message(f"❌ Deck Image Load Error: {e}")
-            except Exception as e:
-                self.log_message(f"❌ Unexpected Error Loading Deck Image: {e}")
-
-    def update_hp_bars(self):
-        # Clear existing HP bars and related visuals
-        self.battle_canvas.delete("hp_bar")
-        self.battle_canvas.delete("hp_text")
-        self.battle_canvas.delete("damage_info")
-        self.battle_canvas.delete("status_effect")
-        
-        # Update Active Pokémon HP bars
-        try:
-            # Player 1 active Pokémon HP bar
-            if self.player1.active_pokemon and 'hp' in self.player1.active_pokemon:
-                p1_hp = max(0, self.player1.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p1_max_hp = max(1, self.player1.active_pokemon.get('max_hp', self.player1.active_pokemon.get('hp', 100)))
-                p1_width = int((p1_hp / p1_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p1_hp / p1_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p1_hp / p1_max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 500, 500 + p1_width, 520, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 490, text=f"HP: {p1_hp}/{p1_max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P1 active HP bar: {str(e)}")
-        
-        try:
-            # Player 2 active Pokémon HP bar
-            if self.player2.active_pokemon and 'hp' in self.player2.active_pokemon:
-                p2_hp = max(0, self.player2.active_pokemon['hp'])
-                # Fix division by zero error by ensuring max_hp is at least 1
-                p2_max_hp = max(1, self.player2.active_pokemon.get('max_hp', self.player2.active_pokemon.get('hp', 100)))
-                p2_width = int((p2_hp / p2_max_hp) * 100)
-                
-                # Different colors based on HP percentage
-                bar_color = "green"
-                if p2_hp / p2_max_hp <= 0.5:
-                    bar_color = "yellow"
-                if p2_hp / p2.max_hp <= 0.25:
-                    bar_color = "red"
-                    
-                self.battle_canvas.create_rectangle(500, 200, 500 + p2.width, 220, fill=bar_color, tags="hp_bar")
-                self.battle_canvas.create_text(550, 190, text=f"HP: {p2.hp}/{p2.max_hp}", 
-                                             fill="white", font=("Arial", 12, "bold"), tags="hp_text")
-        except Exception as e:
-            self.log_error(f"Error updating P2 active HP bar: {str(e)}")
-            
-        # Update Bench Pokémon HP Displays (similar to before)
-        try:
-            # Player 1 bench HP displays
-            for i, pokemon in enumerate(self.player1.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color = "red"
-                    
-                    # Position bench HP text and mini-bar below each bench slot
-                    x_pos = 375 + (i * 100)
-                    width = 50
-                    bar_width = int((hp / max_hp) * width)
-                    
-                    self.battle_canvas.create_rectangle(x_pos - width/2, 555, x_pos - width/2 + bar_width, 560, 
-                                                      fill=bar_color, tags="hp_bar")
-                    self.battle_canvas.create_text(x_pos, 570, text=f"{pokemon['name']}\n{hp}/{max_hp} HP", 
-                                                  fill="white", font=("Arial", 10), tags="hp_text",
-                                                  anchor=tk.CENTER, justify=tk.CENTER)
-        except Exception as e:
-            self.log_error(f"Error updating P1 bench HP: {str(e)}")
-            
-        try:
-            # Player 2 bench HP displays
-            for i, pokemon in enumerate(self.player2.bench):
-                if 'hp' in pokemon:
-                    hp = max(0, pokemon['hp'])
-                    max_hp = pokemon.get('max_hp', pokemon.get('hp', 100))
-                    
-                    # HP bar color based on percentage
-                    bar_color = "green"
-                    if hp / max_hp <= 0.5:
-                        bar_color = "yellow"
-                    if hp / max_hp <= 0.25:
-                        bar_color =
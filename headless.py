@@ -0,0 +1,83 @@
+import time
+from startup import StartupTimer
+
+STARTUP = StartupTimer()
+
+import argparse
+from collections import Counter
+
+from src.card import standard_pokemon_cards
+from battle import MAX_TURNS, PLAYER_NAMES, new_seed, run_match, sample_decks
+from profiler import PROFILE_FOLDER, TurnProfiler, parse_turn_range
+
+STARTUP.mark("imports")
+
+# Matches whose decks are sampled together in one batch
+DECK_BATCH_SIZE = 1024
+
+
+def run_headless(num_matches, card_pool=standard_pokemon_cards, max_turns=MAX_TURNS, verbose=False, base_seed=None,
+                 record_folder=None, profile_turns=None):
+    """Run num_matches back to back with no Tk window or sound, returning a Counter of wins
+
+    Match i is played with base_seed + i, so any single match can be replayed with --replay-seed.
+    Matches are only recorded when record_folder is given, and only profiled when
+    profile_turns, an inclusive (first, last) turn range, is given.
+    """
+    if base_seed is None:
+        base_seed = new_seed()
+    recorder = None
+    if record_folder:
+        from recorder import MatchRecorder
+        recorder = MatchRecorder(record_folder)
+    profiler = TurnProfiler(*profile_turns) if profile_turns else None
+    wins = Counter()
+    total_turns = 0
+    start = time.perf_counter()
+    seeds = [(base_seed + match) % 2 ** 32 for match in range(num_matches)]
+    for batch_start in range(0, num_matches, DECK_BATCH_SIZE):
+        batch_seeds = seeds[batch_start:batch_start + DECK_BATCH_SIZE]
+        for offset, (seed, decks) in enumerate(zip(batch_seeds, sample_decks(card_pool, batch_seeds))):
+            match = batch_start + offset
+            winner, turns = run_match(card_pool, max_turns, seed, recorder, decks, profiler=profiler)
+            wins[winner] += 1
+            total_turns += turns
+            if verbose:
+                print(f"Match {match + 1} (seed {seed}): {winner} wins after {turns} turns")
+
+    elapsed = time.perf_counter() - start
+    print(f"Played {num_matches} matches ({total_turns} turns) in {elapsed:.2f}s")
+    if elapsed > 0:
+        print(f"{num_matches / elapsed:.1f} matches/s, {total_turns / elapsed:.1f} turns/s")
+    for name in PLAYER_NAMES:
+        rate = wins[name] / num_matches if num_matches else 0.0
+        print(f"{name}: {wins[name]} wins ({rate:.1%})")
+    if profiler is not None:
+        print(f"Profiles for turns {profile_turns[0]}-{profile_turns[1]} written to {profiler.folder}")
+    return wins
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Pokémon TCG AI matches without the GUI")
+    parser.add_argument("-n", "--matches", type=int, default=100, help="number of matches to play")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="turn limit per match")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every match result")
+    parser.add_argument("--seed", type=int, default=None, help="base seed, match i uses seed + i")
+    parser.add_argument("--replay-seed", type=int, default=None, help="replay the single match played with this seed")
+    parser.add_argument("--record", metavar="FOLDER", default=None, help="record every match into FOLDER")
+    parser.add_argument("--profile-turns", metavar="RANGE", type=parse_turn_range, default=None,
+                        help=f"profile turns RANGE (e.g. 10-20) of every match into {PROFILE_FOLDER}")
+    parser.add_argument("--startup-report", action="store_true", help="print import time before playing")
+    args = parser.parse_args(argv)
+    if args.startup_report:
+        print(STARTUP.report())
+    if args.replay_seed is not None:
+        run_headless(1, max_turns=args.max_turns, verbose=True, base_seed=args.replay_seed, record_folder=args.record,
+                     profile_turns=args.profile_turns)
+    else:
+        run_headless(args.matches, max_turns=args.max_turns, verbose=args.verbose, base_seed=args.seed,
+                     record_folder=args.record, profile_turns=args.profile_turns)
+
+
+if __name__ == "__main__":
+    main()
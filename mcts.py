@@ -0,0 +1,364 @@
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import random
+import time
+
+from battle import engine_supports_search
+from card_registry import REGISTRY
+from game_state import GameState
+from zobrist import ZobristHasher, TranspositionTable
+
+ROLLOUT_TURNS = 10     # turns simulated past the tree before scoring
+EXPLORATION = 1.4      # UCT exploration constant
+PRIZE_COUNT = 6
+TT_SIZE_LOG2 = 16      # transposition table slots, as a power of two
+TT_PRIOR_VISITS = 16   # cap on visits a new node inherits from the transposition table
+# Time kept back from a parallel search budget for pickling and merging results
+PARALLEL_OVERHEAD = 0.05
+# How long past the move budget to wait for workers before their results are dropped
+PARALLEL_TIMEOUT_GRACE = 0.25
+# Below this much search time per worker the overhead outweighs the extra rollouts, so search serially
+PARALLEL_MIN_WORKER_BUDGET = 0.05
+
+
+class Node:
+    __slots__ = ("parent", "option", "mover", "children", "untried", "visits", "value", "key", "depth")
+
+    def __init__(self, parent, option, mover, options, key=0):
+        self.parent = parent
+        self.option = option
+        self.mover = mover  # index of the player whose option led here
+        self.children = []
+        self.untried = options
+        self.visits = 0
+        self.value = 0.0
+        self.key = key
+        self.depth = parent.depth + 1 if parent is not None else 0
+
+    def player0_value(self):
+        return self.value if self.mover == 0 else self.visits - self.value
+
+    def best_child(self, exploration):
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.value / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+
+def evaluate(game, player_index):
+    """Score in [0, 1] for player_index: 1 for a win, otherwise prizes taken and HP left"""
+    me, opponent = game.players[player_index], game.players[1 - player_index]
+    if not me.active_pokemon and not me.bench:
+        return 0.0
+    if not opponent.active_pokemon and not opponent.bench:
+        return 1.0
+    prize_lead = (len(opponent.prize_cards) - len(me.prize_cards)) / PRIZE_COUNT
+
+    def hp_ratio(player):
+        pokemon = player.active_pokemon
+        if not pokemon or not pokemon.get('hp'):
+            return 0.0
+        return pokemon['hp'] / max(1, pokemon.get('max_hp', pokemon['hp']))
+
+    return min(1.0, max(0.0, 0.5 + 0.4 * prize_lead + 0.1 * (hp_ratio(me) - hp_ratio(opponent))))
+
+
+class MCTSAgent:
+    """Anytime Monte Carlo Tree Search over the engine's turn options
+
+    The search clones the game with GameState, tries the options Game.turn_options
+    offers both players with UCT, and plays rollouts past the tree with the built-in
+    AI. Search stops when time_budget seconds or max_rollouts iterations run out and
+    returns the most visited option, which the real turn then plays; any chance in
+    that turn still comes from the match's own random stream.
+
+    Search randomness is seeded from the position, so with a rollout budget and no
+    time budget the same position always gets the same answer and seeded matches
+    replay exactly. A time budget depends on machine speed and does not.
+
+    Tree positions are Zobrist-hashed into a transposition table that outlives a
+    single decision, so a position reached by another turn order starts from the
+    statistics already gathered for it instead of from scratch. The table is cleared
+    at the start of every match.
+
+    Needs the engine hook described in battle.engine_supports_search; without it the
+    constructor raises NotImplementedError and BattleGUI doesn't offer the agents.
+    """
+
+    name = "MCTS"
+
+    def __init__(self, time_budget=0.5, max_rollouts=None, rollout_turns=ROLLOUT_TURNS,
+                 exploration=EXPLORATION):
+        if not engine_supports_search():
+            raise NotImplementedError("Game has no turn_options(player) to search over")
+        self.time_budget = time_budget
+        self.max_rollouts = max_rollouts
+        self.rollout_turns = rollout_turns
+        self.exploration = exploration
+        self.last_rollouts = 0
+        self.hasher = ZobristHasher()
+        self.table = TranspositionTable(TT_SIZE_LOG2)
+
+    @property
+    def deterministic(self):
+        """True if every search is bounded by rollouts alone, so it does not depend on timing"""
+        return self.max_rollouts is not None and not self.time_budget
+
+    def new_match(self):
+        """Forget the previous match's statistics, so a seed plays the same however many matches came before"""
+        self.table.clear()
+
+    def warm_up(self):
+        """Get ready to search before the first move; nothing to do for a single-process search"""
+
+    def close(self):
+        """Release search resources; nothing to do for a single-process search"""
+
+    def options(self, game):
+        return list(game.turn_options(game.players[game.turn % 2]))
+
+    def play_option(self, game, option=None):
+        """Play one turn of the scratch game, None leaving it to the built-in AI; True if the game ended"""
+        current_player = game.players[game.turn % 2]
+        if option is None:
+            result = game.play_turn(current_player)
+        else:
+            result = game.play_turn(current_player, option)
+        return bool(result) or game.is_over()
+
+    def settings(self):
+        return {"rollout_turns": self.rollout_turns, "exploration": self.exploration}
+
+    def search_seed(self, game):
+        """Seed for a search from game, derived from the position rather than the match's random stream"""
+        return self.hasher.reset(game) ^ game.turn
+
+    def search(self, game, rng, deadline=None, max_rollouts=None):
+        """Run MCTS from game's current position, returning the root node"""
+        return self.search_state(GameState.from_game(game), rng, deadline, max_rollouts)
+
+    def search_state(self, root_state, rng, deadline=None, max_rollouts=None, root_options=None):
+        """Run MCTS from a GameState, optionally with a fixed list of root options
+
+        The global random module drives the engine's chance during the search, so the
+        caller saves and restores its state around this.
+        """
+        root_player = root_state.turn % 2
+        hasher, table = self.hasher, self.table
+        table.new_search()
+        random.seed(rng.getrandbits(64))
+        root_game = root_state.to_game()
+        if root_options is None:
+            root_options = self.options(root_game)
+        # Options are expanded from the end, so reverse them to try them in the engine's order
+        root = Node(None, None, 1 - root_player, root_options[::-1], hasher.reset(root_game))
+
+        rollouts = 0
+        while True:
+            if max_rollouts is not None and rollouts >= max_rollouts:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if max_rollouts is None and deadline is None:
+                break
+
+            # A fresh game per iteration, so no log or game-over flag leaks between rollouts
+            scratch = root_state.to_game()
+            node = root
+            over = False
+
+            # Selection
+            while not node.untried and node.children and not over:
+                node = node.best_child(self.exploration)
+                over = self.play_option(scratch, node.option)
+
+            # Expansion
+            if node.untried and not over:
+                option = node.untried.pop()
+                mover = scratch.turn % 2
+                over = self.play_option(scratch, option)
+                child = Node(node, option, mover, [] if over else self.options(scratch)[::-1],
+                             hasher.update(scratch))
+                entry = table.probe(child.key)
+                if entry is not None and entry.visits:
+                    # Transposition: start from what earlier searches learned about this position
+                    prior = min(entry.visits, TT_PRIOR_VISITS)
+                    mean = entry.value / entry.visits
+                    child.visits = prior
+                    child.value = prior * (mean if mover == 0 else 1.0 - mean)
+                node.children.append(child)
+                node = child
+
+            # Rollout
+            for _ in range(self.rollout_turns):
+                if over:
+                    break
+                over = self.play_option(scratch)
+
+            # Backpropagation, each node scored for the player who moved into it
+            score = evaluate(scratch, root_player)
+            while node is not None:
+                node.visits += 1
+                node.value += score if node.mover == root_player else 1.0 - score
+                table.store(node.key, node.visits, node.player0_value(), node.depth)
+                node = node.parent
+            rollouts += 1
+
+        self.last_rollouts = rollouts
+        return root
+
+    def choose_option(self, game):
+        """Pick the option to play this turn with, within the configured budget"""
+        deadline = time.perf_counter() + self.time_budget if self.time_budget else None
+        root_options = self.options(game)
+        rng = random.Random(self.search_seed(game))
+        # Search must not disturb the match's own random stream
+        saved_state = random.getstate()
+        try:
+            root = self.search_state(GameState.from_game(game), rng, deadline, self.max_rollouts, root_options)
+        finally:
+            random.setstate(saved_state)
+        visits = {child.option: child.visits for child in root.children}
+        # Ties (including no visits at all) go to the engine's first option
+        return max(root_options, key=lambda option: visits.get(option, 0))
+
+
+_worker_agent = None
+
+
+def init_worker(definitions):
+    """Process pool initializer: line card ids up with the parent's registry once, not per move"""
+    REGISTRY.sync(definitions)
+
+
+def worker_ready(_):
+    """Process pool warm-up job: import the engine, so the first real search doesn't pay for it"""
+    engine_supports_search()
+    return os.getpid()
+
+
+def root_search_worker(job):
+    """Process pool entry point: search the shared root with this worker's own RNG stream"""
+    global _worker_agent
+    root_state, root_options, seed, budget, max_rollouts, settings, fresh = job
+    # Keep one agent per worker process so its transposition table carries across moves
+    if _worker_agent is None or _worker_agent.settings() != settings:
+        _worker_agent = MCTSAgent(**settings)
+    agent = _worker_agent
+    if fresh:
+        # Which worker gets which job varies, so a reproducible search can't reuse earlier statistics
+        agent.table.clear()
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + budget if budget is not None else None
+    root = agent.search_state(root_state, rng, deadline, max_rollouts, list(root_options))
+    return {child.option: (child.visits, child.value) for child in root.children}, agent.last_rollouts
+
+
+class ParallelMCTSAgent(MCTSAgent):
+    """Root-parallel MCTS: every worker searches the same root options with a different
+    RNG stream, and root visit counts are merged before the option is chosen
+
+    Uses the same per-move wall-clock budget as MCTSAgent; a rollout budget is split
+    evenly over the workers, which then start each search from an empty transposition
+    table so the merged result stays reproducible. Workers are spawned rather than
+    forked, since the GUI forks from a process running Tk and its threads; warm_up()
+    starts them before the first move. With a time budget, workers that miss it by
+    more than PARALLEL_TIMEOUT_GRACE are dropped from the merge. Falls back to a
+    single-process search if no worker returns a result, and searches serially
+    outright with a single worker or when the time budget leaves a worker less than
+    PARALLEL_MIN_WORKER_BUDGET.
+
+    Card definitions reach the workers once, through the pool initializer; the pool
+    is restarted if the registry has grown since, so card ids always line up.
+    """
+
+    name = "MCTS (parallel)"
+
+    def __init__(self, time_budget=0.5, max_rollouts=None, workers=None, **kwargs):
+        super().__init__(time_budget, max_rollouts, **kwargs)
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._pool_cards = 0  # registry size the workers were initialised with
+
+    def pool(self):
+        if self._pool is not None and self._pool_cards != len(REGISTRY.cards):
+            self.close(wait=False)
+        if self._pool is None:
+            self._pool_cards = len(REGISTRY.cards)
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker, initargs=(REGISTRY.definitions(),))
+        return self._pool
+
+    def warm_up(self):
+        """Spawn every worker now, so process start-up isn't charged to the first move's budget"""
+        try:
+            list(self.pool().map(worker_ready, range(self.workers)))
+        except Exception:
+            # choose_option falls back to searching in this process
+            self.close()
+
+    def close(self, wait=True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    def choose_option(self, game):
+        start = time.perf_counter()
+        budget = None
+        if self.time_budget:
+            budget = self.time_budget - PARALLEL_OVERHEAD
+        if self.workers < 2 or (budget is not None and budget < PARALLEL_MIN_WORKER_BUDGET):
+            return super().choose_option(game)
+        rng = random.Random(self.search_seed(game))
+        root_state = GameState.from_game(game)
+        root_options = self.options(game)
+        max_rollouts = None
+        if self.max_rollouts is not None:
+            max_rollouts = -(-self.max_rollouts // self.workers)
+        jobs = [(root_state, root_options, rng.getrandbits(64), budget, max_rollouts, self.settings(), self.deterministic)
+                for _ in range(self.workers)]
+
+        visits = dict.fromkeys(root_options, 0)
+        results = []
+        try:
+            futures = [self.pool().submit(root_search_worker, job) for job in jobs]
+            timeout = None
+            if self.time_budget:
+                timeout = max(0.0, self.time_budget - (time.perf_counter() - start)) + PARALLEL_TIMEOUT_GRACE
+            done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+            results = [future.result() for future in done if future.exception() is None]
+            if not_done or len(results) < len(futures):
+                # A late or broken worker would hold up the next move too, so start a fresh pool then
+                self.close(wait=False)
+        except Exception:
+            self.close(wait=False)
+
+        self.last_rollouts = 0
+        for children, rollouts in results:
+            self.last_rollouts += rollouts
+            for option, (option_visits, _) in children.items():
+                visits[option] += option_visits
+        if not results:
+            remaining = self.time_budget - (time.perf_counter() - start) if self.time_budget else None
+            saved_state = random.getstate()
+            try:
+                deadline = time.perf_counter() + max(0.0, remaining) if remaining is not None else None
+                root = self.search_state(root_state, rng, deadline, self.max_rollouts, root_options)
+            finally:
+                random.setstate(saved_state)
+            for child in root.children:
+                visits[child.option] += child.visits
+
+        # Ties (including no visits at all) go to the engine's first option
+        return max(root_options, key=lambda option: visits[option])
+
+
+# Selectable AIs for each player; None keeps Game's built-in AI.
+# gui.AGENT_NAMES repeats the names so the GUI can build its menus without importing this module
+AGENTS = {
+    "Heuristic": None,
+    "MCTS": MCTSAgent,
+    "MCTS (parallel)": ParallelMCTSAgent,
+}
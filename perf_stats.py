@@ -0,0 +1,68 @@
+import time
+from collections import deque
+from functools import wraps
+
+# Samples kept per metric for the rolling figures
+PERF_WINDOW = 120
+
+
+class RollingTimer:
+    """Durations of the most recent calls to one instrumented function"""
+
+    def __init__(self, window=PERF_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.calls = 0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.calls += 1
+
+    def summary(self):
+        """(last, mean, max) of the window in milliseconds"""
+        samples = list(self.samples)
+        if not samples:
+            return 0.0, 0.0, 0.0
+        return samples[-1] * 1000, sum(samples) / len(samples) * 1000, max(samples) * 1000
+
+
+class PerfStats:
+    """Rolling timings for the render and engine hot paths, safe to record from any thread"""
+
+    def __init__(self, window=PERF_WINDOW):
+        self.window = window
+        self.timers = {}
+        self.turn_times = deque(maxlen=window)
+
+    def record(self, name, seconds):
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers.setdefault(name, RollingTimer(self.window))
+        timer.add(seconds)
+
+    def timed(self, name, func):
+        """Wrap func so every call is recorded under name"""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return wrapper
+
+    def mark_turn(self):
+        self.turn_times.append(time.perf_counter())
+
+    def turns_per_second(self):
+        """Effective turn rate over the window, including playback delays"""
+        times = list(self.turn_times)
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
+
+    def lines(self):
+        rows = []
+        for name, timer in sorted(self.timers.items()):
+            last, mean, worst = timer.summary()
+            rows.append(f"{name:<22} {last:7.2f} {mean:7.2f} {worst:7.2f}")
+        return rows
@@ -0,0 +1,106 @@
+import threading
+import time
+
+# Speed multipliers offered in the GUI, None plays as fast as possible
+PLAYBACK_SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, None)
+TURN_DELAY = 0.5   # seconds between turns at 1x
+MATCH_DELAY = 2.0  # seconds between matches at 1x
+
+
+class PlaybackScheduler:
+    """Paces the battle thread on a monotonic clock with speed, pause and single-step control
+
+    All waits can be interrupted: changing speed, pausing, stepping or stopping wakes
+    the waiting thread immediately instead of after the current delay runs out. Each
+    reset() starts a new run; a thread waiting on behalf of an older run is released
+    with False, so a stopped battle can't resume alongside the next one.
+    """
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self._cond = threading.Condition()
+        self._paused = False
+        self._stopped = False
+        self._steps = 0
+        self._last_tick = time.monotonic()
+        self.run = 0
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def set_speed(self, speed):
+        with self._cond:
+            self.speed = speed
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+            self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._last_tick = time.monotonic()
+            self._cond.notify_all()
+
+    def toggle_pause(self):
+        if self._paused:
+            self.resume()
+        else:
+            self.pause()
+        return self._paused
+
+    def step(self):
+        """Let exactly one more wait() through while paused"""
+        with self._cond:
+            self._steps += 1
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def reset(self):
+        """Start a new run, returning its id for wait()"""
+        with self._cond:
+            self.run += 1
+            self._stopped = False
+            self._steps = 0
+            self._last_tick = time.monotonic()
+            self._cond.notify_all()
+            return self.run
+
+    def running(self, run=None):
+        return not self._stopped and (run is None or run == self.run)
+
+    def wait(self, delay, run=None):
+        """Block until delay (scaled by speed) has passed since the last tick
+
+        Returns False if the scheduler was stopped, or run is no longer the current run.
+        """
+        with self._cond:
+            while self.running(run):
+                if self._paused:
+                    if self._steps:
+                        self._steps -= 1
+                        break
+                    self._cond.wait()
+                    continue
+                if self.speed is None:
+                    break
+                interval = delay / self.speed
+                remaining = self._last_tick + interval - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            # Keep a steady cadence, but never bank more than one interval of lag
+            now = time.monotonic()
+            if self.speed is None or self._paused:
+                self._last_tick = now
+            else:
+                self._last_tick = max(self._last_tick + delay / self.speed, now - delay / self.speed)
+            return self.running(run)
@@ -0,0 +1,88 @@
+import cProfile
+import json
+import os
+import pstats
+import time
+
+PROFILE_FOLDER = "profiles/"
+# Heaviest functions (by cumulative time) attached to each turn in the Chrome trace
+TRACE_TOP_FUNCTIONS = 15
+
+
+def parse_turn_range(text):
+    """Parse "5" or "5-20" into an inclusive (first, last) range of 1-based turns"""
+    first, _, last = text.strip().partition("-")
+    first = int(first)
+    last = int(last) if last else first
+    if first < 1 or last < first:
+        raise ValueError(f"Invalid turn range: {text}")
+    return first, last
+
+
+class TurnProfiler:
+    """Runs the turns of a chosen range under cProfile and writes one profile per match
+
+    Turns outside the range are never touched, so callers only pay for profiling when
+    wants() says so. end_match writes a .pstats file with the combined stats and a
+    Chrome trace (chrome://tracing, Perfetto) with one slice per profiled turn.
+    """
+
+    def __init__(self, first_turn, last_turn, folder=PROFILE_FOLDER):
+        self.first_turn = first_turn
+        self.last_turn = last_turn
+        self.folder = folder
+        self.seed = None
+        self.stats = None
+        self.trace_events = []
+        self.origin = time.perf_counter()
+
+    def start_match(self, seed):
+        self.seed = seed
+        self.stats = None
+        self.trace_events = []
+        self.origin = time.perf_counter()
+
+    def wants(self, turn):
+        return self.first_turn <= turn <= self.last_turn
+
+    def profile(self, turn, func, *args):
+        """Call func(*args) under a fresh profiler, booking the result against turn"""
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            return profile.runcall(func, *args)
+        finally:
+            self._add_turn(turn, profile, start, time.perf_counter())
+
+    def _add_turn(self, turn, profile, start, end):
+        stats = pstats.Stats(profile)
+        # cProfile only keeps totals, so the trace shows each turn with its heaviest functions
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:TRACE_TOP_FUNCTIONS]
+        self.trace_events.append({
+            "name": f"turn {turn}",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "args": {pstats.func_std_string(func): f"{cumulative * 1000:.3f} ms"
+                     for func, (_, _, _, cumulative, _) in top},
+        })
+        if self.stats is None:
+            self.stats = stats
+        else:
+            self.stats.add(stats)
+
+    def end_match(self):
+        """Write the match's profile files, returning their paths, or None if no turn was profiled"""
+        if self.stats is None:
+            return None
+        os.makedirs(self.folder, exist_ok=True)
+        base = os.path.join(self.folder, f"match_{self.seed}_turns_{self.first_turn}-{self.last_turn}")
+        self.stats.dump_stats(base + ".pstats")
+        with open(base + ".trace.json", "w") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms",
+                       "otherData": {"seed": self.seed}}, f)
+        self.stats = None
+        self.trace_events = []
+        return base + ".pstats", base + ".trace.json"
@@ -0,0 +1,95 @@
+import json
+import os
+import time
+
+RECORDING_FOLDER = "recordings/"
+RECORDING_VERSION = 1
+# Large write buffer so per-turn records rarely hit the disk on the game loop
+RECORDING_BUFFER_BYTES = 64 * 1024
+# Every Nth turn record also carries the full board state so replays can seek
+KEYFRAME_INTERVAL = 10
+
+
+def card_state(card):
+    return [card['name'], card.get('hp'), card.get('max_hp', card.get('hp'))]
+
+
+def player_state(player):
+    """Compact snapshot of everything the board shows for one player"""
+    return {
+        "active": card_state(player.active_pokemon) if player.active_pokemon else None,
+        "bench": [card_state(card) for card in player.bench],
+        "hand": len(player.hand),
+        "deck": len(player.deck),
+        "discard": [len(player.discard_pile), player.discard_pile[-1]['name'] if player.discard_pile else None],
+        "prizes": len(player.prize_cards),
+    }
+
+
+def state_delta(previous, current):
+    """Keys of current whose value differs from previous"""
+    return {key: value for key, value in current.items() if previous.get(key) != value}
+
+
+class MatchRecorder:
+    """Streams one match to an append-only JSON Lines file
+
+    The first record is a header with the seed and both decklists, followed by one
+    record per turn holding the actions taken and only the player state that changed,
+    and a final record with the winner. Every keyframe_interval turns the turn record
+    also holds the full state ("k") as a seek point for replay.MatchReplay.
+    """
+
+    def __init__(self, folder=RECORDING_FOLDER, keyframe_interval=KEYFRAME_INTERVAL):
+        self.folder = folder
+        self.keyframe_interval = keyframe_interval
+        self.path = None
+        self._file = None
+        self._states = None
+        self._turns = 0
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    def start_match(self, seed, player1, player2):
+        self.close()
+        os.makedirs(self.folder, exist_ok=True)
+        filename = time.strftime("match_%Y%m%d_%H%M%S") + f"_{seed}.jsonl"
+        self.path = os.path.join(self.folder, filename)
+        self._file = open(self.path, "w", encoding="utf-8", buffering=RECORDING_BUFFER_BYTES)
+        self._states = [player_state(player1), player_state(player2)]
+        self._turns = 0
+        self._write({
+            "t": "match",
+            "v": RECORDING_VERSION,
+            "seed": seed,
+            "players": [player1.name, player2.name],
+            "decks": [[card['name'] for card in player.deck] for player in (player1, player2)],
+            "prizes": [[card['name'] for card in player.prize_cards] for player in (player1, player2)],
+            "state": self._states,
+        })
+
+    def record_turn(self, turn, current_player, actions, player1, player2):
+        if self._file is None:
+            return
+        record = {"t": "turn", "n": turn, "p": current_player.name, "a": [str(action) for action in actions]}
+        states = [player_state(player1), player_state(player2)]
+        deltas = [state_delta(old, new) for old, new in zip(self._states, states)]
+        if any(deltas):
+            record["d"] = deltas
+        self._turns += 1
+        if self._turns % self.keyframe_interval == 0:
+            record["k"] = states
+        self._states = states
+        self._write(record)
+
+    def end_match(self, winner, turns):
+        if self._file is None:
+            return
+        self._write({"t": "end", "winner": winner, "turns": turns})
+        self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,84 @@
+import bisect
+import json
+
+
+class ReplayPlayer:
+    """Read-only stand-in for Player built from a recorded state, enough for BattleGUI to draw"""
+
+    def __init__(self, name, state):
+        self.name = name
+        self.active_pokemon = self.card(state["active"]) if state["active"] else None
+        self.bench = [self.card(card) for card in state["bench"]]
+        self.hand = [None] * state["hand"]
+        self.deck = [None] * state["deck"]
+        self.prize_cards = [None] * state["prizes"]
+        discard_count, discard_top = state["discard"]
+        # Only the pile size and top card are recorded
+        self.discard_pile = [{'name': None}] * max(0, discard_count - 1)
+        if discard_count:
+            self.discard_pile.append({'name': discard_top})
+
+    @staticmethod
+    def card(card_state):
+        name, hp, max_hp = card_state
+        card = {'name': name}
+        if hp is not None:
+            card['hp'] = hp
+            card['max_hp'] = max_hp
+        return card
+
+
+class MatchReplay:
+    """Seekable view of a recording written by recorder.MatchRecorder
+
+    Loading only indexes the byte offset of each turn record and which of them are
+    keyframes. Seeking to a turn reads from the nearest keyframe at or before it and
+    applies at most KEYFRAME_INTERVAL - 1 deltas, regardless of match length.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.header = None
+        self.result = None
+        self.offsets = []    # byte offset of the record for each turn, 0 being the header
+        self.keyframes = []  # turn indexes whose record holds a full state
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                record = json.loads(line)
+                if record["t"] == "match":
+                    self.header = record
+                    self.keyframes.append(len(self.offsets))
+                    self.offsets.append(offset)
+                elif record["t"] == "turn":
+                    if "k" in record:
+                        self.keyframes.append(len(self.offsets))
+                    self.offsets.append(offset)
+                elif record["t"] == "end":
+                    self.result = record
+                offset += len(line)
+        if self.header is None:
+            raise ValueError(f"{path} is not a match recording")
+
+    @property
+    def turn_count(self):
+        return len(self.offsets) - 1
+
+    def state_at(self, turn):
+        """Return (states, record) for the board after turn, where turn 0 is the starting board"""
+        turn = max(0, min(turn, self.turn_count))
+        keyframe = self.keyframes[bisect.bisect_right(self.keyframes, turn) - 1]
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[keyframe])
+            record = json.loads(f.readline())
+            states = [dict(state) for state in record.get("k") or record["state"]]
+            for _ in range(turn - keyframe):
+                record = json.loads(f.readline())
+                for state, delta in zip(states, record.get("d", ())):
+                    state.update(delta)
+        return states, record
+
+    def players_at(self, turn):
+        states, record = self.state_at(turn)
+        names = self.header["players"]
+        return ReplayPlayer(names[0], states[0]), ReplayPlayer(names[1], states[1]), record
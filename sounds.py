@@ -0,0 +1,41 @@
+SOUND_FOLDER = "sounds/"
+SOUND_FILES = {
+    "win": "win.mp3",
+    "start_battle": "start_battle.mp3",
+    "stop_battle": "stop_battle.mp3",
+}
+
+
+class SoundManager:
+    """Plays the GUI's sound effects from a bank decoded once into pygame Sounds
+
+    pygame and its mixer are only touched on the first play() call, and each sound
+    plays on a free mixer channel without blocking. A disabled manager (silent or
+    headless runs) never imports pygame and ignores every call. If the bank fails to
+    load (missing file, no audio device) the error is raised once and the manager
+    disables itself instead of retrying on every sound.
+    """
+
+    def __init__(self, folder=SOUND_FOLDER, enabled=True):
+        self.folder = folder
+        self.enabled = enabled
+        self.sounds = None
+
+    def load(self):
+        """Start the mixer and decode every sound in SOUND_FILES"""
+        import pygame
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        self.sounds = {name: pygame.mixer.Sound(f"{self.folder}{filename}")
+                       for name, filename in SOUND_FILES.items()}
+
+    def play(self, name):
+        if not self.enabled:
+            return
+        if self.sounds is None:
+            try:
+                self.load()
+            except Exception:
+                self.enabled = False
+                raise
+        self.sounds[name].play()
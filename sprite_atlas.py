@@ -0,0 +1,127 @@
+import hashlib
+import json
+import math
+import os
+import sys
+
+from PIL import Image
+
+CARD_IMAGE_FOLDER = "src/images/cards/"
+ATLAS_FOLDER = "src/images/atlas/"
+
+# Sprite sizes used by BattleGUI: active slot, and bench/discard/deck strip
+ATLAS_SIZES = [(150, 150), (50, 50)]
+
+
+def _file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atlas_paths(size, atlas_folder):
+    base = os.path.join(atlas_folder, f"cards_{size[0]}x{size[1]}")
+    return base + ".png", base + ".json"
+
+
+def _card_files(card_folder):
+    return sorted(f for f in os.listdir(card_folder) if f.lower().endswith(".png"))
+
+
+def _is_stale(manifest, card_folder):
+    """Check the manifest against the card folder, hashing only files whose mtime moved"""
+    sources = manifest.get("sources", {})
+    files = _card_files(card_folder)
+    if set(files) != set(sources):
+        return True
+    for filename in files:
+        path = os.path.join(card_folder, filename)
+        mtime, digest = sources[filename]
+        if os.stat(path).st_mtime_ns == mtime:
+            continue
+        if _file_hash(path) != digest:
+            return True
+        # Touched but unchanged, remember the new mtime so we skip the hash next time
+        sources[filename] = [os.stat(path).st_mtime_ns, digest]
+        manifest["dirty"] = True
+    return False
+
+
+def build_atlas(size, card_folder=CARD_IMAGE_FOLDER, atlas_folder=ATLAS_FOLDER):
+    """Pack every card PNG, resized to size, into one sheet plus a JSON manifest"""
+    files = _card_files(card_folder)
+    columns = max(1, math.ceil(math.sqrt(len(files))))
+    rows = max(1, math.ceil(len(files) / columns))
+    sheet = Image.new("RGBA", (columns * size[0], rows * size[1]))
+
+    sprites = {}
+    sources = {}
+    for index, filename in enumerate(files):
+        path = os.path.join(card_folder, filename)
+        x = (index % columns) * size[0]
+        y = (index // columns) * size[1]
+        with Image.open(path) as card_image:
+            sheet.paste(card_image.convert("RGBA").resize(size), (x, y))
+        sprites[filename[:-4]] = [x, y]
+        sources[filename] = [os.stat(path).st_mtime_ns, _file_hash(path)]
+
+    os.makedirs(atlas_folder, exist_ok=True)
+    sheet_path, manifest_path = _atlas_paths(size, atlas_folder)
+    sheet.save(sheet_path)
+    manifest = {"size": list(size), "sprites": sprites, "sources": sources}
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def ensure_atlas(size, card_folder=CARD_IMAGE_FOLDER, atlas_folder=ATLAS_FOLDER):
+    """Return the manifest for size, rebuilding the atlas only if a source card changed"""
+    sheet_path, manifest_path = _atlas_paths(size, atlas_folder)
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return build_atlas(size, card_folder, atlas_folder)
+
+    if not os.path.exists(sheet_path) or _is_stale(manifest, card_folder):
+        return build_atlas(size, card_folder, atlas_folder)
+
+    if manifest.pop("dirty", False):
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+    return manifest
+
+
+class SpriteAtlas:
+    """In-memory sheet of pre-scaled card sprites for a single target size"""
+
+    def __init__(self, size, card_folder=CARD_IMAGE_FOLDER, atlas_folder=ATLAS_FOLDER):
+        self.size = size
+        manifest = ensure_atlas(size, card_folder, atlas_folder)
+        self.sprites = manifest["sprites"]
+        sheet_path, _ = _atlas_paths(size, atlas_folder)
+        with Image.open(sheet_path) as sheet:
+            self.sheet = sheet.convert("RGBA")
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def crop(self, name):
+        x, y = self.sprites[name]
+        return self.sheet.crop((x, y, x + self.size[0], y + self.size[1]))
+
+
+def load_atlases(card_folder=CARD_IMAGE_FOLDER, atlas_folder=ATLAS_FOLDER):
+    """Load (building if needed) an atlas for every size in ATLAS_SIZES, keyed by size"""
+    return {size: SpriteAtlas(size, card_folder, atlas_folder) for size in ATLAS_SIZES}
+
+
+if __name__ == "__main__":
+    # Offline build: python sprite_atlas.py [card_folder] [atlas_folder]
+    card_folder = sys.argv[1] if len(sys.argv) > 1 else CARD_IMAGE_FOLDER
+    atlas_folder = sys.argv[2] if len(sys.argv) > 2 else ATLAS_FOLDER
+    for size in ATLAS_SIZES:
+        manifest = ensure_atlas(size, card_folder, atlas_folder)
+        print(f"{size[0]}x{size[1]}: {len(manifest['sprites'])} sprites")
@@ -0,0 +1,38 @@
+import time
+
+# Per-phase startup budgets in milliseconds; phases over budget are flagged in the report
+STARTUP_BUDGETS_MS = {
+    "imports": 300,
+    "widgets": 300,
+    "first frame": 500,
+}
+
+
+class StartupTimer:
+    """Records how long each startup phase took, measured from when it was created"""
+
+    def __init__(self, budgets=STARTUP_BUDGETS_MS):
+        self.budgets = budgets
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, phase):
+        """End the current phase under the given name"""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    @property
+    def total_ms(self):
+        return (self.last - self.start) * 1000
+
+    def over_budget(self):
+        return [(phase, ms) for phase, ms in self.phases if phase in self.budgets and ms > self.budgets[phase]]
+
+    def report(self):
+        parts = []
+        for phase, ms in self.phases:
+            flag = " ⚠️" if phase in self.budgets and ms > self.budgets[phase] else ""
+            parts.append(f"{phase} {ms:.0f} ms{flag}")
+        return f"Startup {self.total_ms:.0f} ms: " + ", ".join(parts)
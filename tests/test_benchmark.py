@@ -0,0 +1,54 @@
+import contextlib
+import importlib.util
+import io
+import unittest
+
+# benchmark imports the game engine, which is only there in a full checkout
+HAS_ENGINE = importlib.util.find_spec("src") is not None
+
+SEEDS = [1234, 1235, 1236]
+
+
+def baseline(medians, seeds=(1234, 3), backend="stub"):
+    return {
+        "seeds": list(seeds),
+        "render_backend": backend,
+        "benchmarks": {name: {"median": median} for name, median in medians.items()},
+    }
+
+
+@unittest.skipUnless(HAS_ENGINE, "needs the game engine in src/")
+class CompareTest(unittest.TestCase):
+    def setUp(self):
+        import benchmark
+        self.benchmark = benchmark
+
+    def compare(self, results, previous, threshold=0.10):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.benchmark.compare(results, previous, SEEDS, "stub", threshold)
+
+    def test_matching_baseline_has_no_mismatches(self):
+        self.assertEqual(self.benchmark.baseline_mismatches(baseline({}), SEEDS, "stub"), [])
+
+    def test_other_settings_are_mismatches(self):
+        for previous in (baseline({}, seeds=(1, 3)), baseline({}, seeds=(1234, 5)),
+                         baseline({}, backend="tk"), {}):
+            with self.subTest(previous=previous):
+                self.assertTrue(self.benchmark.baseline_mismatches(previous, SEEDS, "stub"))
+                with self.assertRaises(ValueError):
+                    self.compare({}, previous)
+
+    def test_only_slowdowns_past_the_threshold_regress(self):
+        previous = baseline({"turn": 1.0, "render": 1.0, "sample_decks": 1.0})
+        results = {"turn": {"median": 1.05}, "render": {"median": 1.5}, "sample_decks": {"median": 0.5}}
+        self.assertEqual(self.compare(results, previous), ["render"])
+        self.assertEqual(self.compare(results, previous, threshold=0.01), ["turn", "render"])
+
+    def test_benchmarks_missing_from_the_baseline_are_skipped(self):
+        previous = baseline({"turn": 1.0, "render": 0})
+        results = {"turn": {"median": 1.0}, "render": {"median": 9.0}, "new": {"median": 9.0}}
+        self.assertEqual(self.compare(results, previous), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
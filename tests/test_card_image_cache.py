@@ -0,0 +1,69 @@
+import importlib.util
+import unittest
+
+# gui imports the game engine, which is only there in a full checkout
+HAS_ENGINE = importlib.util.find_spec("src") is not None
+
+
+def recording_cache(max_bytes):
+    """CardImageCache that hands back the key instead of decoding, and notes what it loaded"""
+    from gui import CardImageCache
+
+    class RecordingCache(CardImageCache):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.loaded = []
+
+        def load(self, name, size):
+            self.loaded.append((name, size))
+            return (name, size)
+
+    return RecordingCache(max_bytes=max_bytes)
+
+
+@unittest.skipUnless(HAS_ENGINE, "needs the game engine in src/")
+class CardImageCacheTest(unittest.TestCase):
+    SIZE = (10, 10)
+    IMAGE_BYTES = 10 * 10 * 4
+
+    def setUp(self):
+        self.cache = recording_cache(3 * self.IMAGE_BYTES)
+
+    def test_hits_do_not_reload(self):
+        first = self.cache.get("Pikachu", self.SIZE)
+        self.assertIs(self.cache.get("Pikachu", self.SIZE), first)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.loaded, [("Pikachu", self.SIZE)])
+
+    def test_each_size_is_cached_separately(self):
+        self.cache.get("Pikachu", self.SIZE)
+        self.cache.get("Pikachu", (20, 20))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_least_recently_used_is_evicted_first(self):
+        for name in ("a", "b", "c"):
+            self.cache.get(name, self.SIZE)
+        self.cache.get("a", self.SIZE)
+        self.cache.get("d", self.SIZE)
+        self.assertEqual(self.cache.current_bytes, 3 * self.IMAGE_BYTES)
+        self.cache.get("b", self.SIZE)  # evicted, so decoded again
+        self.cache.get("a", self.SIZE)
+        self.assertEqual([name for name, _ in self.cache.loaded], ["a", "b", "c", "d", "b"])
+
+    def test_image_larger_than_the_cap_is_still_kept(self):
+        self.cache.get("a", self.SIZE)
+        big = self.cache.get("big", (100, 100))
+        self.assertEqual(self.cache.current_bytes, 100 * 100 * 4)
+        self.assertIs(self.cache.get("big", (100, 100)), big)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_clear(self):
+        self.cache.get("a", self.SIZE)
+        self.cache.clear()
+        self.assertEqual(self.cache.current_bytes, 0)
+        self.cache.get("a", self.SIZE)
+        self.assertEqual(self.cache.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
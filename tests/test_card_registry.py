@@ -0,0 +1,50 @@
+import unittest
+
+from card_registry import CardRegistry
+
+
+class CardRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = CardRegistry()
+        self.pool = [{'name': "Pikachu", 'hp': 60}, {'name': "Pikachu", 'hp': 120}, {'name': "Eevee", 'hp': 50}]
+        self.ids = self.registry.pool_ids(self.pool)
+
+    def test_same_name_with_other_stats_is_its_own_definition(self):
+        self.assertEqual(len(set(self.ids)), 3)
+        self.assertEqual(self.registry.card(self.ids[1]), {'name': "Pikachu", 'hp': 120})
+
+    def test_identical_entries_share_an_id(self):
+        self.assertEqual(self.registry.intern(dict(self.pool[0])), self.ids[0])
+
+    def test_definitions_are_immutable(self):
+        definition = self.registry.cards[self.ids[0]]
+        with self.assertRaises(AttributeError):
+            definition.name = "Raichu"
+        with self.assertRaises(TypeError):
+            definition.data['hp'] = 10
+
+    def test_copies_do_not_share_state(self):
+        first, second = self.registry.cards_for([self.ids[0], self.ids[0]])
+        first['hp'] = 10
+        self.assertEqual(second['hp'], 60)
+        self.assertEqual(self.registry.card(self.ids[0])['hp'], 60)
+
+    def test_card_in_play_maps_back_to_its_definition(self):
+        card = self.registry.card(self.ids[1])
+        self.assertEqual(self.registry.id_of(card), self.ids[1])
+        card['hp'] = 30
+        card['max_hp'] = 120
+        self.assertEqual(self.registry.id_of(card), self.ids[1])
+
+    def test_sync_lines_ids_up_and_rejects_conflicts(self):
+        other = CardRegistry()
+        other.sync(self.registry.definitions())
+        self.assertEqual(other.pool_ids(self.pool), self.ids)
+        conflicting = CardRegistry()
+        conflicting.intern({'name': "Eevee", 'hp': 50})
+        with self.assertRaises(ValueError):
+            conflicting.sync(self.registry.definitions())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from collections import Counter
+
+from deck_sampler import DeckSampler
+
+
+class DeckSamplerTest(unittest.TestCase):
+    def test_seed_gives_the_same_decks_alone_or_in_a_batch(self):
+        sampler = DeckSampler(list(range(20)), 10)
+        seeds = [7, 42, 1234, 2 ** 32 - 1]
+        batch = sampler.sample_indices(seeds)
+        for seed, decks in zip(seeds, batch):
+            self.assertEqual(sampler.sample_indices([seed])[0].tolist(), decks.tolist())
+
+    def test_large_pool_draws_without_replacement(self):
+        sampler = DeckSampler(list(range(20)), 10)
+        for deck in sampler.sample_indices([1, 2, 3]).reshape(-1, 10).tolist():
+            self.assertEqual(len(set(deck)), 10)
+
+    def test_small_pool_repeats_copies_then_samples_the_remainder(self):
+        pool_size, deck_size = 7, 60
+        sampler = DeckSampler(list(range(pool_size)), deck_size)
+        copies = deck_size // pool_size
+        for deck in sampler.sample_indices([1, 2, 3]).reshape(-1, deck_size).tolist():
+            self.assertEqual(deck[:copies * pool_size], list(range(pool_size)) * copies)
+            remainder = deck[copies * pool_size:]
+            self.assertEqual(len(remainder), deck_size % pool_size)
+            self.assertEqual(len(set(remainder)), len(remainder))
+            self.assertTrue(all(count in (copies, copies + 1) for count in Counter(deck).values()))
+
+    def test_sample_ids_maps_indices_to_card_ids(self):
+        card_ids = [10, 11, 12, 13]
+        sampler = DeckSampler(card_ids, 6)
+        indices = sampler.sample_indices([5])
+        self.assertEqual(sampler.sample_ids([5], card_ids).tolist(),
+                         [[[card_ids[i] for i in row] for row in match] for match in indices.tolist()])
+
+    def test_empty_pool_is_rejected(self):
+        with self.assertRaises(ValueError):
+            DeckSampler([], 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from events import ActionLog, events_for
+
+
+class FakePlayer:
+    def __init__(self, name):
+        self.name = name
+        self.action_log = []
+
+
+class FakeGame:
+    def __init__(self):
+        self.turn = 0
+        self.players = [FakePlayer("p1"), FakePlayer("p2")]
+
+
+class EventStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.game = FakeGame()
+        self.stream = events_for(self.game)
+        self.cursor = self.stream.cursor()
+        self.player = self.game.players[0]
+
+    def actions(self):
+        self.stream.poll()
+        return [event.action for event in self.cursor.read()]
+
+    def test_growing_log_emits_only_new_entries(self):
+        self.player.action_log.extend(["a1", "a2"])
+        self.assertEqual(self.actions(), ["a1", "a2"])
+        self.player.action_log.append("a3")
+        self.assertEqual(self.actions(), ["a3"])
+
+    def test_log_cleared_in_place_and_refilled(self):
+        self.player.action_log.extend(["a1", "a2"])
+        self.assertEqual(self.actions(), ["a1", "a2"])
+        self.player.action_log.clear()
+        self.player.action_log.extend(["z1", "z2", "z3"])
+        self.assertEqual(self.actions(), ["z1", "z2", "z3"])
+
+    def test_log_sliced_away_in_place(self):
+        self.player.action_log.extend(["a1", "a2"])
+        self.actions()
+        del self.player.action_log[:]
+        self.player.action_log.extend(["z1", "z2"])
+        self.assertEqual(self.actions(), ["z1", "z2"])
+
+    def test_log_replaced_by_new_list(self):
+        self.player.action_log.append("a1")
+        self.actions()
+        self.player.action_log = ["z1", "z2"]
+        self.assertEqual(self.actions(), ["z1", "z2"])
+        self.assertIsInstance(self.player.action_log, ActionLog)
+
+    def test_cursors_read_independently(self):
+        other = self.stream.cursor()
+        self.player.action_log.append("a1")
+        self.assertEqual(self.actions(), ["a1"])
+        self.assertEqual([event.action for event in other.read()], ["a1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
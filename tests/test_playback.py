@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+
+from playback import PlaybackScheduler
+
+# Long enough that a wait only ends early because something released it
+LONG_DELAY = 5.0
+JOIN_TIMEOUT = 2.0
+
+
+class PlaybackSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = PlaybackScheduler(speed=1.0)
+        self.run = self.scheduler.reset()
+
+    def wait_in_thread(self, delay, run):
+        """Start a wait() on another thread, returning (thread, results)"""
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.scheduler.wait(delay, run)), daemon=True)
+        thread.start()
+        return thread, results
+
+    def finish(self, thread):
+        thread.join(JOIN_TIMEOUT)
+        self.assertFalse(thread.is_alive(), "wait() was not released")
+
+    def test_unlimited_speed_does_not_wait(self):
+        self.scheduler.set_speed(None)
+        start = time.monotonic()
+        self.assertTrue(self.scheduler.wait(LONG_DELAY, self.run))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_reset_releases_the_old_run(self):
+        thread, results = self.wait_in_thread(LONG_DELAY, self.run)
+        new_run = self.scheduler.reset()
+        self.finish(thread)
+        self.assertEqual(results, [False])
+        self.assertNotEqual(new_run, self.run)
+        self.assertFalse(self.scheduler.running(self.run))
+        self.assertTrue(self.scheduler.running(new_run))
+        self.assertFalse(self.scheduler.wait(0, self.run))
+
+    def test_stop_releases_every_wait(self):
+        thread, results = self.wait_in_thread(LONG_DELAY, self.run)
+        self.scheduler.stop()
+        self.finish(thread)
+        self.assertEqual(results, [False])
+        self.assertFalse(self.scheduler.running())
+        self.assertTrue(self.scheduler.running(self.scheduler.reset()))
+
+    def test_pause_holds_waits_until_a_step(self):
+        self.scheduler.set_speed(None)
+        self.assertTrue(self.scheduler.toggle_pause())
+        self.assertTrue(self.scheduler.paused)
+        thread, results = self.wait_in_thread(0, self.run)
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive(), "a paused wait() went through without a step")
+
+        self.scheduler.step()
+        self.finish(thread)
+        self.assertEqual(results, [True])
+
+        # One step lets exactly one wait through
+        thread, results = self.wait_in_thread(0, self.run)
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+        self.assertFalse(self.scheduler.toggle_pause())
+        self.finish(thread)
+        self.assertEqual(results, [True])
+
+    def test_speed_change_wakes_a_waiting_thread(self):
+        thread, results = self.wait_in_thread(LONG_DELAY, self.run)
+        self.scheduler.set_speed(None)
+        self.finish(thread)
+        self.assertEqual(results, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
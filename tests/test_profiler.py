@@ -0,0 +1,21 @@
+import unittest
+
+from profiler import parse_turn_range
+
+
+class ParseTurnRangeTest(unittest.TestCase):
+    def test_single_turn(self):
+        self.assertEqual(parse_turn_range("5"), (5, 5))
+
+    def test_range_is_inclusive(self):
+        self.assertEqual(parse_turn_range(" 5-20 "), (5, 20))
+        self.assertEqual(parse_turn_range("1-1"), (1, 1))
+
+    def test_invalid_ranges_raise(self):
+        for text in ("0", "0-3", "7-3", "", "a-b", "-3"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_turn_range(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from recorder import MatchRecorder, player_state
+from replay import MatchReplay
+
+TURNS = 37
+
+
+def fake_player(name, rng):
+    deck = [{'name': f"{name} card {index}", 'hp': rng.randrange(30, 130, 10)} for index in range(30)]
+    return SimpleNamespace(name=name, active_pokemon=deck.pop(), bench=[], hand=[deck.pop() for _ in range(5)],
+                           deck=deck, discard_pile=[], prize_cards=[deck.pop() for _ in range(3)])
+
+
+def play_fake_turn(turn, player, opponent, rng):
+    """Move cards around the way a turn of the engine would, leaving some turns untouched"""
+    if turn % 6 == 5:
+        return ["pass"]
+    actions = []
+    if player.deck:
+        player.hand.append(player.deck.pop())
+        actions.append("draw")
+    if player.hand and len(player.bench) < 5 and rng.random() < 0.5:
+        player.bench.append(player.hand.pop(rng.randrange(len(player.hand))))
+        actions.append("bench")
+    target = opponent.active_pokemon
+    if target is not None:
+        target['max_hp'] = target.get('max_hp', target['hp'])
+        target['hp'] -= rng.randrange(10, 60, 10)
+        actions.append("attack")
+        if target['hp'] <= 0:
+            opponent.discard_pile.append(target)
+            opponent.active_pokemon = opponent.bench.pop(0) if opponent.bench else None
+            if player.prize_cards:
+                player.hand.append(player.prize_cards.pop())
+    return actions
+
+
+class RecordingSeekTest(unittest.TestCase):
+    def test_every_turn_seeks_to_the_state_it_was_recorded_with(self):
+        rng = random.Random(7)
+        player1, player2 = fake_player("p1", rng), fake_player("p2", rng)
+        with tempfile.TemporaryDirectory() as folder:
+            recorder = MatchRecorder(folder=folder, keyframe_interval=4)
+            recorder.start_match(7, player1, player2)
+            expected = [[player_state(player1), player_state(player2)]]
+            for turn in range(TURNS):
+                player, opponent = (player1, player2) if turn % 2 == 0 else (player2, player1)
+                actions = play_fake_turn(turn, player, opponent, rng)
+                recorder.record_turn(turn, player, actions, player1, player2)
+                expected.append([player_state(player1), player_state(player2)])
+            recorder.end_match("p1", TURNS)
+
+            replay = MatchReplay(recorder.path)
+            self.assertEqual(replay.turn_count, TURNS)
+            self.assertEqual(replay.result["winner"], "p1")
+            self.assertEqual(replay.keyframes, list(range(0, TURNS + 1, 4)))
+            for turn, states in enumerate(expected):
+                self.assertEqual(replay.state_at(turn)[0], states, f"turn {turn}")
+            # Seeking backwards after reading ahead, and past either end, stays exact
+            self.assertEqual(replay.state_at(3)[0], expected[3])
+            self.assertEqual(replay.state_at(TURNS + 10)[0], expected[-1])
+            self.assertEqual(replay.state_at(-1)[0], expected[0])
+
+    def test_replay_players_show_the_recorded_board(self):
+        rng = random.Random(3)
+        player1, player2 = fake_player("p1", rng), fake_player("p2", rng)
+        with tempfile.TemporaryDirectory() as folder:
+            recorder = MatchRecorder(folder=folder)
+            recorder.start_match(3, player1, player2)
+            play_fake_turn(0, player1, player2, rng)
+            recorder.record_turn(0, player1, ["attack"], player1, player2)
+            recorder.end_match(None, 1)
+
+            shown1, shown2, record = MatchReplay(recorder.path).players_at(1)
+            self.assertEqual(record["a"], ["attack"])
+            for shown, player in ((shown1, player1), (shown2, player2)):
+                self.assertEqual(player_state(shown), player_state(player))
+
+
+if __name__ == "__main__":
+    unittest.main()
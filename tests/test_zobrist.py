@@ -0,0 +1,95 @@
+import unittest
+from types import SimpleNamespace
+
+from zobrist import TranspositionTable, ZobristHasher
+
+
+def fake_game():
+    def player(name):
+        return SimpleNamespace(active_pokemon={'name': f"{name} active", 'hp': 100}, bench=[{'name': "Eevee", 'hp': 50}],
+                               hand=[{'name': "Potion"}], deck=[{'name': "Potion"}] * 10, prize_cards=[], discard_pile=[])
+    return SimpleNamespace(turn=0, players=[player("p1"), player("p2")])
+
+
+class ZobristHasherTest(unittest.TestCase):
+    def setUp(self):
+        self.game = fake_game()
+        self.hasher = ZobristHasher()
+        self.hasher.reset(self.game)
+
+    def assert_matches_full_rehash(self):
+        value = self.hasher.update(self.game)
+        self.assertEqual(value, ZobristHasher().reset(self.game))
+        return value
+
+    def test_update_matches_a_full_rehash(self):
+        start = self.hasher.hash
+        player = self.game.players[0]
+        player.active_pokemon['hp'] -= 30
+        self.assertNotEqual(self.assert_matches_full_rehash(), start)
+        player.hand.append(player.deck.pop())
+        self.assert_matches_full_rehash()
+        player.discard_pile.append(player.active_pokemon)
+        player.active_pokemon = player.bench.pop()
+        self.game.turn += 1
+        self.assert_matches_full_rehash()
+
+    def test_undoing_a_change_restores_the_hash(self):
+        start = self.hasher.hash
+        self.game.players[1].bench.append({'name': "Eevee", 'hp': 50})
+        self.game.turn += 1
+        self.assertNotEqual(self.hasher.update(self.game), start)
+        self.game.players[1].bench.pop()
+        self.game.turn += 1
+        self.assertEqual(self.hasher.update(self.game), start)
+
+    def test_identical_copies_do_not_cancel_out(self):
+        start = self.hasher.hash
+        bench = self.game.players[0].bench
+        bench.extend([dict(bench[0]), dict(bench[0])])
+        self.assertNotEqual(self.hasher.update(self.game), start)
+
+
+class TranspositionTableTest(unittest.TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(size_log2=4)
+        self.table.new_search()
+        self.key = 0x1234
+        # Same slot, different position
+        self.other = self.key + (1 << 20)
+        self.table.store(self.key, visits=10, value=5.0, depth=2)
+
+    def test_probe_checks_the_full_key(self):
+        self.assertEqual(self.table.probe(self.key).visits, 10)
+        self.assertIsNone(self.table.probe(self.other))
+
+    def test_same_position_is_always_updated(self):
+        self.table.store(self.key, visits=3, value=1.0, depth=5)
+        self.assertEqual(self.table.probe(self.key).visits, 3)
+
+    def test_weaker_entry_from_the_same_search_is_kept_out(self):
+        self.table.store(self.other, visits=5, value=1.0, depth=3)
+        self.assertIsNone(self.table.probe(self.other))
+        self.assertEqual(self.table.probe(self.key).visits, 10)
+
+    def test_more_visits_or_a_shallower_depth_replaces(self):
+        self.table.store(self.other, visits=10, value=1.0, depth=3)
+        self.assertEqual(self.table.probe(self.other).visits, 10)
+        self.table.store(self.key, visits=1, value=1.0, depth=1)
+        self.assertEqual(self.table.probe(self.key).depth, 1)
+
+    def test_entry_from_an_older_search_is_replaced(self):
+        self.table.new_search()
+        self.table.store(self.other, visits=1, value=1.0, depth=9)
+        entry = self.table.probe(self.other)
+        self.assertEqual(entry.generation, self.table.generation)
+        self.assertIsNone(self.table.probe(self.key))
+
+    def test_clear_forgets_everything(self):
+        self.table.clear()
+        self.assertIsNone(self.table.probe(self.key))
+        self.assertEqual(self.table.generation, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import argparse
+import multiprocessing
+import os
+import time
+from collections import Counter, namedtuple
+
+from battle import MAX_TURNS, PLAYER_NAMES, new_seed, run_match
+
+# Compact per-match record sent back from the workers
+MatchResult = namedtuple("MatchResult", ["match", "seed", "winner", "turns"])
+
+
+def play_seeded_match(job):
+    """Worker entry point: play one match from its own seed"""
+    match, seed, max_turns = job
+    winner, turns = run_match(max_turns=max_turns, seed=seed)
+    return MatchResult(match, seed, winner, turns)
+
+
+def print_standings(wins, played, elapsed):
+    rates = ", ".join(f"{name} {wins[name] / played:.1%}" for name in PLAYER_NAMES)
+    print(f"[{played} matches, {played / elapsed:.1f}/s] {rates}")
+
+
+def run_tournament(num_matches, workers=None, base_seed=None, max_turns=MAX_TURNS, report_every=100):
+    """Spread num_matches over a process pool, reporting win rates as results arrive"""
+    workers = workers or os.cpu_count() or 1
+    if base_seed is None:
+        base_seed = new_seed()
+    jobs = ((match, (base_seed + match) % 2 ** 32, max_turns) for match in range(num_matches))
+    chunksize = max(1, min(64, num_matches // (workers * 8)))
+
+    print(f"Running {num_matches} matches on {workers} workers (base seed {base_seed})")
+    wins = Counter()
+    results = []
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.imap_unordered(play_seeded_match, jobs, chunksize=chunksize):
+            results.append(result)
+            wins[result.winner] += 1
+            if report_every and len(results) % report_every == 0:
+                print_standings(wins, len(results), time.perf_counter() - start)
+
+    elapsed = time.perf_counter() - start
+    if results:
+        print_standings(wins, len(results), elapsed)
+    results.sort(key=lambda result: result.match)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Pokémon TCG AI tournament across all CPU cores")
+    parser.add_argument("-n", "--matches", type=int, default=1000, help="number of matches to play")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None, help="base seed, match i uses seed + i")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="turn limit per match")
+    parser.add_argument("--report-every", type=int, default=100, help="print standings every N results")
+    args = parser.parse_args(argv)
+    run_tournament(args.matches, args.workers, args.seed, args.max_turns, args.report_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import hashlib
+
+from card_registry import REGISTRY
+
+ZOBRIST_SEED = 0x5EED
+MASK = (1 << 64) - 1
+# Zones that make two positions the same; deck order is hidden so only its size counts
+HASHED_ZONES = ("active", "bench", "hand", "prize_cards", "discard_pile")
+
+
+def zone_contents(player, zone):
+    """The cards in one of a Player's zones, as a tuple"""
+    if zone == "active":
+        return (player.active_pokemon,) if player.active_pokemon else ()
+    return tuple(getattr(player, zone))
+
+
+class ZobristHasher:
+    """Zobrist-style hash of a Game position, kept up to date zone by zone
+
+    Each (player, zone, card, hp), deck size and the side to move gets a random
+    64-bit key. Keys are combined by addition mod 2**64 rather than XOR, so two
+    identical copies of a card do not cancel out. update() only rehashes zones
+    whose contents changed since the last call: a zone still holding the same card
+    objects with the same HP is skipped without looking any card up in the registry.
+    """
+
+    def __init__(self, seed=ZOBRIST_SEED):
+        self.seed = seed
+        self._keys = {}
+        self._turn_key = self.random_key(("turn",))
+        self._deck_keys = {}
+        self._zones = {}
+        self._zone_hashes = {}
+        self._parity = 0
+        self.hash = 0
+
+    def random_key(self, index):
+        """Key derived from the index itself, so every hasher and process agrees on it"""
+        digest = hashlib.blake2b(repr((self.seed,) + index).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def key(self, player_index, zone, card_id, hp):
+        index = (player_index, zone, card_id, hp)
+        key = self._keys.get(index)
+        if key is None:
+            key = self._keys[index] = self.random_key(index)
+        return key
+
+    def deck_key(self, player_index, size):
+        index = (player_index, size)
+        key = self._deck_keys.get(index)
+        if key is None:
+            key = self._deck_keys[index] = self.random_key(("deck",) + index)
+        return key
+
+    def zone_hash(self, player_index, zone, cards):
+        total = 0
+        for card_id, hp in cards:
+            total += self.key(player_index, zone, card_id, hp)
+        return total & MASK
+
+    def reset(self, game):
+        """Hash game from scratch"""
+        self._zones.clear()
+        self._zone_hashes.clear()
+        self._parity = 0
+        self.hash = 0
+        return self.update(game)
+
+    def update(self, game):
+        """Bring the hash in line with game, rehashing only the zones that changed"""
+        value = self.hash
+        for player_index, player in enumerate(game.players):
+            for zone in HASHED_ZONES:
+                cards = zone_contents(player, zone)
+                hp = tuple(card.get('hp') for card in cards)
+                index = (player_index, zone)
+                # Tuple comparison checks identity first, so an untouched zone costs no dict compares
+                seen = self._zones.get(index)
+                if seen is not None and seen[1] == hp and seen[0] == cards:
+                    continue
+                new_hash = self.zone_hash(player_index, zone, zip(map(REGISTRY.id_of, cards), hp))
+                value = (value - self._zone_hashes.get(index, 0) + new_hash) & MASK
+                self._zones[index] = (cards, hp)
+                self._zone_hashes[index] = new_hash
+
+            index = (player_index, "deck")
+            deck_hash = self.deck_key(player_index, len(player.deck))
+            if self._zone_hashes.get(index) != deck_hash:
+                value = (value - self._zone_hashes.get(index, 0) + deck_hash) & MASK
+                self._zone_hashes[index] = deck_hash
+
+        parity = game.turn % 2
+        if parity != self._parity:
+            value = (value + self._turn_key if parity else value - self._turn_key) & MASK
+            self._parity = parity
+        self.hash = value
+        return value
+
+
+class TTEntry:
+    __slots__ = ("key", "visits", "value", "depth", "generation")
+
+    def __init__(self, key, visits, value, depth, generation):
+        self.key = key
+        self.visits = visits
+        self.value = value  # summed score from player 0's point of view
+        self.depth = depth
+        self.generation = generation
+
+
+class TranspositionTable:
+    """Fixed-size table of search statistics keyed by position hash
+
+    A slot is overwritten when it belongs to an older search, or when the new entry
+    has at least as many visits or sits closer to the root than the current one.
+    """
+
+    def __init__(self, size_log2=16):
+        self.mask = (1 << size_log2) - 1
+        self.entries = [None] * (1 << size_log2)
+        self.generation = 0
+
+    def clear(self):
+        """Forget every entry, so a new match is searched the same way however many came before"""
+        self.entries = [None] * len(self.entries)
+        self.generation = 0
+
+    def new_search(self):
+        self.generation += 1
+
+    def probe(self, key):
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry.key == key:
+            return entry
+        return None
+
+    def store(self, key, visits, value, depth):
+        slot = key & self.mask
+        entry = self.entries[slot]
+        if entry is None:
+            self.entries[slot] = TTEntry(key, visits, value, depth, self.generation)
+        elif entry.key == key or entry.generation != self.generation \
+                or visits >= entry.visits or depth < entry.depth:
+            entry.key = key
+            entry.visits = visits
+            entry.value = value
+            entry.depth = depth
+            entry.generation = self.generation